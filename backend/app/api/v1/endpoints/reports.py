@@ -789,7 +789,7 @@ async def get_export_formats(
     try:
         formats = []
         for format_type in ExportFormat:
-            info = await export_service.get_export_info(format_type.value)
+            info = export_service.get_export_info(format_type.value)
             formats.append(info)
         
         return {"formats": formats}
@@ -61,6 +61,19 @@ class Settings(BaseSettings):
     tiingo_api_key: Optional[str] = None
     yahoo_finance_enabled: bool = True
     
+    # Client-side request pacing per provider (requests/second, burst size)
+    fmp_rate_per_sec: float = 4.0
+    fmp_burst: int = 10
+    alpha_vantage_rate_per_sec: float = 5 / 60
+    alpha_vantage_burst: int = 5
+    tiingo_rate_per_sec: float = 16.0
+    tiingo_burst: int = 20
+    # Race the top two providers for quotes, history and profiles instead of
+    # waiting on each in turn
+    aggressive_fallback: bool = True
+    # Most per-symbol quote lookups a multi-quote request runs at once
+    max_concurrent_quotes: int = 20
+    
     # Monitoring
     sentry_dsn: Optional[str] = None
     prometheus_enabled: bool = True
@@ -24,6 +24,9 @@ from app.api.v1.api import api_router
 from app.utils.logging import setup_logging
 from app.utils.redis_client import redis_manager
 from app.services.websocket_service import websocket_service
+from app.api.v1.endpoints.analytics import economic_engine
+from app.services.export_service import shutdown_export_pool
+from app.services.market_data_service import market_data_service
 
 
 # Prometheus metrics
@@ -135,6 +138,18 @@ async def lifespan(app: FastAPI):
     await websocket_service.stop()
     logger.info("WebSocket service stopped")
     
+    # Close the economic data HTTP session
+    await economic_engine.aclose()
+    logger.info("Economic data session closed")
+    
+    # Close the market data provider connection pools
+    await market_data_service.aclose()
+    logger.info("Market data clients closed")
+    
+    # Stop the export rendering workers
+    shutdown_export_pool()
+    logger.info("Export process pool shut down")
+    
     # Close Redis connection
     await redis_manager.close()
     logger.info("Redis connection closed")
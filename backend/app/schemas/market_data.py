@@ -199,7 +199,7 @@ class MarketMoverBase(BaseModel):
     """Base market mover schema."""
     symbol: str = Field(..., min_length=1, max_length=20)
     name: Optional[str] = Field(None, max_length=200)
-    mover_type: str = Field(..., regex="^(gainer|loser|active)$")
+    mover_type: str = Field(..., pattern="^(gainer|loser|active)$")
     price: Decimal = Field(..., gt=0)
     change: Decimal
     change_percent: Decimal
@@ -236,7 +236,7 @@ class StockNewsBase(BaseModel):
     author: Optional[str] = Field(None, max_length=200)
     published_at: datetime
     sentiment_score: Optional[Decimal] = Field(None, ge=-1, le=1)
-    sentiment_label: Optional[str] = Field(None, regex="^(positive|negative|neutral)$")
+    sentiment_label: Optional[str] = Field(None, pattern="^(positive|negative|neutral)$")
     confidence: Optional[Decimal] = Field(None, ge=0, le=1)
     views: int = Field(default=0, ge=0)
     shares: int = Field(default=0, ge=0)
@@ -268,7 +268,7 @@ class MarketSentimentBase(BaseModel):
     declining_stocks: Optional[int] = Field(None, ge=0)
     unchanged_stocks: Optional[int] = Field(None, ge=0)
     overall_sentiment: Optional[Decimal] = Field(None, ge=-1, le=1)
-    sentiment_label: Optional[str] = Field(None, regex="^(bullish|bearish|neutral)$")
+    sentiment_label: Optional[str] = Field(None, pattern="^(bullish|bearish|neutral)$")
     data_source: str = Field(..., max_length=50)
 
 
@@ -367,8 +367,8 @@ class StockSearchResponse(BaseModel):
 class HistoricalDataRequest(BaseModel):
     """Historical data request schema."""
     symbol: str = Field(..., min_length=1, max_length=20)
-    period: str = Field(default="1y", regex="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$")
-    interval: str = Field(default="1d", regex="^(1m|2m|5m|15m|30m|60m|90m|1h|1d|5d|1wk|1mo|3mo)$")
+    period: str = Field(default="1y", pattern="^(1d|5d|1mo|3mo|6mo|1y|2y|5y|10y|ytd|max)$")
+    interval: str = Field(default="1d", pattern="^(1m|2m|5m|15m|30m|60m|90m|1h|1d|5d|1wk|1mo|3mo)$")
     
     @validator('interval')
     def validate_interval_period(cls, v, values):
@@ -398,14 +398,14 @@ class HistoricalDataResponse(BaseModel):
 
 class WebSocketMessage(BaseModel):
     """WebSocket message schema."""
-    type: str = Field(..., regex="^(market_update|quote_update|sector_update|sentiment_update|error)$")
+    type: str = Field(..., pattern="^(market_update|quote_update|sector_update|sentiment_update|error)$")
     data: Dict[str, Any]
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
 class WebSocketSubscription(BaseModel):
     """WebSocket subscription schema."""
-    type: str = Field(..., regex="^(market_data|stock_quotes|sector_data|sentiment_data)$")
+    type: str = Field(..., pattern="^(market_data|stock_quotes|sector_data|sentiment_data)$")
     symbols: Optional[List[str]] = None
     channels: Optional[List[str]] = None
 
@@ -69,6 +69,14 @@ celery_app.conf.update(
 )
 
 
+def _close_loop(loop: asyncio.AbstractEventLoop):
+    """Close a task's event loop, first closing the market data connections opened on it."""
+    try:
+        loop.run_until_complete(market_data_service.close_connections())
+    finally:
+        loop.close()
+
+
 @celery_app.task(bind=True, max_retries=3)
 def update_market_data(self):
     """Update market data including indices, sectors, and movers."""
@@ -102,7 +110,7 @@ def update_market_data(self):
             return {"status": "success", "updated": ["indices", "sectors", "movers"]}
         
         finally:
-            loop.close()
+            _close_loop(loop)
     
     except Exception as e:
         logger.error(f"Market data update task failed: {e}")
@@ -153,7 +161,7 @@ def update_stock_quotes(self, symbols: Optional[List[str]] = None):
             return {"status": "success", "updated_quotes": updated_quotes}
         
         finally:
-            loop.close()
+            _close_loop(loop)
     
     except Exception as e:
         logger.error(f"Stock quotes update task failed: {e}")
@@ -179,7 +187,7 @@ def update_market_indices(self):
             return {"status": "success", "indices_count": len(indices) if indices else 0}
         
         finally:
-            loop.close()
+            _close_loop(loop)
     
     except Exception as e:
         logger.error(f"Market indices update task failed: {e}")
@@ -205,7 +213,7 @@ def update_market_sentiment(self):
             return {"status": "success", "sentiment": sentiment}
         
         finally:
-            loop.close()
+            _close_loop(loop)
     
     except Exception as e:
         logger.error(f"Market sentiment update task failed: {e}")
@@ -233,7 +241,7 @@ def warm_cache(self, symbols: Optional[List[str]] = None):
             return {"status": "success", "warmed_symbols": len(symbols)}
         
         finally:
-            loop.close()
+            _close_loop(loop)
     
     except Exception as e:
         logger.error(f"Cache warming task failed: {e}")
@@ -256,7 +264,7 @@ def cleanup_old_data(self):
             return {"status": "success", "cleaned": "expired_cache_entries"}
         
         finally:
-            loop.close()
+            _close_loop(loop)
     
     except Exception as e:
         logger.error(f"Data cleanup task failed: {e}")
@@ -285,7 +293,7 @@ def update_stock_historical_data(self, symbol: str, period: str = "1y", interval
             return {"status": "success", "symbol": symbol, "data_points": len(historical_data) if historical_data else 0}
         
         finally:
-            loop.close()
+            _close_loop(loop)
     
     except Exception as e:
         logger.error(f"Historical data update for {symbol} failed: {e}")
@@ -319,7 +327,7 @@ def update_company_profiles(self, symbols: List[str]):
             return {"status": "success", "updated_profiles": updated_profiles}
         
         finally:
-            loop.close()
+            _close_loop(loop)
     
     except Exception as e:
         logger.error(f"Company profiles update task failed: {e}")
@@ -363,7 +371,7 @@ def process_market_data_batch(self, data_batch: List[Dict[str, Any]]):
             return {"status": "success", "processed_count": processed_count}
         
         finally:
-            loop.close()
+            _close_loop(loop)
     
     except Exception as e:
         logger.error(f"Market data batch processing failed: {e}")
@@ -11,7 +11,8 @@ import json
 import logging
 import base64
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union, Tuple
 import uuid
 
 import pandas as pd
@@ -60,6 +61,57 @@ class ChartTheme:
     COLORFUL = "colorful"
 
 
+def _readonly(values: np.ndarray) -> np.ndarray:
+    """Mark a shared module-level array as immutable"""
+    values.flags.writeable = False
+    return values
+
+
+# Pre-typed fallback sample data, so empty renders skip pandas dtype inference
+_SAMPLE_INDEX = _readonly(np.arange(10, dtype=np.int64))
+_SAMPLE_BAR_DTYPE = pd.CategoricalDtype(['A', 'B', 'C', 'D', 'E'])
+_SAMPLE_BAR_LABELS = _readonly(np.array(['A', 'B', 'C', 'D', 'E'], dtype=object))
+_SAMPLE_BAR_VALUES = _readonly(np.array([20, 14, 23, 25, 22], dtype=np.int64))
+_SAMPLE_PIE_LABELS = _readonly(np.array(['A', 'B', 'C', 'D'], dtype=object))
+_SAMPLE_PIE_VALUES = _readonly(np.array([30, 25, 20, 25], dtype=np.int64))
+
+
+# Plotly templates per theme, resolved once and passed to each figure so
+# no request mutates the process-wide pio.templates.default
+_PLOTLY_TEMPLATES: Dict[str, go.layout.Template] = {
+    ChartTheme.LIGHT: pio.templates["plotly_white"],
+    ChartTheme.DARK: pio.templates["plotly_dark"],
+    ChartTheme.MINIMAL: pio.templates["plotly_white"],
+    ChartTheme.PROFESSIONAL: pio.templates["plotly_white"],
+    ChartTheme.COLORFUL: pio.templates["plotly_white"]
+}
+
+# Static capabilities payload, built once and shared read-only across requests
+_CAPABILITIES: Mapping[str, Any] = MappingProxyType({
+    "supported_formats": ("plotly", "matplotlib"),
+    "supported_types": (
+        ChartType.LINE, ChartType.BAR, ChartType.PIE, ChartType.SCATTER,
+        ChartType.AREA, ChartType.CANDLESTICK, ChartType.HEATMAP,
+        ChartType.HISTOGRAM, ChartType.BOX, ChartType.VIOLIN,
+        ChartType.WATERFALL, ChartType.TREEMAP, ChartType.SANKEY,
+        ChartType.GAUGE, ChartType.INDICATOR
+    ),
+    "supported_themes": (
+        ChartTheme.LIGHT, ChartTheme.DARK, ChartTheme.MINIMAL,
+        ChartTheme.PROFESSIONAL, ChartTheme.COLORFUL
+    ),
+    "features": (
+        "interactive_charts", "static_charts", "custom_styling",
+        "multiple_data_sources", "responsive_design", "export_capabilities"
+    )
+})
+
+
+# Matplotlib styles are process-wide, so the theme last applied is tracked at
+# module level (shared by every service instance) to skip redundant re-applies
+_matplotlib_theme: Optional[str] = None
+
+
 class ChartGenerationService:
     """Service for generating charts and visualizations"""
     
@@ -67,11 +119,8 @@ class ChartGenerationService:
         self.cache_service = CacheService()
         
         # Set up matplotlib style
-        plt.style.use('seaborn-v0_8')
+        self._apply_matplotlib_theme(ChartTheme.LIGHT)
         sns.set_palette("husl")
-        
-        # Configure plotly
-        pio.templates.default = "plotly_white"
     
     async def generate_chart(
         self, 
@@ -108,8 +157,8 @@ class ChartGenerationService:
             chart_type = chart_config.get("type", ChartType.LINE)
             title = chart_config.get("title", "Chart")
             
-            # Apply theme
-            self._apply_plotly_theme(theme)
+            # Resolve theme template; applied per figure rather than globally
+            template = self._get_plotly_template(theme)
             
             if chart_type == ChartType.LINE:
                 fig = await self._create_line_chart(chart_config, data)
@@ -146,6 +195,7 @@ class ChartGenerationService:
             
             # Update layout
             fig.update_layout(
+                template=template,
                 title=title,
                 title_x=0.5,
                 font=dict(size=12),
@@ -231,14 +281,14 @@ class ChartGenerationService:
             y_column = config.get("y_column", "y")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
-                    x_column: range(10),
+                    x_column: _SAMPLE_INDEX,
                     y_column: np.random.randn(10).cumsum()
-                })
+                }, copy=False)
             
             fig = go.Figure()
             
@@ -276,14 +326,14 @@ class ChartGenerationService:
             y_column = config.get("y_column", "y")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
-                    x_column: ['A', 'B', 'C', 'D', 'E'],
-                    y_column: [20, 14, 23, 25, 22]
-                })
+                    x_column: pd.Categorical(_SAMPLE_BAR_LABELS, dtype=_SAMPLE_BAR_DTYPE),
+                    y_column: _SAMPLE_BAR_VALUES
+                }, copy=False)
             
             fig = go.Figure()
             
@@ -316,14 +366,14 @@ class ChartGenerationService:
             values_column = config.get("values_column", "values")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[labels_column, values_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
-                    labels_column: ['A', 'B', 'C', 'D'],
-                    values_column: [30, 25, 20, 25]
-                })
+                    labels_column: _SAMPLE_PIE_LABELS,
+                    values_column: _SAMPLE_PIE_VALUES
+                }, copy=False)
             
             fig = go.Figure()
             
@@ -353,7 +403,7 @@ class ChartGenerationService:
             color_column = config.get("color_column")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column, size_column, color_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
@@ -406,14 +456,14 @@ class ChartGenerationService:
             y_column = config.get("y_column", "y")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
-                    x_column: range(10),
+                    x_column: _SAMPLE_INDEX,
                     y_column: np.random.randn(10).cumsum()
-                })
+                }, copy=False)
             
             fig = go.Figure()
             
@@ -452,7 +502,7 @@ class ChartGenerationService:
             close_column = config.get("close_column", "close")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[date_column, open_column, high_column, low_column, close_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample OHLC data
@@ -502,7 +552,7 @@ class ChartGenerationService:
             z_column = config.get("z_column", "z")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column, z_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample heatmap data
@@ -545,13 +595,13 @@ class ChartGenerationService:
             column = config.get("column", "values")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
                     column: np.random.randn(1000)
-                })
+                }, copy=False)
             
             fig = go.Figure()
             
@@ -584,7 +634,7 @@ class ChartGenerationService:
             y_column = config.get("y_column", "values")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
@@ -630,7 +680,7 @@ class ChartGenerationService:
             y_column = config.get("y_column", "values")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
@@ -678,7 +728,7 @@ class ChartGenerationService:
             y_column = config.get("y_column", "value")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample waterfall data
@@ -716,7 +766,7 @@ class ChartGenerationService:
             parents_column = config.get("parents_column", "parents")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[labels_column, values_column, parents_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample treemap data
@@ -751,7 +801,7 @@ class ChartGenerationService:
             value_column = config.get("value_column", "value")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[source_column, target_column, value_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample Sankey data
@@ -791,7 +841,7 @@ class ChartGenerationService:
             value_column = config.get("value_column", "value")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[value_column])
             
             if not chart_data or chart_data.empty:
                 value = 75
@@ -835,7 +885,7 @@ class ChartGenerationService:
             value_column = config.get("value_column", "value")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[value_column])
             
             if not chart_data or chart_data.empty:
                 value = 75
@@ -868,14 +918,14 @@ class ChartGenerationService:
             y_column = config.get("y_column", "y")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
-                    x_column: range(10),
+                    x_column: _SAMPLE_INDEX,
                     y_column: np.random.randn(10).cumsum()
-                })
+                }, copy=False)
             
             ax.plot(chart_data[x_column], chart_data[y_column], 
                    marker='o', linewidth=2, markersize=6)
@@ -894,14 +944,14 @@ class ChartGenerationService:
             y_column = config.get("y_column", "y")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
-                    x_column: ['A', 'B', 'C', 'D', 'E'],
-                    y_column: [20, 14, 23, 25, 22]
-                })
+                    x_column: pd.Categorical(_SAMPLE_BAR_LABELS, dtype=_SAMPLE_BAR_DTYPE),
+                    y_column: _SAMPLE_BAR_VALUES
+                }, copy=False)
             
             ax.bar(chart_data[x_column], chart_data[y_column])
             ax.set_xlabel(config.get("x_title", x_column))
@@ -919,17 +969,22 @@ class ChartGenerationService:
             values_column = config.get("values_column", "values")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[labels_column, values_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
-                    labels_column: ['A', 'B', 'C', 'D'],
-                    values_column: [30, 25, 20, 25]
-                })
+                    labels_column: _SAMPLE_PIE_LABELS,
+                    values_column: _SAMPLE_PIE_VALUES
+                }, copy=False)
             
-            ax.pie(chart_data[values_column], labels=chart_data[labels_column], 
-                  autopct='%1.1f%%', startangle=90)
+            # Precompute percentage labels instead of a per-wedge autopct callback
+            values = chart_data[values_column].to_numpy(dtype=float)
+            labels = chart_data[labels_column].to_numpy()
+            percentages = values * (100.0 / values.sum())
+            wedge_labels = [f"{label}\n{pct:.1f}%" for label, pct in zip(labels, percentages)]
+            
+            ax.pie(values, labels=wedge_labels, startangle=90)
             
         except Exception as e:
             logger.error(f"Matplotlib pie chart creation failed: {str(e)}")
@@ -943,14 +998,14 @@ class ChartGenerationService:
             y_column = config.get("y_column", "y")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
                     x_column: np.random.randn(50),
                     y_column: np.random.randn(50)
-                })
+                }, copy=False)
             
             ax.scatter(chart_data[x_column], chart_data[y_column], s=50, alpha=0.6)
             ax.set_xlabel(config.get("x_title", x_column))
@@ -968,14 +1023,14 @@ class ChartGenerationService:
             y_column = config.get("y_column", "y")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[x_column, y_column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
-                    x_column: range(10),
+                    x_column: _SAMPLE_INDEX,
                     y_column: np.random.randn(10).cumsum()
-                })
+                }, copy=False)
             
             ax.fill_between(chart_data[x_column], chart_data[y_column], alpha=0.3)
             ax.plot(chart_data[x_column], chart_data[y_column], linewidth=2)
@@ -993,13 +1048,13 @@ class ChartGenerationService:
             column = config.get("column", "values")
             
             # Extract data
-            chart_data = self._extract_data(data, data_source)
+            chart_data = self._extract_data(data, data_source, columns=[column])
             
             if not chart_data or chart_data.empty:
                 # Create sample data
                 chart_data = pd.DataFrame({
                     column: np.random.randn(1000)
-                })
+                }, copy=False)
             
             ax.hist(chart_data[column], bins=config.get("bins", 30), alpha=0.7, edgecolor='black')
             ax.set_xlabel(config.get("x_title", column))
@@ -1010,8 +1065,13 @@ class ChartGenerationService:
             raise
     
     # Utility methods
-    def _extract_data(self, data: Dict[str, Any], data_source: str) -> pd.DataFrame:
-        """Extract data from data source"""
+    def _extract_data(
+        self, 
+        data: Dict[str, Any], 
+        data_source: str,
+        columns: Optional[Iterable[Optional[str]]] = None
+    ) -> pd.DataFrame:
+        """Extract data from data source, optionally projecting to the given columns"""
         try:
             if not data_source:
                 return pd.DataFrame()
@@ -1026,13 +1086,20 @@ class ChartGenerationService:
                 else:
                     return pd.DataFrame()
             
+            # Project wide records down to the requested keys before pandas sees them
+            projection = [column for column in columns if column] if columns is not None else None
+            
             # Convert to DataFrame if it's a list of dictionaries
             if isinstance(current_data, list):
                 if current_data and isinstance(current_data[0], dict):
+                    if projection is not None:
+                        return self._records_to_columns(current_data, projection)
                     return pd.DataFrame(current_data)
                 else:
                     return pd.DataFrame({"values": current_data})
             elif isinstance(current_data, dict):
+                if projection is not None:
+                    current_data = {key: current_data[key] for key in projection if key in current_data}
                 return pd.DataFrame([current_data])
             else:
                 return pd.DataFrame()
@@ -1041,23 +1108,29 @@ class ChartGenerationService:
             logger.error(f"Data extraction failed: {str(e)}")
             return pd.DataFrame()
     
-    def _apply_plotly_theme(self, theme: str):
-        """Apply theme to Plotly"""
-        try:
-            if theme == ChartTheme.DARK:
-                pio.templates.default = "plotly_dark"
-            elif theme == ChartTheme.MINIMAL:
-                pio.templates.default = "plotly_white"
-            elif theme == ChartTheme.PROFESSIONAL:
-                pio.templates.default = "plotly_white"
-            else:
-                pio.templates.default = "plotly_white"
-                
-        except Exception as e:
-            logger.error(f"Theme application failed: {str(e)}")
+    def _records_to_columns(self, records: List[Dict[str, Any]], projection: List[str]) -> pd.DataFrame:
+        """Build a DataFrame column-wise from records, reading only the projected keys"""
+        columns: Dict[str, List[Any]] = {key: [] for key in projection}
+        present = set()
+        for row in records:
+            for key in projection:
+                if key in row:
+                    present.add(key)
+                    columns[key].append(row[key])
+                else:
+                    columns[key].append(None)
+        return pd.DataFrame({key: columns[key] for key in projection if key in present}, copy=False)
+    
+    def _get_plotly_template(self, theme: str) -> go.layout.Template:
+        """Get the Plotly template for a theme without touching global defaults"""
+        return _PLOTLY_TEMPLATES.get(theme, _PLOTLY_TEMPLATES[ChartTheme.LIGHT])
     
     def _apply_matplotlib_theme(self, theme: str):
         """Apply theme to Matplotlib"""
+        global _matplotlib_theme
+        if _matplotlib_theme == theme:
+            return
+        
         try:
             if theme == ChartTheme.DARK:
                 plt.style.use('dark_background')
@@ -1067,6 +1140,8 @@ class ChartGenerationService:
                 plt.style.use('seaborn-v0_8-whitegrid')
             else:
                 plt.style.use('seaborn-v0_8')
+            
+            _matplotlib_theme = theme
                 
         except Exception as e:
             logger.error(f"Theme application failed: {str(e)}")
@@ -1076,7 +1151,19 @@ class ChartGenerationService:
         try:
             charts = []
             
-            for chart_config in dashboard_config.get("charts", []):
+            # Charts without a theme of their own inherit the dashboard's, when it
+            # sets one; otherwise they keep the per-chart default
+            theme = dashboard_config.get("theme")
+            chart_configs = [
+                {"theme": theme, **chart_config} if theme else chart_config
+                for chart_config in dashboard_config.get("charts", [])
+            ]
+            
+            # Apply the dashboard theme once for the whole batch
+            if theme:
+                self._apply_matplotlib_theme(theme)
+            
+            for chart_config in chart_configs:
                 chart = await self.generate_chart(chart_config, data)
                 charts.append(chart)
             
@@ -1086,23 +1173,6 @@ class ChartGenerationService:
             logger.error(f"Dashboard chart generation failed: {str(e)}")
             raise
     
-    async def get_chart_capabilities(self) -> Dict[str, Any]:
+    async def get_chart_capabilities(self) -> Mapping[str, Any]:
         """Get information about chart generation capabilities"""
-        return {
-            "supported_formats": ["plotly", "matplotlib"],
-            "supported_types": [
-                ChartType.LINE, ChartType.BAR, ChartType.PIE, ChartType.SCATTER,
-                ChartType.AREA, ChartType.CANDLESTICK, ChartType.HEATMAP,
-                ChartType.HISTOGRAM, ChartType.BOX, ChartType.VIOLIN,
-                ChartType.WATERFALL, ChartType.TREEMAP, ChartType.SANKEY,
-                ChartType.GAUGE, ChartType.INDICATOR
-            ],
-            "supported_themes": [
-                ChartTheme.LIGHT, ChartTheme.DARK, ChartTheme.MINIMAL,
-                ChartTheme.PROFESSIONAL, ChartTheme.COLORFUL
-            ],
-            "features": [
-                "interactive_charts", "static_charts", "custom_styling",
-                "multiple_data_sources", "responsive_design", "export_capabilities"
-            ]
-        }
+        return _CAPABILITIES
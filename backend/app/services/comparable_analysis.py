@@ -12,19 +12,20 @@ This module provides comprehensive peer company analysis including:
 """
 
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Tuple, Optional, Any, Union
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-import math
-from scipy import stats
+from typing import Dict, List, NamedTuple, Tuple, Optional, Any
+from dataclasses import dataclass, fields
+from datetime import datetime
+from collections import OrderedDict, defaultdict
+import copy
+import hashlib
+import json
+from operator import attrgetter
 import logging
-from decimal import Decimal, ROUND_HALF_UP
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PeerCompany:
     """Peer Company Data Structure"""
     symbol: str
@@ -51,7 +52,7 @@ class PeerCompany:
     market_cap_category: str  # Large, Mid, Small
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValuationMetric:
     """Valuation Metric Statistics"""
     min: float
@@ -64,7 +65,7 @@ class ValuationMetric:
     count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComparableValuation:
     """Comparable Valuation Results"""
     pe_based: float
@@ -78,7 +79,7 @@ class ComparableValuation:
     confidence_score: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PeerRanking:
     """Peer Company Ranking"""
     symbol: str
@@ -91,6 +92,135 @@ class PeerRanking:
     rank: int
 
 
+# Serialized field order and C-level getters for the result types
+_PEER_FIELDS = tuple(f.name for f in fields(PeerCompany))
+_METRIC_FIELDS = tuple(f.name for f in fields(ValuationMetric))
+_VALUATION_FIELDS = tuple(f.name for f in fields(ComparableValuation))
+_RANKING_FIELDS = tuple(f.name for f in fields(PeerRanking))
+_get_peer_fields = attrgetter(*_PEER_FIELDS)
+_get_metric_fields = attrgetter(*_METRIC_FIELDS)
+_get_valuation_fields = attrgetter(*_VALUATION_FIELDS)
+_get_ranking_fields = attrgetter(*_RANKING_FIELDS)
+
+# Raw numeric inputs loaded column-wise from the peer universe
+_NUMERIC_FIELDS = (
+    'market_cap', 'revenue', 'ebitda', 'net_income', 'shares_outstanding', 'price',
+    'total_debt', 'cash', 'book_value', 'total_assets', 'total_equity',
+    'current_assets', 'current_liabilities', 'revenue_growth_rate'
+)
+
+# Categorical inputs used for peer matching
+_MATCH_FIELDS = ('symbol', 'industry', 'sector', 'country', 'exchange')
+
+# Derived ratios computed per universe row
+_RATIO_FIELDS = (
+    'enterprise_value', 'pe', 'pb', 'ps', 'ev_revenue', 'ev_ebitda', 'peg',
+    'roe', 'roa', 'debt_to_equity', 'current_ratio'
+)
+
+# Valid (exclusive) range per valuation multiple; values outside are treated as outliers
+_MULTIPLE_BOUNDS: Dict[str, Tuple[float, float]] = {
+    'pe': (0, 100),
+    'pb': (0, 20),
+    'ps': (0, 50),
+    'ev_revenue': (0, 20),
+    'ev_ebitda': (0, 50)
+}
+
+
+# Quantiles reported for each valuation multiple
+_STAT_QUANTILES = (0, 25, 50, 75, 100)
+
+# Integer codes for market cap categories in the array layout
+_CAP_CATEGORY_CODES = {"Small": 0, "Mid": 1, "Large": 2}
+
+
+@dataclass(slots=True)
+class _PeerArrays:
+    """Structure-of-arrays view of a peer group for vectorized statistics"""
+    pe: np.ndarray
+    pb: np.ndarray
+    ps: np.ndarray
+    ev_revenue: np.ndarray
+    ev_ebitda: np.ndarray
+    roe: np.ndarray
+    roa: np.ndarray
+    debt_to_equity: np.ndarray
+    cap_category: np.ndarray  # int8 codes from _CAP_CATEGORY_CODES
+    
+    @classmethod
+    def from_peers(cls, peers: List[PeerCompany]) -> "_PeerArrays":
+        """Gather each field into a contiguous column in one pass per field"""
+        count = len(peers)
+        columns = {
+            name: np.fromiter((getattr(p, name) for p in peers), dtype=np.float64, count=count)
+            for name in (*_MULTIPLE_BOUNDS, 'roe', 'roa', 'debt_to_equity')
+        }
+        columns['cap_category'] = np.fromiter(
+            (_CAP_CATEGORY_CODES[p.market_cap_category] for p in peers), dtype=np.int8, count=count
+        )
+        return cls(**columns)
+
+
+@dataclass(slots=True)
+class PeerUniverseIndex:
+    """Peer universe pre-extracted into columns, ratios and industry buckets"""
+    universe: List[Dict[str, Any]]
+    columns: Dict[str, np.ndarray]
+    multiples: Dict[str, np.ndarray]
+    industry_rows: Dict[Any, np.ndarray]  # industry -> universe row indices
+    version: Optional[str] = None  # digest of the indexed data, filled in on first cache lookup
+
+
+# Empty row selection for industries absent from the universe
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+
+class _PeerTarget(NamedTuple):
+    """Target company fields used for peer matching, read once per identification"""
+    symbol: Optional[str]
+    industry: Optional[str]
+    sector: Optional[str]
+    country: Optional[str]
+    exchange: Optional[str]
+    market_cap: float
+    
+    @classmethod
+    def from_company(cls, company: Dict[str, Any]) -> "_PeerTarget":
+        return cls(
+            symbol=company.get('symbol'),
+            industry=company.get('industry'),
+            sector=company.get('sector'),
+            country=company.get('country'),
+            exchange=company.get('exchange'),
+            market_cap=company.get('market_cap') or 0
+        )
+
+
+def _guarded_divide(numerator: np.ndarray, denominator: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Divide in place into out, only where the denominator is positive"""
+    return np.divide(numerator, denominator, out=out, where=denominator > 0)
+
+
+def _positive_mean(values: np.ndarray) -> float:
+    """Mean of the strictly positive entries (NaN when there are none)"""
+    positive = values > 0
+    count = np.count_nonzero(positive)
+    return float(values.sum(where=positive) / count) if count else float('nan')
+
+
+def _top_n_indices(scores: np.ndarray, n: int) -> np.ndarray:
+    """Indices of the n highest scores in descending order, ties kept in input order"""
+    if n <= 0 or n >= scores.size:
+        return np.argsort(-scores, kind='stable')[:n]
+    
+    # Relevance scores are whole points, so a sub-point offset by position breaks
+    # ties in input order while allowing an O(N) partial selection
+    keys = scores - np.arange(scores.size) / scores.size
+    top = np.argpartition(-keys, n - 1)[:n]
+    return top[np.argsort(-keys[top])]
+
+
 class PeerIdentificationEngine:
     """Peer Company Identification Engine"""
     
@@ -98,187 +228,211 @@ class PeerIdentificationEngine:
         pass
     
     def identify_peers(self, target_company: Dict[str, Any], universe: List[Dict[str, Any]], 
-                      criteria: Dict[str, Any]) -> List[PeerCompany]:
-        """Identify peer companies based on multiple criteria"""
+                      criteria: Dict[str, Any], 
+                      universe_index: Optional["PeerUniverseIndex"] = None) -> List[PeerCompany]:
+        """Identify peer companies based on multiple criteria
+        
+        Pass a prebuilt ``universe_index`` (see ``build_index``) to reuse the
+        extracted columns and industry buckets across many targets.
+        """
         try:
-            peers = []
-            
-            for company in universe:
-                # Skip the target company itself
-                if company.get('symbol') == target_company.get('symbol'):
-                    continue
-                
-                # Apply filtering criteria
-                if self._meets_criteria(company, target_company, criteria):
-                    peer = self._create_peer_company(company)
-                    if peer:
-                        peers.append(peer)
-            
-            # Sort by relevance score
-            peers.sort(key=lambda x: self._calculate_relevance_score(x, target_company), reverse=True)
-            
-            # Return top N peers
+            if universe_index is None:
+                universe_index = self.build_index(universe)
+            columns = universe_index.columns
+            target = _PeerTarget.from_company(target_company)
+            
+            # Start from the target's industry bucket when an industry match is required
+            require_industry_match = criteria.get('require_industry_match', True)
+            if require_industry_match:
+                rows = universe_index.industry_rows.get(target.industry, _NO_ROWS)
+            else:
+                rows = np.arange(len(universe_index.universe))
+            
+            candidates = rows[self._criteria_mask(columns, rows, target, criteria)]
+            
+            # Rank candidates by relevance score (stable, so ties keep universe order)
+            scores = self._calculate_relevance_scores(columns, candidates, target)
             max_peers = criteria.get('max_peers', 20)
-            return peers[:max_peers]
+            top = candidates[_top_n_indices(scores, max_peers)]
+            
+            # Materialize only the top N peers
+            return [
+                self._create_peer_company(universe_index.universe[i], columns, universe_index.multiples, i)
+                for i in top
+            ]
             
         except Exception as e:
-            logger.error(f"Peer identification failed: {e}")
+            logger.error(f"Peer identification failed for {target_company.get('symbol')}: {e}")
             raise ValueError(f"Peer identification failed: {e}")
     
-    def _meets_criteria(self, company: Dict[str, Any], target: Dict[str, Any], criteria: Dict[str, Any]) -> bool:
-        """Check if company meets peer identification criteria"""
-        try:
-            # Industry/Sector match
-            if criteria.get('require_industry_match', True):
-                if company.get('industry') != target.get('industry'):
-                    return False
-            
-            # Market cap range
-            target_market_cap = target.get('market_cap', 0)
-            company_market_cap = company.get('market_cap', 0)
-            
-            if target_market_cap > 0 and company_market_cap > 0:
-                market_cap_ratio = company_market_cap / target_market_cap
-                min_ratio = criteria.get('min_market_cap_ratio', 0.1)
-                max_ratio = criteria.get('max_market_cap_ratio', 10.0)
-                
-                if not (min_ratio <= market_cap_ratio <= max_ratio):
-                    return False
-            
-            # Geographic region (if specified)
-            if criteria.get('require_region_match', False):
-                if company.get('country') != target.get('country'):
-                    return False
-            
-            # Exchange (if specified)
-            if criteria.get('require_exchange_match', False):
-                if company.get('exchange') != target.get('exchange'):
-                    return False
-            
-            # Minimum data quality
-            required_fields = ['revenue', 'market_cap', 'price']
-            for field in required_fields:
-                if not company.get(field) or company.get(field) <= 0:
-                    return False
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Criteria check failed: {e}")
-            return False
+    def build_index(self, universe: List[Dict[str, Any]]) -> "PeerUniverseIndex":
+        """Extract columns, ratios and industry buckets for a peer universe once"""
+        columns = self._bulk_extract(universe)
+        
+        industry_rows: Dict[Any, List[int]] = defaultdict(list)
+        for i, industry in enumerate(columns['industry']):
+            industry_rows[industry].append(i)
+        
+        return PeerUniverseIndex(
+            universe=universe,
+            columns=columns,
+            multiples=self._compute_multiples(columns),
+            industry_rows={
+                industry: np.array(rows, dtype=np.intp) for industry, rows in industry_rows.items()
+            }
+        )
     
-    def _create_peer_company(self, company_data: Dict[str, Any]) -> Optional[PeerCompany]:
-        """Create PeerCompany object from raw data"""
-        try:
-            # Calculate valuation multiples
-            market_cap = company_data.get('market_cap', 0)
-            revenue = company_data.get('revenue', 0)
-            ebitda = company_data.get('ebitda', 0)
-            net_income = company_data.get('net_income', 0)
-            shares_outstanding = company_data.get('shares_outstanding', 0)
-            price = company_data.get('price', 0)
-            total_debt = company_data.get('total_debt', 0)
-            cash = company_data.get('cash', 0)
-            book_value = company_data.get('book_value', 0)
-            total_assets = company_data.get('total_assets', 0)
-            total_equity = company_data.get('total_equity', 0)
-            current_assets = company_data.get('current_assets', 0)
-            current_liabilities = company_data.get('current_liabilities', 0)
-            
-            # Enterprise Value
-            enterprise_value = market_cap + total_debt - cash
-            
-            # Valuation Multiples
-            pe = market_cap / net_income if net_income > 0 else 0
-            pb = market_cap / book_value if book_value > 0 else 0
-            ps = market_cap / revenue if revenue > 0 else 0
-            ev_revenue = enterprise_value / revenue if revenue > 0 else 0
-            ev_ebitda = enterprise_value / ebitda if ebitda > 0 else 0
-            
-            # Growth rate (simplified - would need historical data)
-            growth_rate = company_data.get('revenue_growth_rate', 0)
-            peg = pe / (growth_rate * 100) if growth_rate > 0 and pe > 0 else 0
-            
-            # Profitability ratios
-            roe = net_income / total_equity if total_equity > 0 else 0
-            roa = net_income / total_assets if total_assets > 0 else 0
-            
-            # Financial health ratios
-            debt_to_equity = total_debt / total_equity if total_equity > 0 else 0
-            current_ratio = current_assets / current_liabilities if current_liabilities > 0 else 0
-            
-            # Market cap category
-            if market_cap >= 10_000_000_000:  # $10B+
-                market_cap_category = "Large"
-            elif market_cap >= 2_000_000_000:  # $2B+
-                market_cap_category = "Mid"
-            else:
-                market_cap_category = "Small"
-            
-            return PeerCompany(
-                symbol=company_data.get('symbol', ''),
-                name=company_data.get('name', ''),
-                market_cap=market_cap,
-                enterprise_value=enterprise_value,
-                revenue=revenue,
-                ebitda=ebitda,
-                net_income=net_income,
-                shares_outstanding=shares_outstanding,
-                price=price,
-                pe=pe,
-                pb=pb,
-                ps=ps,
-                ev_revenue=ev_revenue,
-                ev_ebitda=ev_ebitda,
-                peg=peg,
-                roe=roe,
-                roa=roa,
-                debt_to_equity=debt_to_equity,
-                current_ratio=current_ratio,
-                industry=company_data.get('industry', ''),
-                sector=company_data.get('sector', ''),
-                market_cap_category=market_cap_category
-            )
-            
-        except Exception as e:
-            logger.error(f"Failed to create peer company: {e}")
-            return None
+    def _bulk_extract(self, universe: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Load the universe into float64 columns (missing values as 0) plus match-key columns"""
+        count = len(universe)
+        columns = {
+            field: np.fromiter((c.get(field) or 0 for c in universe), dtype=np.float64, count=count)
+            for field in _NUMERIC_FIELDS
+        }
+        for field in _MATCH_FIELDS:
+            column = np.empty(count, dtype=object)
+            column[:] = [c.get(field) for c in universe]
+            columns[field] = column
+        return columns
     
-    def _calculate_relevance_score(self, peer: PeerCompany, target: Dict[str, Any]) -> float:
-        """Calculate relevance score for peer company"""
-        try:
-            score = 0.0
-            
-            # Industry match (highest weight)
-            if peer.industry == target.get('industry'):
-                score += 40
-            
-            # Market cap similarity
-            target_market_cap = target.get('market_cap', 0)
-            if target_market_cap > 0:
-                market_cap_ratio = peer.market_cap / target_market_cap
-                if 0.5 <= market_cap_ratio <= 2.0:  # Within 2x range
-                    score += 30
-                elif 0.25 <= market_cap_ratio <= 4.0:  # Within 4x range
-                    score += 20
-                elif 0.1 <= market_cap_ratio <= 10.0:  # Within 10x range
-                    score += 10
-            
-            # Sector match
-            if peer.sector == target.get('sector'):
-                score += 20
-            
-            # Geographic proximity (if available)
-            # This would require additional data
-            
-            # Business model similarity (if available)
-            # This would require additional analysis
-            
-            return score
-            
-        except Exception as e:
-            logger.error(f"Relevance score calculation failed: {e}")
-            return 0.0
+    def _compute_multiples(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Calculate valuation, profitability and health ratios for every row at once"""
+        market_cap = columns['market_cap']
+        revenue = columns['revenue']
+        ebitda = columns['ebitda']
+        net_income = columns['net_income']
+        total_debt = columns['total_debt']
+        total_equity = columns['total_equity']
+        growth_rate = columns['revenue_growth_rate']
+        
+        # One NaN-filled block, one row per ratio; undefined ratios stay NaN
+        block = np.full((len(_RATIO_FIELDS), market_cap.size), np.nan)
+        ratios = dict(zip(_RATIO_FIELDS, block))
+        
+        # Enterprise Value
+        enterprise_value = ratios['enterprise_value']
+        np.add(market_cap, total_debt, out=enterprise_value)
+        np.subtract(enterprise_value, columns['cash'], out=enterprise_value)
+        
+        # Valuation Multiples
+        _guarded_divide(market_cap, net_income, ratios['pe'])
+        _guarded_divide(market_cap, columns['book_value'], ratios['pb'])
+        _guarded_divide(market_cap, revenue, ratios['ps'])
+        _guarded_divide(enterprise_value, revenue, ratios['ev_revenue'])
+        _guarded_divide(enterprise_value, ebitda, ratios['ev_ebitda'])
+        
+        # Growth rate (simplified - would need historical data)
+        pe = ratios['pe']
+        np.divide(pe, growth_rate * 100, out=ratios['peg'], where=(growth_rate > 0) & (pe > 0))
+        
+        # Profitability ratios
+        _guarded_divide(net_income, total_equity, ratios['roe'])
+        _guarded_divide(net_income, columns['total_assets'], ratios['roa'])
+        
+        # Financial health ratios
+        _guarded_divide(total_debt, total_equity, ratios['debt_to_equity'])
+        _guarded_divide(columns['current_assets'], columns['current_liabilities'], ratios['current_ratio'])
+        
+        return ratios
+    
+    def _criteria_mask(self, columns: Dict[str, np.ndarray], rows: np.ndarray, target: "_PeerTarget", 
+                       criteria: Dict[str, Any]) -> np.ndarray:
+        """Build a boolean mask over ``rows`` of those meeting the remaining criteria
+        
+        Industry matching is handled by the caller's choice of ``rows``.
+        """
+        market_cap = columns['market_cap'][rows]
+        
+        # Skip the target company itself
+        mask = columns['symbol'][rows] != target.symbol
+        
+        # Market cap range
+        if target.market_cap > 0:
+            market_cap_ratio = market_cap / target.market_cap
+            min_ratio = criteria.get('min_market_cap_ratio', 0.1)
+            max_ratio = criteria.get('max_market_cap_ratio', 10.0)
+            mask &= (market_cap_ratio >= min_ratio) & (market_cap_ratio <= max_ratio)
+        
+        # Geographic region (if specified)
+        if criteria.get('require_region_match', False):
+            mask &= columns['country'][rows] == target.country
+        
+        # Exchange (if specified)
+        if criteria.get('require_exchange_match', False):
+            mask &= columns['exchange'][rows] == target.exchange
+        
+        # Minimum data quality
+        mask &= (columns['revenue'][rows] > 0) & (market_cap > 0) & (columns['price'][rows] > 0)
+        
+        return mask
+    
+    def _create_peer_company(self, company_data: Dict[str, Any], columns: Dict[str, np.ndarray],
+                             multiples: Dict[str, np.ndarray], i: int) -> PeerCompany:
+        """Create PeerCompany object from a precomputed row"""
+        market_cap = float(columns['market_cap'][i])
+        
+        # Market cap category
+        if market_cap >= 10_000_000_000:  # $10B+
+            market_cap_category = "Large"
+        elif market_cap >= 2_000_000_000:  # $2B+
+            market_cap_category = "Mid"
+        else:
+            market_cap_category = "Small"
+        
+        return PeerCompany(
+            symbol=company_data.get('symbol', ''),
+            name=company_data.get('name', ''),
+            market_cap=market_cap,
+            enterprise_value=float(multiples['enterprise_value'][i]),
+            revenue=float(columns['revenue'][i]),
+            ebitda=float(columns['ebitda'][i]),
+            net_income=float(columns['net_income'][i]),
+            shares_outstanding=float(columns['shares_outstanding'][i]),
+            price=float(columns['price'][i]),
+            pe=float(multiples['pe'][i]),
+            pb=float(multiples['pb'][i]),
+            ps=float(multiples['ps'][i]),
+            ev_revenue=float(multiples['ev_revenue'][i]),
+            ev_ebitda=float(multiples['ev_ebitda'][i]),
+            peg=float(multiples['peg'][i]),
+            roe=float(multiples['roe'][i]),
+            roa=float(multiples['roa'][i]),
+            debt_to_equity=float(multiples['debt_to_equity'][i]),
+            current_ratio=float(multiples['current_ratio'][i]),
+            industry=company_data.get('industry', ''),
+            sector=company_data.get('sector', ''),
+            market_cap_category=market_cap_category
+        )
+    
+    def _calculate_relevance_scores(self, columns: Dict[str, np.ndarray], candidates: np.ndarray,
+                                    target: "_PeerTarget") -> np.ndarray:
+        """Calculate relevance scores for the candidate rows"""
+        scores = np.zeros(candidates.size)
+        
+        # Industry match (highest weight)
+        if target.industry is not None:
+            scores += np.where(columns['industry'][candidates] == target.industry, 40.0, 0.0)
+        
+        # Market cap similarity: within 2x, 4x and 10x bands
+        if target.market_cap > 0:
+            ratio = columns['market_cap'][candidates] / target.market_cap
+            scores += np.select(
+                [(ratio >= 0.5) & (ratio <= 2.0), (ratio >= 0.25) & (ratio <= 4.0), (ratio >= 0.1) & (ratio <= 10.0)],
+                [30.0, 20.0, 10.0],
+                default=0.0
+            )
+        
+        # Sector match
+        if target.sector is not None:
+            scores += np.where(columns['sector'][candidates] == target.sector, 20.0, 0.0)
+        
+        # Geographic proximity (if available)
+        # This would require additional data
+        
+        # Business model similarity (if available)
+        # This would require additional analysis
+        
+        return scores
 
 
 class ValuationMultiplesEngine:
@@ -287,66 +441,126 @@ class ValuationMultiplesEngine:
     def __init__(self):
         pass
     
-    def calculate_valuation_metrics(self, peers: List[PeerCompany]) -> Dict[str, ValuationMetric]:
+    def calculate_valuation_metrics(self, peers: List[PeerCompany], 
+                                  peer_arrays: Optional[_PeerArrays] = None) -> Dict[str, ValuationMetric]:
         """Calculate comprehensive valuation metrics for peer group"""
         try:
-            metrics = {}
-            
-            # Extract multiples data
-            pe_values = [p.pe for p in peers if p.pe > 0 and p.pe < 100]  # Filter outliers
-            pb_values = [p.pb for p in peers if p.pb > 0 and p.pb < 20]
-            ps_values = [p.ps for p in peers if p.ps > 0 and p.ps < 50]
-            ev_revenue_values = [p.ev_revenue for p in peers if p.ev_revenue > 0 and p.ev_revenue < 20]
-            ev_ebitda_values = [p.ev_ebitda for p in peers if p.ev_ebitda > 0 and p.ev_ebitda < 50]
+            if peer_arrays is None:
+                peer_arrays = _PeerArrays.from_peers(peers)
             
-            # Calculate statistics for each multiple
-            metrics['pe'] = self._calculate_metric_stats(pe_values)
-            metrics['pb'] = self._calculate_metric_stats(pb_values)
-            metrics['ps'] = self._calculate_metric_stats(ps_values)
-            metrics['ev_revenue'] = self._calculate_metric_stats(ev_revenue_values)
-            metrics['ev_ebitda'] = self._calculate_metric_stats(ev_ebitda_values)
-            
-            return metrics
+            # Calculate statistics for each multiple, filtering outliers
+            return {
+                name: self._calculate_metric_stats(getattr(peer_arrays, name), bounds)
+                for name, bounds in _MULTIPLE_BOUNDS.items()
+            }
             
         except Exception as e:
             logger.error(f"Valuation metrics calculation failed: {e}")
             raise ValueError(f"Valuation metrics calculation failed: {e}")
     
-    def _calculate_metric_stats(self, values: List[float]) -> ValuationMetric:
-        """Calculate statistical metrics for a valuation multiple"""
-        try:
-            if not values:
-                return ValuationMetric(0, 0, 0, 0, 0, 0, 0, 0)
-            
-            values_array = np.array(values)
-            
-            return ValuationMetric(
-                min=float(np.min(values_array)),
-                max=float(np.max(values_array)),
-                median=float(np.median(values_array)),
-                mean=float(np.mean(values_array)),
-                percentile_25=float(np.percentile(values_array, 25)),
-                percentile_75=float(np.percentile(values_array, 75)),
-                standard_deviation=float(np.std(values_array)),
-                count=len(values)
-            )
-            
-        except Exception as e:
-            logger.error(f"Metric stats calculation failed: {e}")
+    def _calculate_metric_stats(self, values: np.ndarray, bounds: Tuple[float, float]) -> ValuationMetric:
+        """Calculate statistical metrics for a valuation multiple within bounds"""
+        # Undefined (NaN) multiples fail both comparisons and drop out here
+        lower, upper = bounds
+        values = values[(values > lower) & (values < upper)]
+        
+        if values.size == 0:
             return ValuationMetric(0, 0, 0, 0, 0, 0, 0, 0)
+        
+        # min, p25, median, p75 and max from a single partition
+        minimum, p25, median, p75, maximum = np.percentile(values, _STAT_QUANTILES)
+        
+        return ValuationMetric(
+            min=float(minimum),
+            max=float(maximum),
+            median=float(median),
+            mean=float(values.mean()),
+            percentile_25=float(p25),
+            percentile_75=float(p75),
+            standard_deviation=float(values.std()),
+            count=int(values.size)
+        )
 
 
 class ComparableValuationEngine:
     """Comparable Valuation Analysis Engine"""
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 256):
         self.peer_engine = PeerIdentificationEngine()
         self.multiples_engine = ValuationMultiplesEngine()
+        
+        # Bounded LRU of analysis results keyed on a digest of all inputs
+        self.cache_size = cache_size
+        self._results_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
     
     def perform_comparable_analysis(self, target_company: Dict[str, Any], 
                                   peer_universe: List[Dict[str, Any]],
-                                  target_financials: Dict[str, float]) -> Dict[str, Any]:
-        """Perform comprehensive comparable company analysis"""
+                                  target_financials: Dict[str, float],
+                                  universe_index: Optional[PeerUniverseIndex] = None,
+                                  universe_version: Optional[str] = None) -> Dict[str, Any]:
+        """Perform comprehensive comparable company analysis
+        
+        When valuing many targets against the same universe, build the index
+        once with ``peer_engine.build_index`` and pass it as ``universe_index``.
+        Results are cached per target and universe: pass ``universe_version``
+        (any token that changes whenever the universe does) or a reused index
+        so a repeat lookup costs nothing proportional to the universe size.
+        """
+        try:
+            if universe_version is None:
+                # Without a caller-supplied version the universe itself is digested,
+                # once per index; an index built for that is reused by the analysis
+                if universe_index is None:
+                    universe_index = self.peer_engine.build_index(peer_universe)
+                universe_version = self._universe_version(universe_index)
+            cache_key = self._analysis_cache_key(target_company, universe_version, target_financials)
+        except Exception as e:
+            logger.error(f"Comparable analysis failed: {e}")
+            raise ValueError(f"Comparable analysis failed: {e}")
+        
+        cached = self._results_cache.get(cache_key)
+        if cached is not None:
+            self._results_cache.move_to_end(cache_key)
+            results = copy.deepcopy(cached)
+            results['analysis_metadata']['analysis_date'] = datetime.now().isoformat()
+            return results
+        
+        results = self._run_comparable_analysis(target_company, peer_universe, target_financials, universe_index)
+        
+        self._results_cache[cache_key] = copy.deepcopy(results)
+        if len(self._results_cache) > self.cache_size:
+            self._results_cache.popitem(last=False)
+        
+        return results
+    
+    def _analysis_cache_key(self, target_company: Dict[str, Any], 
+                            universe_version: str,
+                            target_financials: Dict[str, float]) -> str:
+        """Digest the target, financials and universe version into a cache key"""
+        payload = json.dumps([target_company, target_financials, universe_version], sort_keys=True, default=str)
+        digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+        return f"{target_company.get('symbol', '')}:{digest}"
+    
+    @staticmethod
+    def _universe_version(universe_index: PeerUniverseIndex) -> str:
+        """Digest what the analysis reads from an index, computing it once per index"""
+        if universe_index.version is None:
+            # Numeric columns as raw bytes, plus match keys and names
+            digest = hashlib.blake2b(digest_size=16)
+            columns = universe_index.columns
+            for field in _NUMERIC_FIELDS:
+                digest.update(columns[field].tobytes())
+            labels = [columns[field].tolist() for field in _MATCH_FIELDS]
+            labels.append([company.get('name', '') for company in universe_index.universe])
+            digest.update(json.dumps(labels, default=str).encode())
+            universe_index.version = digest.hexdigest()
+        return universe_index.version
+    
+    def _run_comparable_analysis(self, target_company: Dict[str, Any], 
+                                 peer_universe: List[Dict[str, Any]],
+                                 target_financials: Dict[str, float],
+                                 universe_index: Optional[PeerUniverseIndex] = None) -> Dict[str, Any]:
+        """Run the full identify -> multiples -> valuation -> ranking -> industry pipeline"""
         try:
             # Identify peers
             criteria = {
@@ -356,22 +570,25 @@ class ComparableValuationEngine:
                 'max_peers': 20
             }
             
-            peers = self.peer_engine.identify_peers(target_company, peer_universe, criteria)
+            peers = self.peer_engine.identify_peers(target_company, peer_universe, criteria, universe_index)
             
             if len(peers) < 3:
                 raise ValueError("Insufficient peer companies found for analysis")
             
+            # Lay the peer group out as columns once for the vectorized stages
+            peer_arrays = _PeerArrays.from_peers(peers)
+            
             # Calculate valuation metrics
-            valuation_metrics = self.multiples_engine.calculate_valuation_metrics(peers)
+            valuation_metrics = self.multiples_engine.calculate_valuation_metrics(peers, peer_arrays)
             
             # Perform relative valuation
             comparable_valuation = self._calculate_relative_valuation(target_financials, valuation_metrics)
             
             # Calculate peer rankings
-            peer_rankings = self._calculate_peer_rankings(peers, target_company)
+            peer_rankings = self._calculate_peer_rankings(peers, target_company, peer_arrays)
             
             # Industry analysis
-            industry_analysis = self._analyze_industry_trends(peers)
+            industry_analysis = self._analyze_industry_trends(peers, peer_arrays)
             
             return {
                 'target_company': target_company,
@@ -436,12 +653,15 @@ class ComparableValuationEngine:
             if not valuations:
                 raise ValueError("No valid valuation multiples available")
             
+            values = np.fromiter(valuations, dtype=np.float64, count=len(valuations))
+            weight_values = np.fromiter(weights, dtype=np.float64, count=len(weights))
+            
             # Calculate weighted average
-            total_weight = sum(weights)
-            weighted_avg = sum(v * w for v, w in zip(valuations, weights)) / total_weight if total_weight > 0 else 0
+            total_weight = weight_values.sum()
+            weighted_avg = float(np.vdot(values, weight_values) / total_weight) if total_weight > 0 else 0
             
             # Calculate confidence score based on data quality and consistency
-            confidence_score = self._calculate_confidence_score(valuations, valuation_metrics)
+            confidence_score = self._calculate_confidence_score(values, valuation_metrics)
             
             return ComparableValuation(
                 pe_based=valuations[0] if len(valuations) > 0 else 0,
@@ -449,8 +669,8 @@ class ComparableValuationEngine:
                 ps_based=valuations[2] if len(valuations) > 2 else 0,
                 ev_revenue_based=valuations[3] if len(valuations) > 3 else 0,
                 ev_ebitda_based=valuations[4] if len(valuations) > 4 else 0,
-                average=sum(valuations) / len(valuations),
-                median=np.median(valuations),
+                average=float(values.mean()),
+                median=float(np.median(values)),
                 weighted_average=weighted_avg,
                 confidence_score=confidence_score
             )
@@ -459,110 +679,116 @@ class ComparableValuationEngine:
             logger.error(f"Relative valuation calculation failed: {e}")
             raise ValueError(f"Relative valuation calculation failed: {e}")
     
-    def _calculate_confidence_score(self, valuations: List[float], 
+    def _calculate_confidence_score(self, valuations: np.ndarray, 
                                   valuation_metrics: Dict[str, ValuationMetric]) -> float:
         """Calculate confidence score for the valuation"""
+        if valuations.size == 0:
+            return 0.0
+        
+        # Base score from number of multiples used
+        base_score = min(len(valuations) * 20, 100)
+        
+        # Consistency score (lower standard deviation = higher confidence)
+        if len(valuations) > 1:
+            std_dev = valuations.std()
+            mean_val = valuations.mean()
+            coefficient_of_variation = std_dev / mean_val if mean_val > 0 else 1
+            consistency_score = max(0, 30 * (1 - coefficient_of_variation))
+        else:
+            consistency_score = 0
+        
+        # Data quality score
+        quality_score = 0
+        for metric_name, metric in valuation_metrics.items():
+            if metric.count >= 5:  # At least 5 peers
+                quality_score += 10
+        
+        total_score = base_score + consistency_score + quality_score
+        return min(100, max(0, total_score))
+    
+    def _calculate_peer_rankings(self, peers: List[PeerCompany], target: Dict[str, Any],
+                                 peer_arrays: Optional[_PeerArrays] = None) -> List[PeerRanking]:
+        """Calculate peer company rankings"""
         try:
-            if not valuations:
-                return 0.0
+            if peer_arrays is None:
+                peer_arrays = _PeerArrays.from_peers(peers)
             
-            # Base score from number of multiples used
-            base_score = min(len(valuations) * 20, 100)
+            # Undefined ratios count as 0 for scoring
+            pe, pb, ps, roe, roa, debt_to_equity = (
+                np.nan_to_num(getattr(peer_arrays, name))
+                for name in ('pe', 'pb', 'ps', 'roe', 'roa', 'debt_to_equity')
+            )
             
-            # Consistency score (lower standard deviation = higher confidence)
-            if len(valuations) > 1:
-                std_dev = np.std(valuations)
-                mean_val = np.mean(valuations)
-                coefficient_of_variation = std_dev / mean_val if mean_val > 0 else 1
-                consistency_score = max(0, 30 * (1 - coefficient_of_variation))
-            else:
-                consistency_score = 0
+            # Valuation score (lower multiples = better)
+            valuation_scores = np.clip(100 - (pe + pb + ps) / 3 * 10, 0, 100)
             
-            # Data quality score
-            quality_score = 0
-            for metric_name, metric in valuation_metrics.items():
-                if metric.count >= 5:  # At least 5 peers
-                    quality_score += 10
+            # Profitability score
+            profitability_scores = np.clip((roe + roa) * 10, 0, 100)
             
-            total_score = base_score + consistency_score + quality_score
-            return min(100, max(0, total_score))
+            # Growth score (simplified - would need historical data)
+            growth_score = 50  # Placeholder
             
-        except Exception as e:
-            logger.error(f"Confidence score calculation failed: {e}")
-            return 0.0
-    
-    def _calculate_peer_rankings(self, peers: List[PeerCompany], target: Dict[str, Any]) -> List[PeerRanking]:
-        """Calculate peer company rankings"""
-        try:
-            rankings = []
-            
-            for peer in peers:
-                # Valuation score (lower multiples = better)
-                valuation_score = 100 - min(100, (peer.pe + peer.pb + peer.ps) / 3 * 10)
-                
-                # Profitability score
-                profitability_score = (peer.roe + peer.roa) * 10
-                profitability_score = min(100, max(0, profitability_score))
-                
-                # Growth score (simplified - would need historical data)
-                growth_score = 50  # Placeholder
-                
-                # Financial health score
-                health_score = 100 - min(100, peer.debt_to_equity * 20)
-                health_score = max(0, health_score)
-                
-                # Overall score (weighted average)
-                overall_score = (
-                    valuation_score * 0.3 +
-                    profitability_score * 0.3 +
-                    growth_score * 0.2 +
-                    health_score * 0.2
+            # Financial health score
+            health_scores = np.clip(100 - debt_to_equity * 20, 0, 100)
+            
+            # Overall score (weighted average)
+            overall_scores = np.round(
+                valuation_scores * 0.3 +
+                profitability_scores * 0.3 +
+                growth_score * 0.2 +
+                health_scores * 0.2,
+                2
+            )
+            valuation_scores = np.round(valuation_scores, 2)
+            profitability_scores = np.round(profitability_scores, 2)
+            health_scores = np.round(health_scores, 2)
+            
+            # Sort by overall score (stable) and assign ranks in order
+            order = np.argsort(-overall_scores, kind='stable')
+            return [
+                PeerRanking(
+                    symbol=peers[i].symbol,
+                    name=peers[i].name,
+                    overall_score=float(overall_scores[i]),
+                    valuation_score=float(valuation_scores[i]),
+                    profitability_score=float(profitability_scores[i]),
+                    growth_score=float(growth_score),
+                    financial_health_score=float(health_scores[i]),
+                    rank=rank
                 )
-                
-                rankings.append(PeerRanking(
-                    symbol=peer.symbol,
-                    name=peer.name,
-                    overall_score=round(overall_score, 2),
-                    valuation_score=round(valuation_score, 2),
-                    profitability_score=round(profitability_score, 2),
-                    growth_score=round(growth_score, 2),
-                    financial_health_score=round(health_score, 2),
-                    rank=0  # Will be set after sorting
-                ))
-            
-            # Sort by overall score and assign ranks
-            rankings.sort(key=lambda x: x.overall_score, reverse=True)
-            for i, ranking in enumerate(rankings):
-                ranking.rank = i + 1
-            
-            return rankings
+                for rank, i in enumerate(order, start=1)
+            ]
             
         except Exception as e:
             logger.error(f"Peer ranking calculation failed: {e}")
             return []
     
-    def _analyze_industry_trends(self, peers: List[PeerCompany]) -> Dict[str, Any]:
+    def _analyze_industry_trends(self, peers: List[PeerCompany], 
+                                 peer_arrays: Optional[_PeerArrays] = None) -> Dict[str, Any]:
         """Analyze industry trends from peer data"""
         try:
             if not peers:
                 return {}
             
-            # Calculate industry averages
-            avg_pe = np.mean([p.pe for p in peers if p.pe > 0])
-            avg_pb = np.mean([p.pb for p in peers if p.pb > 0])
-            avg_roe = np.mean([p.roe for p in peers if p.roe > 0])
-            avg_debt_equity = np.mean([p.debt_to_equity for p in peers if p.debt_to_equity > 0])
+            if peer_arrays is None:
+                peer_arrays = _PeerArrays.from_peers(peers)
+            
+            # Calculate industry averages over positive values
+            averages = {
+                name: _positive_mean(getattr(peer_arrays, name))
+                for name in ('pe', 'pb', 'roe', 'debt_to_equity')
+            }
             
             # Market cap distribution
-            large_cap_count = sum(1 for p in peers if p.market_cap_category == "Large")
-            mid_cap_count = sum(1 for p in peers if p.market_cap_category == "Mid")
-            small_cap_count = sum(1 for p in peers if p.market_cap_category == "Small")
+            small_cap_count, mid_cap_count, large_cap_count = (
+                int(n) for n in np.bincount(peer_arrays.cap_category, minlength=len(_CAP_CATEGORY_CODES))
+            )
             
             return {
-                'average_pe': round(avg_pe, 2),
-                'average_pb': round(avg_pb, 2),
-                'average_roe': round(avg_roe, 2),
-                'average_debt_to_equity': round(avg_debt_equity, 2),
+                'average_pe': round(averages['pe'], 2),
+                'average_pb': round(averages['pb'], 2),
+                'average_roe': round(averages['roe'], 2),
+                'average_debt_to_equity': round(averages['debt_to_equity'], 2),
                 'market_cap_distribution': {
                     'large_cap': large_cap_count,
                     'mid_cap': mid_cap_count,
@@ -577,67 +803,20 @@ class ComparableValuationEngine:
     
     def _peer_to_dict(self, peer: PeerCompany) -> Dict[str, Any]:
         """Convert PeerCompany to dictionary"""
+        # Undefined ratios are NaN internally but serialize as 0
         return {
-            'symbol': peer.symbol,
-            'name': peer.name,
-            'market_cap': peer.market_cap,
-            'enterprise_value': peer.enterprise_value,
-            'revenue': peer.revenue,
-            'ebitda': peer.ebitda,
-            'net_income': peer.net_income,
-            'shares_outstanding': peer.shares_outstanding,
-            'price': peer.price,
-            'pe': peer.pe,
-            'pb': peer.pb,
-            'ps': peer.ps,
-            'ev_revenue': peer.ev_revenue,
-            'ev_ebitda': peer.ev_ebitda,
-            'peg': peer.peg,
-            'roe': peer.roe,
-            'roa': peer.roa,
-            'debt_to_equity': peer.debt_to_equity,
-            'current_ratio': peer.current_ratio,
-            'industry': peer.industry,
-            'sector': peer.sector,
-            'market_cap_category': peer.market_cap_category
+            field: 0.0 if value != value else value
+            for field, value in zip(_PEER_FIELDS, _get_peer_fields(peer))
         }
     
     def _metric_to_dict(self, metric: ValuationMetric) -> Dict[str, Any]:
         """Convert ValuationMetric to dictionary"""
-        return {
-            'min': metric.min,
-            'max': metric.max,
-            'median': metric.median,
-            'mean': metric.mean,
-            'percentile_25': metric.percentile_25,
-            'percentile_75': metric.percentile_75,
-            'standard_deviation': metric.standard_deviation,
-            'count': metric.count
-        }
+        return dict(zip(_METRIC_FIELDS, _get_metric_fields(metric)))
     
     def _valuation_to_dict(self, valuation: ComparableValuation) -> Dict[str, Any]:
         """Convert ComparableValuation to dictionary"""
-        return {
-            'pe_based': valuation.pe_based,
-            'pb_based': valuation.pb_based,
-            'ps_based': valuation.ps_based,
-            'ev_revenue_based': valuation.ev_revenue_based,
-            'ev_ebitda_based': valuation.ev_ebitda_based,
-            'average': valuation.average,
-            'median': valuation.median,
-            'weighted_average': valuation.weighted_average,
-            'confidence_score': valuation.confidence_score
-        }
+        return dict(zip(_VALUATION_FIELDS, _get_valuation_fields(valuation)))
     
     def _ranking_to_dict(self, ranking: PeerRanking) -> Dict[str, Any]:
         """Convert PeerRanking to dictionary"""
-        return {
-            'symbol': ranking.symbol,
-            'name': ranking.name,
-            'overall_score': ranking.overall_score,
-            'valuation_score': ranking.valuation_score,
-            'profitability_score': ranking.profitability_score,
-            'growth_score': ranking.growth_score,
-            'financial_health_score': ranking.financial_health_score,
-            'rank': ranking.rank
-        }
+        return dict(zip(_RANKING_FIELDS, _get_ranking_fields(ranking)))
@@ -13,7 +13,7 @@ This module provides comprehensive economic data analysis including:
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Callable, Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import math
@@ -21,13 +21,53 @@ from scipy import stats
 import logging
 from decimal import Decimal, ROUND_HALF_UP
 import asyncio
+import functools
+import time
+from collections import OrderedDict
+from operator import itemgetter
 import aiohttp
+import orjson
 from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Series update monthly/quarterly, so responses stay valid for hours
+_DEFAULT_CACHE_TTL = 6 * 3600
+# Keys include caller-supplied date ranges, so the response cache is bounded
+_CACHE_MAX_ENTRIES = 512
 
-@dataclass
+_FRED_HOST = 'api.stlouisfed.org'
+_ALPHA_VANTAGE_HOST = 'www.alphavantage.co'
+
+# Maximum in-flight requests per upstream host, kept under provider rate limits
+_HOST_CONCURRENCY = {_FRED_HOST: 8, _ALPHA_VANTAGE_HOST: 4}
+
+# Rate-limited/unavailable responses are retried after these delays (seconds)
+_RETRY_STATUSES = frozenset({429, 503})
+_RETRY_BACKOFF = (0.5, 1.0, 2.0, 4.0)
+# A longer server-requested Retry-After than this gives up instead of waiting
+_RETRY_AFTER_LIMIT = 5.0
+
+# C-level field access for the observation parsing loops
+_get_date = itemgetter('date')
+_get_value = itemgetter('value')
+
+# Market sentiment snapshots are reused for this many seconds
+_SENTIMENT_TTL = 1.0
+
+# Market impact of an indicator's percent change, by category
+_IMPACT_RULES = {
+    'GDP': lambda change: 'Positive' if change > 0 else 'Negative',
+    # Both high inflation and deflation weigh on markets
+    'Inflation': lambda change: 'Negative' if abs(change) > 0.5 else 'Neutral',
+    # Falling unemployment is positive
+    'Employment': lambda change: 'Positive' if change < 0 else 'Negative',
+    # Rising rates are negative
+    'Interest Rates': lambda change: 'Negative' if change > 0 else 'Positive',
+}
+
+
+@dataclass(slots=True, frozen=True)
 class EconomicIndicator:
     """Economic Indicator Data Structure"""
     name: str
@@ -46,7 +86,7 @@ class EconomicIndicator:
     category: str  # GDP, Inflation, Employment, Interest Rates, etc.
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EconomicEvent:
     """Economic Calendar Event"""
     time: str
@@ -60,7 +100,7 @@ class EconomicEvent:
     impact: str  # Positive, Negative, Neutral
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InterestRateData:
     """Interest Rate Information"""
     rate: float
@@ -73,7 +113,7 @@ class InterestRateData:
     country: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InflationData:
     """Inflation Indicators"""
     cpi: float
@@ -88,7 +128,7 @@ class InflationData:
     country: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GDPData:
     """GDP Information"""
     gdp: float
@@ -100,7 +140,7 @@ class GDPData:
     country: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmploymentData:
     """Employment Statistics"""
     unemployment_rate: float
@@ -113,7 +153,7 @@ class EmploymentData:
     country: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarketSentiment:
     """Market Sentiment Indicators"""
     vix: float
@@ -126,516 +166,519 @@ class MarketSentiment:
     last_updated: str
 
 
+# Mock economic calendar, built once; events are frozen so the instances can be shared
+_MOCK_EVENTS: Tuple[EconomicEvent, ...] = (
+    EconomicEvent(
+        time='2024-01-15 08:30',
+        country='US',
+        event='Consumer Price Index',
+        importance='High',
+        actual=3.2,
+        forecast=3.1,
+        previous=3.0,
+        unit='%',
+        impact='Positive'
+    ),
+    EconomicEvent(
+        time='2024-01-15 10:00',
+        country='US',
+        event='Retail Sales',
+        importance='Medium',
+        actual=0.5,
+        forecast=0.3,
+        previous=0.2,
+        unit='%',
+        impact='Positive'
+    ),
+)
+
+
+# Static fields of the key indicators; only values, dates and source vary per call
+_GDP_META = dict(
+    name='Gross Domestic Product',
+    symbol='GDP',
+    unit='Billions USD',
+    frequency='Quarterly',
+    description='Total value of goods and services produced',
+    importance='High',
+    category='GDP'
+)
+_CPI_META = dict(
+    name='Consumer Price Index',
+    symbol='CPI',
+    unit='Index',
+    frequency='Monthly',
+    description='Measure of inflation based on consumer prices',
+    importance='High',
+    category='Inflation'
+)
+_UNRATE_META = dict(
+    name='Unemployment Rate',
+    symbol='UNRATE',
+    unit='Percent',
+    frequency='Monthly',
+    description='Percentage of labor force that is unemployed',
+    importance='High',
+    category='Employment'
+)
+# Only the US Federal Funds Rate series is available
+_FEDFUNDS_META = dict(
+    name='Federal Funds Rate',
+    symbol='FEDFUNDS',
+    unit='Percent',
+    frequency='Monthly',
+    description='Central bank interest rate',
+    importance='High',
+    category='Interest Rates'
+)
+
+# Key indicator -> country -> (provider, series); 'DEFAULT' covers other countries
+_SERIES_MAP = {
+    'gdp': {'US': ('fred', 'GDP'), 'DEFAULT': ('alpha_vantage', 'REAL_GDP')},
+    'inflation': {'US': ('fred', 'CPIAUCSL'), 'DEFAULT': ('alpha_vantage', 'INFLATION')},
+    'unemployment': {'US': ('fred', 'UNRATE'), 'DEFAULT': ('alpha_vantage', 'UNEMPLOYMENT')},
+    # Would need country-specific rate series
+    'interest_rate': {'US': ('fred', 'FEDFUNDS')},
+}
+_INDICATOR_META = {
+    'gdp': _GDP_META,
+    'inflation': _CPI_META,
+    'unemployment': _UNRATE_META,
+    'interest_rate': _FEDFUNDS_META,
+}
+_SOURCE_NAMES = {'fred': 'FRED', 'alpha_vantage': 'Alpha Vantage'}
+
+
+def _safe(message: str, default: Callable[[], Any] = lambda: None):
+    """Log exceptions raised by the wrapped function and return ``default()`` instead"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    logger.error(f"{message}: {e}")
+                    return default()
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{message}: {e}")
+                return default()
+        return wrapper
+    return decorator
+
+
+@_safe("Series parsing failed", default=pd.DataFrame)
+def _parse_series(data: Dict[str, Any], key: str = 'data') -> pd.DataFrame:
+    """Parse a list of {date, value} observations into a date-indexed frame"""
+    # FRED marks missing observations with '.'
+    observations = [obs for obs in data.get(key, ()) if obs.get('value') != '.']
+    count = len(observations)
+    if not count:
+        return pd.DataFrame()
+    
+    # ISO dates parse straight into datetime64, so pandas has no dtype to infer
+    dates = np.fromiter(map(_get_date, observations), dtype='datetime64[D]', count=count)
+    values = np.fromiter(map(float, map(_get_value, observations)), dtype=np.float64, count=count)
+    
+    index = pd.DatetimeIndex(dates.astype('datetime64[ns]'), name='date')
+    return pd.DataFrame({'value': values}, index=index, copy=False)
+
+
+# Alpha Vantage functions returning a plain {date, value} series
+_AV_PARSERS = {
+    'REAL_GDP': _parse_series,
+    'INFLATION': _parse_series,
+    'UNEMPLOYMENT': _parse_series,
+}
+
+
+def _latest_observations(df: pd.DataFrame, n: int = 2) -> Tuple[Tuple[str, float], ...]:
+    """Return the last ``n`` (date, value) pairs of a series frame, newest first"""
+    if df.empty:
+        return ()
+    tail = df['value'].iloc[-n:].iloc[::-1]
+    dates = np.datetime_as_string(tail.index.to_numpy(), unit='D').tolist()
+    return tuple(zip(dates, tail.to_numpy().tolist()))
+
+
+def _detached(value: Any) -> Any:
+    """Copy cached frames on the way out so callers cannot edit the cached one"""
+    return value.copy() if isinstance(value, pd.DataFrame) else value
+
+
 class EconomicDataProvider:
     """Economic Data Provider Interface"""
     
-    def __init__(self):
-        self.session = None
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None,
+                 cache_ttl: float = _DEFAULT_CACHE_TTL,
+                 executor: Optional[ThreadPoolExecutor] = None,
+                 cache_size: int = _CACHE_MAX_ENTRIES):
+        # A caller-supplied session is left open by close()
+        self.session = session
+        self._owns_session = session is None
+        self.cache_ttl = cache_ttl
+        # Parsing runs here so large series don't block the event loop
+        self.executor = executor
+        # LRU of (fetched_at, response); locks exist only while a key is being fetched
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._cache_locks: Dict[Tuple, asyncio.Lock] = {}
+        self._host_semaphores = {
+            host: asyncio.Semaphore(limit) for host, limit in _HOST_CONCURRENCY.items()
+        }
     
-    async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
-        return self
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            # One session for the provider lifetime keeps connections alive
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=300)
+            )
+            self._owns_session = True
+        return self.session
     
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+    async def close(self):
+        """Close the HTTP session if this provider created it"""
+        if self._owns_session and self.session is not None and not self.session.closed:
             await self.session.close()
+        self.session = None
+    
+    def _cache_get(self, key: Tuple) -> Any:
+        """Return a cached response if it is younger than the TTL"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+    
+    def _cache_put(self, key: Tuple, value: Any):
+        """Store a response, purging expired entries and then the least recently used"""
+        now = time.monotonic()
+        self._cache[key] = (now, value)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            for stale in [k for k, (fetched_at, _) in self._cache.items() if now - fetched_at >= self.cache_ttl]:
+                del self._cache[stale]
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    async def _cached_fetch(self, key: Tuple, fetch) -> Any:
+        """Serve ``key`` from the TTL cache, fetching it at most once concurrently"""
+        cached = self._cache_get(key)
+        if cached is not None:
+            return _detached(cached)
+        
+        lock = self._cache_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have filled the entry while we waited
+            cached = self._cache_get(key)
+            if cached is not None:
+                return _detached(cached)
+            
+            try:
+                result = await fetch()
+            finally:
+                # Later callers find the cache filled, so the lock is no longer needed
+                self._cache_locks.pop(key, None)
+            # Failed fetches come back empty; don't pin them for the TTL
+            if len(result):
+                self._cache_put(key, result)
+            return _detached(result)
+    
+    def clear_cache(self):
+        """Drop all cached responses"""
+        self._cache.clear()
+    
+    async def _get_json(self, host: str, path: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """GET a JSON document, bounded per host and retried on 429/503 with backoff"""
+        session = self._get_session()
+        url = f"https://{host}{path}"
+        for attempt, backoff in enumerate(_RETRY_BACKOFF + (None,)):
+            # The host slot is held for the request only, not across the backoff
+            async with self._host_semaphores[host]:
+                async with session.get(url, params=params) as response:
+                    if response.status == 200:
+                        return orjson.loads(await response.read())
+                    if response.status not in _RETRY_STATUSES or backoff is None:
+                        logger.error(f"{host} request failed: {response.status}")
+                        return None
+                    retry_after = response.headers.get('Retry-After', '')
+            
+            delay = float(retry_after) if retry_after.isdigit() else backoff
+            if delay > _RETRY_AFTER_LIMIT:
+                logger.error(f"{host} returned {response.status} with Retry-After {delay}s, giving up")
+                return None
+            logger.warning(f"{host} returned {response.status}, retry {attempt + 1} in {delay}s")
+            await asyncio.sleep(delay)
+    
+    async def _parse_off_loop(self, data: Dict[str, Any], key: str, parser=_parse_series) -> pd.DataFrame:
+        """Run a series parser in the executor"""
+        # Empty or single-row payloads aren't worth the thread hop
+        if len(data.get(key, ())) < 2:
+            return parser(data, key)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parser, data, key)
     
     async def fetch_fred_data(self, series_id: str, start_date: str = None, end_date: str = None) -> pd.DataFrame:
-        """Fetch data from FRED (Federal Reserve Economic Data)"""
-        try:
-            if not self.session:
-                raise ValueError("Session not initialized")
-            
-            # FRED API endpoint
-            url = f"https://api.stlouisfed.org/fred/series/observations"
-            
-            params = {
-                'series_id': series_id,
-                'api_key': 'YOUR_FRED_API_KEY',  # Would need actual API key
-                'file_type': 'json',
-                'sort_order': 'asc'
-            }
-            
-            if start_date:
-                params['observation_start'] = start_date
-            if end_date:
-                params['observation_end'] = end_date
-            
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    observations = data.get('observations', [])
-                    
-                    # Convert to DataFrame
-                    df_data = []
-                    for obs in observations:
-                        if obs.get('value') != '.':
-                            df_data.append({
-                                'date': obs['date'],
-                                'value': float(obs['value'])
-                            })
-                    
-                    df = pd.DataFrame(df_data)
-                    df['date'] = pd.to_datetime(df['date'])
-                    df.set_index('date', inplace=True)
-                    
-                    return df
-                else:
-                    logger.error(f"FRED API request failed: {response.status}")
-                    return pd.DataFrame()
-                    
-        except Exception as e:
-            logger.error(f"FRED data fetch failed: {e}")
-            return pd.DataFrame()
+        """Fetch data from FRED (Federal Reserve Economic Data), cached per series and range"""
+        return await self._cached_fetch(
+            ('fred', series_id, start_date, end_date),
+            lambda: self._request_fred_data(series_id, start_date, end_date)
+        )
+    
+    async def fetch_fred_latest(self, series_id: str, n: int = 2) -> Tuple[Tuple[str, float], ...]:
+        """Fetch the latest ``n`` FRED observations as (date, value) pairs, newest first"""
+        return await self._cached_fetch(
+            ('fred_latest', series_id, n),
+            lambda: self._request_fred_latest(series_id, n)
+        )
+    
+    async def fetch_fred_many(self, series_ids: List[str], n: int = 2) -> Dict[str, Tuple[Tuple[str, float], ...]]:
+        """Fetch the latest observations for several FRED series concurrently"""
+        results = await asyncio.gather(*(self.fetch_fred_latest(series_id, n) for series_id in series_ids))
+        return dict(zip(series_ids, results))
     
     async def fetch_alpha_vantage_economic_data(self, function: str, symbol: str = None) -> pd.DataFrame:
-        """Fetch economic data from Alpha Vantage"""
-        try:
-            if not self.session:
-                raise ValueError("Session not initialized")
-            
-            url = "https://www.alphavantage.co/query"
-            params = {
-                'function': function,
-                'apikey': 'YOUR_ALPHA_VANTAGE_API_KEY'  # Would need actual API key
-            }
-            
-            if symbol:
-                params['symbol'] = symbol
-            
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # Parse response based on function type
-                    if function == 'REAL_GDP':
-                        return self._parse_gdp_data(data)
-                    elif function == 'INFLATION':
-                        return self._parse_inflation_data(data)
-                    elif function == 'UNEMPLOYMENT':
-                        return self._parse_unemployment_data(data)
-                    else:
-                        return pd.DataFrame()
-                else:
-                    logger.error(f"Alpha Vantage API request failed: {response.status}")
-                    return pd.DataFrame()
-                    
-        except Exception as e:
-            logger.error(f"Alpha Vantage data fetch failed: {e}")
-            return pd.DataFrame()
+        """Fetch economic data from Alpha Vantage, cached per function and symbol"""
+        return await self._cached_fetch(
+            ('alpha_vantage', function, symbol),
+            lambda: self._request_alpha_vantage_data(function, symbol)
+        )
     
-    def _parse_gdp_data(self, data: Dict[str, Any]) -> pd.DataFrame:
-        """Parse GDP data from Alpha Vantage response"""
-        try:
-            gdp_data = data.get('data', [])
-            df_data = []
-            
-            for item in gdp_data:
-                df_data.append({
-                    'date': item['date'],
-                    'value': float(item['value'])
-                })
-            
-            df = pd.DataFrame(df_data)
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"GDP data parsing failed: {e}")
+    @_safe("FRED data fetch failed", default=pd.DataFrame)
+    async def _request_fred_data(self, series_id: str, start_date: str = None, end_date: str = None) -> pd.DataFrame:
+        """Request observations from the FRED API"""
+        params = {
+            'series_id': series_id,
+            'api_key': 'YOUR_FRED_API_KEY',  # Would need actual API key
+            'file_type': 'json',
+            'sort_order': 'asc'
+        }
+        
+        if start_date:
+            params['observation_start'] = start_date
+        if end_date:
+            params['observation_end'] = end_date
+        
+        data = await self._get_json(_FRED_HOST, '/fred/series/observations', params)
+        if data is None:
             return pd.DataFrame()
+        
+        return await self._parse_off_loop(data, 'observations')
     
-    def _parse_inflation_data(self, data: Dict[str, Any]) -> pd.DataFrame:
-        """Parse inflation data from Alpha Vantage response"""
-        try:
-            inflation_data = data.get('data', [])
-            df_data = []
-            
-            for item in inflation_data:
-                df_data.append({
-                    'date': item['date'],
-                    'value': float(item['value'])
-                })
-            
-            df = pd.DataFrame(df_data)
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"Inflation data parsing failed: {e}")
-            return pd.DataFrame()
+    @_safe("FRED latest data fetch failed", default=tuple)
+    async def _request_fred_latest(self, series_id: str, n: int) -> Tuple[Tuple[str, float], ...]:
+        """Request only the most recent FRED observations, without building a frame"""
+        params = {
+            'series_id': series_id,
+            'api_key': 'YOUR_FRED_API_KEY',  # Would need actual API key
+            'file_type': 'json',
+            'sort_order': 'desc',
+            # Headroom for missing ('.') observations among the latest rows
+            'limit': 2 * n
+        }
+        
+        data = await self._get_json(_FRED_HOST, '/fred/series/observations', params)
+        if data is None:
+            return ()
+        
+        return tuple(
+            (obs['date'], float(obs['value']))
+            for obs in data.get('observations', ())
+            if obs.get('value') != '.'
+        )[:n]
     
-    def _parse_unemployment_data(self, data: Dict[str, Any]) -> pd.DataFrame:
-        """Parse unemployment data from Alpha Vantage response"""
-        try:
-            unemployment_data = data.get('data', [])
-            df_data = []
-            
-            for item in unemployment_data:
-                df_data.append({
-                    'date': item['date'],
-                    'value': float(item['value'])
-                })
-            
-            df = pd.DataFrame(df_data)
-            df['date'] = pd.to_datetime(df['date'])
-            df.set_index('date', inplace=True)
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"Unemployment data parsing failed: {e}")
+    @_safe("Alpha Vantage data fetch failed", default=pd.DataFrame)
+    async def _request_alpha_vantage_data(self, function: str, symbol: str = None) -> pd.DataFrame:
+        """Request economic data from the Alpha Vantage API"""
+        params = {
+            'function': function,
+            'apikey': 'YOUR_ALPHA_VANTAGE_API_KEY'  # Would need actual API key
+        }
+        
+        if symbol:
+            params['symbol'] = symbol
+        
+        data = await self._get_json(_ALPHA_VANTAGE_HOST, '/query', params)
+        if data is None:
+            return pd.DataFrame()
+        
+        parser = _AV_PARSERS.get(function)
+        if parser is None:
             return pd.DataFrame()
+        return await self._parse_off_loop(data, 'data', parser)
 
 
 class EconomicIndicatorsEngine:
     """Economic Indicators Analysis Engine"""
     
     def __init__(self):
-        self.data_provider = EconomicDataProvider()
         self.executor = ThreadPoolExecutor(max_workers=4)
+        self.data_provider = EconomicDataProvider(executor=self.executor)
+        self._sentiment: Optional[Tuple[float, MarketSentiment]] = None
+    
+    async def aclose(self):
+        """Close the data provider's HTTP session and release the parsing threads"""
+        await self.data_provider.close()
+        # Later parses (if any) fall back to the loop's default executor
+        self.data_provider.executor = None
+        self.executor.shutdown(wait=False)
     
+    @_safe("Key indicators fetch failed", default=dict)
     async def get_key_indicators(self, country: str = 'US') -> Dict[str, EconomicIndicator]:
         """Get key economic indicators for a country"""
-        try:
-            indicators = {}
-            
-            # GDP
-            gdp_indicator = await self._get_gdp_indicator(country)
-            if gdp_indicator:
-                indicators['gdp'] = gdp_indicator
-            
-            # Inflation
-            inflation_indicator = await self._get_inflation_indicator(country)
-            if inflation_indicator:
-                indicators['inflation'] = inflation_indicator
-            
-            # Unemployment
-            unemployment_indicator = await self._get_unemployment_indicator(country)
-            if unemployment_indicator:
-                indicators['unemployment'] = unemployment_indicator
-            
-            # Interest Rates
-            interest_rate_indicator = await self._get_interest_rate_indicator(country)
-            if interest_rate_indicator:
-                indicators['interest_rate'] = interest_rate_indicator
-            
-            return indicators
-            
-        except Exception as e:
-            logger.error(f"Key indicators fetch failed: {e}")
-            return {}
+        results = await asyncio.gather(
+            *(self._get_indicator(kind, country) for kind in _SERIES_MAP),
+            return_exceptions=True
+        )
+        
+        indicators = {}
+        for name, result in zip(_SERIES_MAP, results):
+            if isinstance(result, Exception):
+                logger.error(f"{name} indicator fetch failed: {result}")
+            elif result:
+                indicators[name] = result
+        
+        return indicators
+    
+    async def get_key_indicators_multi(self, countries: List[str]) -> Dict[str, Dict[str, EconomicIndicator]]:
+        """Get key economic indicators for several countries concurrently"""
+        results = await asyncio.gather(*(self.get_key_indicators(country) for country in countries))
+        return dict(zip(countries, results))
+    
+    @_safe("Key indicator fetch failed")
+    async def _get_indicator(self, kind: str, country: str) -> Optional[EconomicIndicator]:
+        """Get the latest reading of a key indicator"""
+        routes = _SERIES_MAP[kind]
+        route = routes.get(country, routes.get('DEFAULT'))
+        if route is None:
+            return None
+        
+        provider, series_id = route
+        if provider == 'fred':
+            observations = await self.data_provider.fetch_fred_latest(series_id)
+        else:
+            observations = _latest_observations(
+                await self.data_provider.fetch_alpha_vantage_economic_data(series_id)
+            )
+        
+        if not observations:
+            return None
+        
+        # Observations are newest first
+        last_updated, latest_value = observations[0]
+        previous_value = observations[1][1] if len(observations) > 1 else latest_value
+        
+        change = latest_value - previous_value
+        change_percent = (change / previous_value) * 100 if previous_value != 0 else 0
+        
+        return EconomicIndicator(
+            value=latest_value,
+            previous_value=previous_value,
+            change=change,
+            change_percent=change_percent,
+            last_updated=last_updated,
+            source=_SOURCE_NAMES[provider],
+            country=country,
+            **_INDICATOR_META[kind]
+        )
     
     async def _get_gdp_indicator(self, country: str) -> Optional[EconomicIndicator]:
         """Get GDP indicator"""
-        try:
-            async with self.data_provider as provider:
-                if country == 'US':
-                    gdp_data = await provider.fetch_fred_data('GDP')
-                else:
-                    gdp_data = await provider.fetch_alpha_vantage_economic_data('REAL_GDP')
-                
-                if gdp_data.empty:
-                    return None
-                
-                # Get latest values
-                latest_value = gdp_data.iloc[-1]['value']
-                previous_value = gdp_data.iloc[-2]['value'] if len(gdp_data) > 1 else latest_value
-                
-                change = latest_value - previous_value
-                change_percent = (change / previous_value) * 100 if previous_value != 0 else 0
-                
-                return EconomicIndicator(
-                    name='Gross Domestic Product',
-                    symbol='GDP',
-                    value=latest_value,
-                    previous_value=previous_value,
-                    change=change,
-                    change_percent=change_percent,
-                    unit='Billions USD',
-                    frequency='Quarterly',
-                    last_updated=gdp_data.index[-1].strftime('%Y-%m-%d'),
-                    source='FRED' if country == 'US' else 'Alpha Vantage',
-                    description='Total value of goods and services produced',
-                    importance='High',
-                    country=country,
-                    category='GDP'
-                )
-                
-        except Exception as e:
-            logger.error(f"GDP indicator fetch failed: {e}")
-            return None
+        return await self._get_indicator('gdp', country)
     
     async def _get_inflation_indicator(self, country: str) -> Optional[EconomicIndicator]:
         """Get inflation indicator"""
-        try:
-            async with self.data_provider as provider:
-                if country == 'US':
-                    inflation_data = await provider.fetch_fred_data('CPIAUCSL')
-                else:
-                    inflation_data = await provider.fetch_alpha_vantage_economic_data('INFLATION')
-                
-                if inflation_data.empty:
-                    return None
-                
-                # Get latest values
-                latest_value = inflation_data.iloc[-1]['value']
-                previous_value = inflation_data.iloc[-2]['value'] if len(inflation_data) > 1 else latest_value
-                
-                change = latest_value - previous_value
-                change_percent = (change / previous_value) * 100 if previous_value != 0 else 0
-                
-                return EconomicIndicator(
-                    name='Consumer Price Index',
-                    symbol='CPI',
-                    value=latest_value,
-                    previous_value=previous_value,
-                    change=change,
-                    change_percent=change_percent,
-                    unit='Index',
-                    frequency='Monthly',
-                    last_updated=inflation_data.index[-1].strftime('%Y-%m-%d'),
-                    source='FRED' if country == 'US' else 'Alpha Vantage',
-                    description='Measure of inflation based on consumer prices',
-                    importance='High',
-                    country=country,
-                    category='Inflation'
-                )
-                
-        except Exception as e:
-            logger.error(f"Inflation indicator fetch failed: {e}")
-            return None
+        return await self._get_indicator('inflation', country)
     
     async def _get_unemployment_indicator(self, country: str) -> Optional[EconomicIndicator]:
         """Get unemployment indicator"""
-        try:
-            async with self.data_provider as provider:
-                if country == 'US':
-                    unemployment_data = await provider.fetch_fred_data('UNRATE')
-                else:
-                    unemployment_data = await provider.fetch_alpha_vantage_economic_data('UNEMPLOYMENT')
-                
-                if unemployment_data.empty:
-                    return None
-                
-                # Get latest values
-                latest_value = unemployment_data.iloc[-1]['value']
-                previous_value = unemployment_data.iloc[-2]['value'] if len(unemployment_data) > 1 else latest_value
-                
-                change = latest_value - previous_value
-                change_percent = (change / previous_value) * 100 if previous_value != 0 else 0
-                
-                return EconomicIndicator(
-                    name='Unemployment Rate',
-                    symbol='UNRATE',
-                    value=latest_value,
-                    previous_value=previous_value,
-                    change=change,
-                    change_percent=change_percent,
-                    unit='Percent',
-                    frequency='Monthly',
-                    last_updated=unemployment_data.index[-1].strftime('%Y-%m-%d'),
-                    source='FRED' if country == 'US' else 'Alpha Vantage',
-                    description='Percentage of labor force that is unemployed',
-                    importance='High',
-                    country=country,
-                    category='Employment'
-                )
-                
-        except Exception as e:
-            logger.error(f"Unemployment indicator fetch failed: {e}")
-            return None
+        return await self._get_indicator('unemployment', country)
     
     async def _get_interest_rate_indicator(self, country: str) -> Optional[EconomicIndicator]:
         """Get interest rate indicator"""
-        try:
-            async with self.data_provider as provider:
-                if country == 'US':
-                    # Federal Funds Rate
-                    rate_data = await provider.fetch_fred_data('FEDFUNDS')
-                else:
-                    # Would need country-specific rate series
-                    rate_data = pd.DataFrame()
-                
-                if rate_data.empty:
-                    return None
-                
-                # Get latest values
-                latest_value = rate_data.iloc[-1]['value']
-                previous_value = rate_data.iloc[-2]['value'] if len(rate_data) > 1 else latest_value
-                
-                change = latest_value - previous_value
-                change_percent = (change / previous_value) * 100 if previous_value != 0 else 0
-                
-                return EconomicIndicator(
-                    name='Federal Funds Rate' if country == 'US' else 'Central Bank Rate',
-                    symbol='FEDFUNDS' if country == 'US' else 'CBRATE',
-                    value=latest_value,
-                    previous_value=previous_value,
-                    change=change,
-                    change_percent=change_percent,
-                    unit='Percent',
-                    frequency='Monthly',
-                    last_updated=rate_data.index[-1].strftime('%Y-%m-%d'),
-                    source='FRED',
-                    description='Central bank interest rate',
-                    importance='High',
-                    country=country,
-                    category='Interest Rates'
-                )
-                
-        except Exception as e:
-            logger.error(f"Interest rate indicator fetch failed: {e}")
-            return None
+        return await self._get_indicator('interest_rate', country)
     
+    @_safe("Economic calendar fetch failed", default=list)
     async def get_economic_calendar(self, start_date: str, end_date: str, 
                                   countries: List[str] = None) -> List[EconomicEvent]:
         """Get economic calendar events"""
-        try:
-            # This would typically integrate with a financial data provider
-            # For now, return mock data
-            events = []
-            
-            # Mock economic events
-            mock_events = [
-                {
-                    'time': '2024-01-15 08:30',
-                    'country': 'US',
-                    'event': 'Consumer Price Index',
-                    'importance': 'High',
-                    'actual': 3.2,
-                    'forecast': 3.1,
-                    'previous': 3.0,
-                    'unit': '%',
-                    'impact': 'Positive'
-                },
-                {
-                    'time': '2024-01-15 10:00',
-                    'country': 'US',
-                    'event': 'Retail Sales',
-                    'importance': 'Medium',
-                    'actual': 0.5,
-                    'forecast': 0.3,
-                    'previous': 0.2,
-                    'unit': '%',
-                    'impact': 'Positive'
-                }
-            ]
-            
-            for event_data in mock_events:
-                events.append(EconomicEvent(**event_data))
-            
-            return events
-            
-        except Exception as e:
-            logger.error(f"Economic calendar fetch failed: {e}")
-            return []
+        # This would typically integrate with a financial data provider
+        # For now, return mock data
+        return list(_MOCK_EVENTS)
     
+    @_safe("Macroeconomic impact analysis failed", default=dict)
     async def analyze_macroeconomic_impact(self, indicators: Dict[str, EconomicIndicator],
                                          market_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze macroeconomic impact on markets"""
-        try:
-            analysis = {
-                'overall_sentiment': 'Neutral',
-                'key_drivers': [],
-                'risks': [],
-                'opportunities': [],
-                'correlation_analysis': {},
-                'impact_score': 0.0
-            }
-            
-            # Analyze each indicator
-            for indicator_name, indicator in indicators.items():
-                impact = self._assess_indicator_impact(indicator)
-                analysis['key_drivers'].append({
-                    'indicator': indicator_name,
-                    'impact': impact,
-                    'value': indicator.value,
-                    'change_percent': indicator.change_percent
-                })
-            
-            # Calculate overall impact score
-            impact_scores = []
-            for driver in analysis['key_drivers']:
-                if driver['impact'] == 'Positive':
-                    impact_scores.append(1)
-                elif driver['impact'] == 'Negative':
-                    impact_scores.append(-1)
-                else:
-                    impact_scores.append(0)
-            
-            if impact_scores:
-                analysis['impact_score'] = sum(impact_scores) / len(impact_scores)
-            
-            # Determine overall sentiment
-            if analysis['impact_score'] > 0.3:
-                analysis['overall_sentiment'] = 'Positive'
-            elif analysis['impact_score'] < -0.3:
-                analysis['overall_sentiment'] = 'Negative'
-            
-            return analysis
-            
-        except Exception as e:
-            logger.error(f"Macroeconomic impact analysis failed: {e}")
-            return {}
+        analysis = {
+            'overall_sentiment': 'Neutral',
+            'key_drivers': [],
+            'risks': [],
+            'opportunities': [],
+            'correlation_analysis': {},
+            'impact_score': 0.0
+        }
+        
+        # Analyze each indicator
+        for indicator_name, indicator in indicators.items():
+            impact = self._assess_indicator_impact(indicator)
+            analysis['key_drivers'].append({
+                'indicator': indicator_name,
+                'impact': impact,
+                'value': indicator.value,
+                'change_percent': indicator.change_percent
+            })
+        
+        # Calculate overall impact score: +1 per positive, -1 per negative driver
+        impacts = np.array([driver['impact'] for driver in analysis['key_drivers']], dtype='U8')
+        if impacts.size:
+            net_impact = np.count_nonzero(impacts == 'Positive') - np.count_nonzero(impacts == 'Negative')
+            analysis['impact_score'] = float(net_impact / impacts.size)
+        
+        # Determine overall sentiment
+        score = analysis['impact_score']
+        analysis['overall_sentiment'] = str(np.select(
+            [score > 0.3, score < -0.3], ['Positive', 'Negative'], default='Neutral'
+        ))
+        
+        return analysis
     
     def _assess_indicator_impact(self, indicator: EconomicIndicator) -> str:
         """Assess the impact of an economic indicator"""
-        try:
-            if indicator.category == 'GDP':
-                if indicator.change_percent > 0:
-                    return 'Positive'
-                else:
-                    return 'Negative'
-            
-            elif indicator.category == 'Inflation':
-                if indicator.change_percent > 0.5:  # High inflation
-                    return 'Negative'
-                elif indicator.change_percent < -0.5:  # Deflation
-                    return 'Negative'
-                else:
-                    return 'Neutral'
-            
-            elif indicator.category == 'Employment':
-                if indicator.change_percent < 0:  # Lower unemployment
-                    return 'Positive'
-                else:
-                    return 'Negative'
-            
-            elif indicator.category == 'Interest Rates':
-                if indicator.change_percent > 0:  # Higher rates
-                    return 'Negative'
-                else:
-                    return 'Positive'
-            
-            return 'Neutral'
-            
-        except Exception as e:
-            logger.error(f"Indicator impact assessment failed: {e}")
-            return 'Neutral'
+        rule = _IMPACT_RULES.get(indicator.category)
+        return rule(indicator.change_percent) if rule else 'Neutral'
     
+    @_safe("Market sentiment fetch failed", default=lambda: MarketSentiment(0, 0, 0, 0, 0, 0, 0, ''))
     async def get_market_sentiment(self) -> MarketSentiment:
         """Get market sentiment indicators"""
-        try:
-            # This would typically fetch from various sources
-            # For now, return mock data
-            return MarketSentiment(
-                vix=18.5,
-                vix_change=-2.1,
-                fear_greed_index=65.0,
-                put_call_ratio=0.85,
-                insider_trading=0.02,
-                institutional_flow=1500000000,
-                retail_flow=-500000000,
-                last_updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            )
-            
-        except Exception as e:
-            logger.error(f"Market sentiment fetch failed: {e}")
-            return MarketSentiment(0, 0, 0, 0, 0, 0, 0, '')
+        # Bursts of polls within the TTL share one snapshot
+        if self._sentiment is not None and time.monotonic() - self._sentiment[0] < _SENTIMENT_TTL:
+            return self._sentiment[1]
+        
+        # This would typically fetch from various sources
+        # For now, return mock data
+        sentiment = MarketSentiment(
+            vix=18.5,
+            vix_change=-2.1,
+            fear_greed_index=65.0,
+            put_call_ratio=0.85,
+            insider_trading=0.02,
+            institutional_flow=1500000000,
+            retail_flow=-500000000,
+            last_updated=datetime.now().isoformat(sep=' ', timespec='seconds')
+        )
+        self._sentiment = (time.monotonic(), sentiment)
+        return sentiment
     
     def __del__(self):
         """Cleanup executor"""
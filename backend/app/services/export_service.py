@@ -6,29 +6,40 @@ in multiple formats including PDF, Excel, HTML, and images.
 """
 
 import asyncio
+import hashlib
 import io
-import json
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import multiprocessing
 import os
-import tempfile
+import queue
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, BinaryIO
-from dataclasses import asdict
+from typing import Any, Dict, Iterator, List, Optional, Union, BinaryIO
+from dataclasses import asdict, dataclass
+from functools import lru_cache
 import uuid
 
+import orjson
 import pandas as pd
 import numpy as np
 from jinja2 import Environment, FileSystemLoader, Template
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_pdf import PdfPages
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.utils import PlotlyJSONEncoder
 import weasyprint
+from weasyprint.text.fonts import FontConfiguration
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.utils import get_column_letter
 from openpyxl.chart import LineChart, BarChart, PieChart, Reference
 from PIL import Image
 import base64
@@ -36,9 +47,152 @@ import base64
 from ..models.portfolio import Portfolio
 from ..models.market_data import Stock
 from ..utils.cache_service import CacheService
+from ..utils.redis_client import redis_manager
+from .xlsx_writer import ColumnArrays, _unique_sheet_names, write_workbook
 
 logger = logging.getLogger(__name__)
 
+# Shared style objects for write-only sheets; reusing the same instances keeps
+# openpyxl from registering a new style entry per cell.
+_TITLE_FONT = Font(size=16, bold=True)
+_HEADER_FONT = Font(bold=True)
+_HEADER_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+_MAX_COLUMN_WIDTH = 50
+
+# Above this many table rows Excel exports switch to xlsxwriter's
+# constant_memory mode, which flushes each row as soon as it is written
+_CONSTANT_MEMORY_ROW_THRESHOLD = 50_000
+
+# Above this many table cells the workbook is written as plain OOXML, skipping
+# per-cell spreadsheet objects (and styling) altogether
+_FAST_XML_CELL_THRESHOLD = 100_000
+
+# Sheet name used for each section type that gets its own sheet, when untitled
+_SECTION_SHEET_DEFAULTS = {"table": "Table", "chart": "Chart", "metric": "Metrics"}
+
+# The handful of seaborn-style settings the report charts rely on, applied
+# instead of loading a whole matplotlib style sheet
+_CHART_RC = {
+    'axes.facecolor': '#EAEAF2',
+    'axes.edgecolor': 'white',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'grid.color': 'white',
+}
+_IMAGE_FIGSIZE = (12, 8)
+_IMAGE_DPI = 150
+
+_TEMPLATE_DIR = 'templates'
+_REPORT_STYLESHEET = 'report_styles.css'
+_REPORT_TEMPLATE = 'report_template.html'
+_TEMPLATE_STREAM_BUFFER = 64
+_HTML_CACHE_TTL = 300
+_CHART_CACHE_TTL = 300
+_EMBED_CHART_DPI = 100
+_LINK_TAG_RE = re.compile(r"<link\b[^>]*>", re.IGNORECASE)
+
+# Templates don't change while the process runs, so compiled templates are
+# kept without re-checking the files on every render
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(_TEMPLATE_DIR),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    cache_size=400,
+    auto_reload=False
+)
+
+
+@lru_cache(maxsize=1)
+def _report_template() -> Template:
+    """Compile the report template once per process"""
+    return _JINJA_ENV.get_template(_REPORT_TEMPLATE)
+
+
+@lru_cache(maxsize=1)
+def _load_report_styles() -> str:
+    """Read the report stylesheet shared by the HTML and PDF exports"""
+    with open(os.path.join(_TEMPLATE_DIR, _REPORT_STYLESHEET), encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=1)
+def _pdf_stylesheet():
+    """Font configuration and pre-parsed report CSS reused by every PDF export"""
+    font_config = FontConfiguration()
+    return font_config, weasyprint.CSS(string=_load_report_styles(), font_config=font_config)
+
+
+# CPU-bound rendering (WeasyPrint, openpyxl/xlsxwriter, matplotlib) runs in a
+# shared process pool so exports don't block the event loop
+_EXPORT_WORKERS = os.cpu_count() or 1
+_export_pool: Optional[ProcessPoolExecutor] = None
+_worker_service: Optional["ExportService"] = None
+
+
+def _get_export_pool() -> ProcessPoolExecutor:
+    """Get the shared export process pool, creating it on first use"""
+    global _export_pool
+    if _export_pool is None:
+        # Workers start from a clean forkserver process rather than forking the
+        # server, whose threads (event loop, client pools) may hold locks
+        _export_pool = ProcessPoolExecutor(
+            max_workers=_EXPORT_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_preload_export_worker
+        )
+    return _export_pool
+
+
+def shutdown_export_pool() -> None:
+    """Shut down the shared export process pool"""
+    global _export_pool
+    if _export_pool is not None:
+        _export_pool.shutdown(wait=False, cancel_futures=True)
+        _export_pool = None
+
+
+def _preload_export_worker() -> None:
+    """Warm a new pool worker so its first export pays no start-up cost"""
+    global _worker_service
+    try:
+        _worker_service = ExportService()
+        _pdf_stylesheet()
+        _report_template()
+        
+        # Drawing once initialises the Agg canvas and font cache
+        fig = _worker_service._acquire_figure()
+        fig.add_subplot(111).plot([0, 1])
+        fig.canvas.draw()
+        _worker_service._release_figure(fig)
+    except Exception as e:
+        # A failing initializer would break the whole pool; the worker just
+        # falls back to warming up on its first export
+        logger.warning(f"Export worker warm-up failed: {str(e)}")
+
+
+def _run_export_worker(method_name: str, *args) -> bytes:
+    """Run a synchronous ExportService render method inside a pool worker"""
+    global _worker_service
+    if _worker_service is None:
+        _worker_service = ExportService()
+    return getattr(_worker_service, method_name)(*args)
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback: numpy values become native Python values, anything else a string"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def _export_cache_key(kind: str, value: Any) -> str:
+    """Cache key for a render derived from report data, e.g. HTML or chart images"""
+    payload = orjson.dumps(value, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return f"export:{kind}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+
 
 class ExportFormat:
     """Export format constants"""
@@ -48,6 +202,128 @@ class ExportFormat:
     IMAGE = "image"
     CSV = "csv"
     JSON = "json"
+    PARQUET = "parquet"
+    FEATHER = "feather"
+
+
+_MIME_TYPES = {
+    ExportFormat.PDF: "application/pdf",
+    ExportFormat.EXCEL: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExportFormat.HTML: "text/html",
+    ExportFormat.IMAGE: "image/png",
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.JSON: "application/json",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+    ExportFormat.FEATHER: "application/vnd.apache.arrow.file"
+}
+
+_FILE_EXTENSIONS = {
+    ExportFormat.PDF: ".pdf",
+    ExportFormat.EXCEL: ".xlsx",
+    ExportFormat.HTML: ".html",
+    ExportFormat.IMAGE: ".png",
+    ExportFormat.CSV: ".csv",
+    ExportFormat.JSON: ".json",
+    ExportFormat.PARQUET: ".parquet",
+    ExportFormat.FEATHER: ".feather"
+}
+
+_FORMAT_CAPABILITIES = {
+    ExportFormat.PDF: ["text", "tables", "charts", "images", "styling"],
+    ExportFormat.EXCEL: ["tables", "charts", "formulas", "multiple_sheets"],
+    ExportFormat.HTML: ["text", "tables", "charts", "interactive", "responsive"],
+    ExportFormat.IMAGE: ["charts", "visualizations"],
+    ExportFormat.CSV: ["tables", "data"],
+    ExportFormat.JSON: ["structured_data", "metadata"],
+    ExportFormat.PARQUET: ["tables", "data", "columnar", "compression"],
+    ExportFormat.FEATHER: ["tables", "data", "columnar"]
+}
+
+
+def _format_info(export_format: str) -> Dict[str, Any]:
+    """Metadata describing an export format"""
+    return {
+        "format": export_format,
+        "supported": True,
+        "mime_type": _MIME_TYPES.get(export_format, "application/octet-stream"),
+        "file_extension": _FILE_EXTENSIONS.get(export_format, ".bin"),
+        "capabilities": _FORMAT_CAPABILITIES.get(export_format, [])
+    }
+
+
+# Format metadata never changes, so it is built once
+_EXPORT_INFO = {export_format: _format_info(export_format) for export_format in _MIME_TYPES}
+
+
+@dataclass(slots=True, frozen=True)
+class TableData:
+    """Column-oriented table: one contiguous array per column"""
+    columns: List[Any]
+    arrays: List[np.ndarray]
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "TableData":
+        return cls(list(df.columns), [df.iloc[:, i].to_numpy() for i in range(df.shape[1])])
+    
+    @property
+    def n_rows(self) -> int:
+        return len(self.arrays[0]) if self.arrays else 0
+    
+    @property
+    def size(self) -> int:
+        return self.n_rows * len(self.arrays)
+    
+    def rows(self) -> Iterator[tuple]:
+        """Yield rows by zipping the columns, converted to Python values once per column"""
+        return zip(*(_column_values(arr) for arr in self.arrays))
+    
+    def to_frame(self) -> pd.DataFrame:
+        frame = pd.DataFrame(dict(enumerate(self.arrays)), copy=False)
+        frame.columns = self.columns
+        return frame
+
+
+def _max_text_width(arr: np.ndarray) -> int:
+    """Length of the longest value in a column once rendered as text"""
+    if not len(arr):
+        return 0
+    if arr.dtype.kind in 'biu':
+        # The widest integer (or boolean) is always one of the extremes
+        return max(len(str(arr.min())), len(str(arr.max())))
+    return int(pd.Series(arr, copy=False).astype(str).str.len().max())
+
+
+class _TemplateReader(io.RawIOBase):
+    """Read-only binary stream over the text chunks of a streamed template"""
+    
+    def __init__(self, chunks: Iterator[str]):
+        self._chunks = iter(chunks)
+        self._pending = b""
+        self._offset = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        while self._offset >= len(self._pending):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = chunk.encode('utf-8')
+            self._offset = 0
+        
+        size = min(len(buffer), len(self._pending) - self._offset)
+        buffer[:size] = self._pending[self._offset:self._offset + size]
+        self._offset += size
+        return size
+
+
+def _column_values(arr: np.ndarray) -> list:
+    """Convert a column to native Python values in a single call"""
+    if arr.dtype.kind == 'M':
+        # datetime64[ns].tolist() yields integers; microsecond resolution yields datetimes
+        return arr.astype('datetime64[us]').tolist()
+    return arr.tolist()
 
 
 class ExportService:
@@ -56,17 +332,15 @@ class ExportService:
     def __init__(self):
         self.cache_service = CacheService()
         
-        # Initialize Jinja2 environment for HTML templates
-        self.jinja_env = Environment(
-            loader=FileSystemLoader('templates'),
-            autoescape=True,
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        # Shared Jinja2 environment for HTML templates
+        self.jinja_env = _JINJA_ENV
         
         # Set up matplotlib style
-        plt.style.use('seaborn-v0_8')
+        plt.rcParams.update(_CHART_RC)
         sns.set_palette("husl")
+        
+        # Agg-backed figures reused across image exports
+        self._fig_pool: queue.SimpleQueue = queue.SimpleQueue()
     
     async def export_report(
         self, 
@@ -90,6 +364,10 @@ class ExportService:
                 return await self._export_to_csv(report_content, options)
             elif export_format == ExportFormat.JSON:
                 return await self._export_to_json(report_content, options)
+            elif export_format == ExportFormat.PARQUET:
+                return await self._export_to_parquet(report_content, options)
+            elif export_format == ExportFormat.FEATHER:
+                return await self._export_to_feather(report_content, options)
             else:
                 raise ValueError(f"Unsupported export format: {export_format}")
                 
@@ -100,62 +378,262 @@ class ExportService:
     async def _export_to_pdf(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
         """Export report to PDF format"""
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-                temp_path = temp_file.name
-            
-            # Generate HTML content first
-            html_content = await self._generate_html_content(content, options)
-            
-            # Convert HTML to PDF using WeasyPrint
-            weasyprint.HTML(string=html_content).write_pdf(temp_path)
-            
-            # Read the generated PDF
-            with open(temp_path, 'rb') as f:
-                pdf_content = f.read()
+            # Reuse the HTML of a recent preview of the same report, if any
+            html_content = await self._cache_get(_export_cache_key("html", (content, options or {})))
+            chart_images = await self._get_chart_images(content) if html_content is None else None
             
-            # Clean up temporary file
-            os.unlink(temp_path)
-            
-            return pdf_content
+            return await self._run_in_pool("_render_pdf", content, options, html_content, chart_images)
             
         except Exception as e:
             logger.error(f"PDF export failed: {str(e)}")
             raise
     
+    async def _run_in_pool(self, method_name: str, *args) -> bytes:
+        """Run a synchronous render method in the export process pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_export_pool(), _run_export_worker, method_name, *args)
+    
+    def _render_pdf(
+        self,
+        content: Dict[str, Any],
+        options: Optional[Dict[str, Any]] = None,
+        html_content: Optional[str] = None,
+        chart_images: Optional[Dict[int, str]] = None
+    ) -> bytes:
+        """Render the report to PDF bytes in a single pass: HTML source ->
+        parsed document -> PDF, with the stylesheet parsed once per process"""
+        font_config, report_css = _pdf_stylesheet()
+        document = self._pdf_document(content, options, html_content, chart_images)
+        
+        # Without a target the document is returned as bytes, so nothing
+        # touches the disk
+        return document.write_pdf(stylesheets=[report_css], font_config=font_config)
+    
+    def _pdf_document(
+        self,
+        content: Dict[str, Any],
+        options: Optional[Dict[str, Any]],
+        html_content: Optional[str],
+        chart_images: Optional[Dict[int, str]]
+    ) -> weasyprint.HTML:
+        """Parse the report HTML, from a cached render or streamed from the template"""
+        if html_content is not None:
+            return weasyprint.HTML(string=html_content, base_url='.')
+        
+        try:
+            # Stream the template straight into WeasyPrint's parser rather than
+            # building the whole HTML string; the stylesheet is passed
+            # pre-parsed instead of being embedded
+            stream = _report_template().stream(
+                content=content,
+                options=options or {},
+                generated_at=datetime.now().isoformat(),
+                chart_images=chart_images or {}
+            )
+            stream.enable_buffering(_TEMPLATE_STREAM_BUFFER)
+            return weasyprint.HTML(
+                file_obj=io.BufferedReader(_TemplateReader(stream)),
+                encoding='utf-8',
+                base_url='.'
+            )
+        except Exception as e:
+            logger.error(f"HTML generation failed: {str(e)}")
+            # Fallback to simple HTML, dropping stray <link> tags so WeasyPrint
+            # doesn't fetch and parse extra stylesheets
+            return weasyprint.HTML(string=_LINK_TAG_RE.sub("", self._generate_simple_html(content)))
+    
     async def _export_to_excel(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
         """Export report to Excel format"""
         try:
-            # Create workbook
-            wb = Workbook()
+            options = options or {}
+            sections = content.get("sections", [])
             
-            # Remove default sheet
-            wb.remove(wb.active)
+            # Resolve table data up front so the writer can be picked by size
+            tables = [
+                await self._extract_table_data(section, content) if section.get("type") == "table" else None
+                for section in sections
+            ]
+            engine = self._select_excel_engine(tables, options)
             
-            # Create summary sheet
-            summary_sheet = wb.create_sheet("Summary")
-            await self._populate_summary_sheet(summary_sheet, content)
-            
-            # Process each section
-            for section in content.get("sections", []):
-                if section.get("type") == "table":
-                    await self._create_table_sheet(wb, section, content)
-                elif section.get("type") == "chart":
-                    await self._create_chart_sheet(wb, section, content)
-                elif section.get("type") == "metric":
-                    await self._create_metrics_sheet(wb, section, content)
-            
-            # Save to bytes
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
-            
-            return output.getvalue()
+            return await self._run_in_pool("_render_excel", content, sections, tables, engine)
             
         except Exception as e:
             logger.error(f"Excel export failed: {str(e)}")
             raise
     
+    def _render_excel(
+        self,
+        content: Dict[str, Any],
+        sections: List[Dict[str, Any]],
+        tables: List[Optional[TableData]],
+        engine: str
+    ) -> bytes:
+        """Write the workbook with the selected engine and return its bytes"""
+        if engine == "xml":
+            output = io.BytesIO()
+            write_workbook(output, self._excel_sheet_specs(content, sections, tables))
+            return output.getvalue()
+        if engine == "xlsxwriter":
+            try:
+                return self._export_to_excel_constant_memory(content, sections, tables)
+            except ImportError:
+                logger.warning("xlsxwriter is not installed; falling back to openpyxl write-only mode")
+        
+        # Write-only workbooks stream rows straight to XML (via lxml when
+        # installed) instead of keeping every cell in memory
+        wb = Workbook(write_only=True)
+        
+        # Create summary sheet
+        summary_sheet = wb.create_sheet("Summary")
+        self._populate_summary_sheet(summary_sheet, content)
+        
+        # Process each section
+        for section, table, sheet_name in zip(sections, tables, self._excel_sheet_names(sections)):
+            if section.get("type") == "table":
+                self._create_table_sheet(wb, section, table, sheet_name)
+            elif section.get("type") == "chart":
+                self._create_chart_sheet(wb, section, sheet_name)
+            elif section.get("type") == "metric":
+                self._create_metrics_sheet(wb, section, sheet_name)
+        
+        # Save to bytes
+        output = io.BytesIO()
+        wb.save(output)
+        output.seek(0)
+        
+        return output.getvalue()
+    
+    def _select_excel_engine(self, tables: List[Optional[TableData]], options: Dict[str, Any]) -> str:
+        """Pick the Excel writer from explicit options or the table sizes"""
+        if options.get("engine"):
+            return options["engine"]
+        if options.get("fast_xml"):
+            return "xml"
+        
+        present = [table for table in tables if table is not None]
+        if sum(table.size for table in present) > _FAST_XML_CELL_THRESHOLD:
+            return "xml"
+        if sum(table.n_rows for table in present) > _CONSTANT_MEMORY_ROW_THRESHOLD:
+            return "xlsxwriter"
+        return "openpyxl"
+    
+    def _excel_sheet_names(self, sections: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """Excel-safe sheet names, unique alongside Summary, per section (None when it gets no sheet)"""
+        sheet_sections = [
+            (idx, section.get('title') or _SECTION_SHEET_DEFAULTS[section.get("type")])
+            for idx, section in enumerate(sections)
+            if section.get("type") in _SECTION_SHEET_DEFAULTS
+        ]
+        names: List[Optional[str]] = [None] * len(sections)
+        unique = _unique_sheet_names(["Summary"] + [title for _, title in sheet_sections])[1:]
+        for (idx, _), name in zip(sheet_sections, unique):
+            names[idx] = name
+        return names
+    
+    def _excel_sheet_specs(
+        self,
+        content: Dict[str, Any],
+        sections: List[Dict[str, Any]],
+        tables: List[Optional[TableData]]
+    ) -> List[tuple]:
+        """Describe the workbook as (name, header, rows) sheets for the direct XML writer"""
+        summary_rows = [
+            [],
+            ['Generated At:', content.get('generated_at', '')],
+            ['Type:', content.get('type', '')],
+            [],
+            ['Sections:']
+        ] + [[section.get('title', ''), section.get('type', '')] for section in sections]
+        sheets = [("Summary", [content.get('title', 'Report')], summary_rows)]
+        
+        for section, table, sheet_name in zip(sections, tables, self._excel_sheet_names(sections)):
+            section_type = section.get("type")
+            if section_type == "table":
+                if table is not None and table.n_rows:
+                    sheets.append((sheet_name, table.columns, ColumnArrays(table.arrays)))
+                else:
+                    sheets.append((sheet_name, [], []))
+            elif section_type == "chart":
+                sheets.append((sheet_name, [f"Chart: {section.get('title', '')}"], []))
+            elif section_type == "metric":
+                sheets.append((
+                    sheet_name,
+                    ['Metric', 'Value'],
+                    [[metric.get('name', ''), metric.get('value', '')] for metric in section.get('metrics', [])]
+                ))
+        
+        return sheets
+    
+    def _export_to_excel_constant_memory(
+        self,
+        content: Dict[str, Any],
+        sections: List[Dict[str, Any]],
+        tables: List[Optional[TableData]]
+    ) -> bytes:
+        """Export report to Excel with xlsxwriter in constant_memory mode"""
+        # Only the large-table path needs xlsxwriter, so it is imported here
+        import xlsxwriter
+        
+        output = io.BytesIO()
+        wb = xlsxwriter.Workbook(output, {
+            'constant_memory': True,
+            'strings_to_numbers': False,
+            'nan_inf_to_errors': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+        })
+        title_format = wb.add_format({'bold': True, 'font_size': 16})
+        header_format = wb.add_format({'bold': True, 'bg_color': '#CCCCCC'})
+        bold_format = wb.add_format({'bold': True})
+        
+        # Summary sheet
+        sheet = wb.add_worksheet("Summary")
+        metadata = [
+            [],
+            ['Generated At:', content.get('generated_at', '')],
+            ['Type:', content.get('type', '')],
+            []
+        ]
+        row = self._write_rows(sheet, [content.get('title', 'Report')], metadata, title_format)
+        self._write_rows(
+            sheet,
+            ['Sections:'],
+            ([section.get('title', ''), section.get('type', '')] for section in sections),
+            bold_format,
+            start_row=row
+        )
+        
+        for section, table, sheet_name in zip(sections, tables, self._excel_sheet_names(sections)):
+            section_type = section.get("type")
+            if section_type == "table":
+                sheet = wb.add_worksheet(sheet_name)
+                if table is not None and table.n_rows:
+                    # Widths have to be known before rows are flushed
+                    for idx, width in enumerate(self._column_widths(table)):
+                        sheet.set_column(idx, idx, width)
+                    self._write_rows(sheet, table.columns, table.rows(), header_format)
+            elif section_type == "chart":
+                sheet = wb.add_worksheet(sheet_name)
+                sheet.write_row(0, 0, [f"Chart: {section.get('title', '')}"], bold_format)
+            elif section_type == "metric":
+                sheet = wb.add_worksheet(sheet_name)
+                self._write_rows(
+                    sheet,
+                    ['Metric', 'Value'],
+                    ([metric.get('name', ''), metric.get('value', '')] for metric in section.get('metrics', [])),
+                    bold_format
+                )
+        
+        wb.close()
+        return output.getvalue()
+    
+    def _write_rows(self, sheet, header: List[Any], rows, header_format, start_row: int = 0) -> int:
+        """Write a formatted header and then each row in order, returning the next free row"""
+        sheet.write_row(start_row, 0, header, header_format)
+        row_idx = start_row
+        for row_idx, row in enumerate(rows, start_row + 1):
+            sheet.write_row(row_idx, 0, row)
+        return row_idx + 1
+    
     async def _export_to_html(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
         """Export report to HTML format"""
         try:
@@ -171,87 +649,217 @@ class ExportService:
     async def _export_to_image(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
         """Export report to image format"""
         try:
-            # Create figure
-            fig, ax = plt.subplots(figsize=(12, 8))
+            return await self._run_in_pool("_render_image", content, options)
+            
+        except Exception as e:
+            logger.error(f"Image export failed: {str(e)}")
+            raise
+    
+    def _render_image(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
+        """Render the report chart to PNG bytes"""
+        fig = self._acquire_figure()
+        try:
+            ax = fig.add_subplot(111)
             
             # Generate chart based on content
-            await self._generate_chart_image(fig, ax, content, options)
+            self._generate_chart_image(fig, ax, content, options)
             
-            # Save to bytes
+            # Save to bytes; callers can opt into print resolution via options['dpi']
             output = io.BytesIO()
-            fig.savefig(output, format='png', dpi=300, bbox_inches='tight')
-            output.seek(0)
-            
-            plt.close(fig)
+            fig.savefig(output, format='png', dpi=(options or {}).get('dpi', _IMAGE_DPI), bbox_inches='tight')
             
             return output.getvalue()
-            
-        except Exception as e:
-            logger.error(f"Image export failed: {str(e)}")
-            raise
+        finally:
+            self._release_figure(fig)
+    
+    def _acquire_figure(self) -> Figure:
+        """Take a figure from the pool, creating an Agg-backed one when it is empty"""
+        try:
+            return self._fig_pool.get_nowait()
+        except queue.Empty:
+            fig = Figure(figsize=_IMAGE_FIGSIZE)
+            FigureCanvasAgg(fig)
+            return fig
+    
+    def _release_figure(self, fig: Figure):
+        """Clear a figure and return it to the pool"""
+        fig.clear()
+        self._fig_pool.put(fig)
+    
+    def _render_chart_images(self, sections: List[Dict[str, Any]]) -> List[str]:
+        """Render chart sections to base64 PNGs for embedding in HTML and PDF reports"""
+        images = []
+        for section in sections:
+            fig = self._acquire_figure()
+            try:
+                self._create_chart_from_section(fig, fig.add_subplot(111), section, {})
+                output = io.BytesIO()
+                fig.savefig(output, format='png', dpi=_EMBED_CHART_DPI)
+                images.append(base64.b64encode(output.getvalue()).decode('ascii'))
+            finally:
+                self._release_figure(fig)
+        return images
     
     async def _export_to_csv(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
         """Export report to CSV format"""
         try:
-            # Find table sections
-            table_sections = [s for s in content.get("sections", []) if s.get("type") == "table"]
-            
-            if not table_sections:
-                # Create a simple CSV with basic information
-                df = pd.DataFrame([{
-                    "Report Title": content.get("title", ""),
-                    "Generated At": content.get("generated_at", ""),
-                    "Type": content.get("type", "")
-                }])
-            else:
-                # Use the first table section
-                table_section = table_sections[0]
-                df = await self._extract_table_data(table_section, content)
+            df = await self._get_primary_table(content)
             
-            # Convert to CSV
-            csv_content = df.to_csv(index=False)
+            # Write straight into a bytes buffer, optionally compressed
+            # (e.g. options={'compression': 'gzip'}), instead of building a
+            # str and encoding it afterwards
+            output = io.BytesIO()
+            df.to_csv(output, index=False, encoding='utf-8', compression=(options or {}).get('compression'))
             
-            return csv_content.encode('utf-8')
+            return output.getvalue()
             
         except Exception as e:
             logger.error(f"CSV export failed: {str(e)}")
             raise
     
-    async def _export_to_json(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
-        """Export report to JSON format"""
+    async def _export_to_parquet(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
+        """Export report table to Parquet format"""
         try:
-            # Convert content to JSON
-            json_content = json.dumps(content, indent=2, default=str)
+            df = await self._get_primary_table(content)
             
-            return json_content.encode('utf-8')
+            output = io.BytesIO()
+            df.to_parquet(output, engine='pyarrow', compression='zstd', index=False)
+            
+            return output.getvalue()
             
         except Exception as e:
-            logger.error(f"JSON export failed: {str(e)}")
+            logger.error(f"Parquet export failed: {str(e)}")
             raise
     
-    async def _generate_html_content(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> str:
-        """Generate HTML content for the report"""
+    async def _export_to_feather(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
+        """Export report table to Feather (Arrow IPC) format"""
         try:
-            # Load HTML template
-            template = self.jinja_env.get_template('report_template.html')
+            df = await self._get_primary_table(content)
             
-            # Prepare context
-            context = {
-                "content": content,
-                "options": options or {},
-                "generated_at": datetime.now().isoformat(),
-                "styles": self._get_report_styles()
-            }
+            output = io.BytesIO()
+            df.to_feather(output)
             
-            # Render template
-            html_content = template.render(**context)
+            return output.getvalue()
             
-            return html_content
+        except Exception as e:
+            logger.error(f"Feather export failed: {str(e)}")
+            raise
+    
+    async def _get_primary_table(self, content: Dict[str, Any]) -> Optional[pd.DataFrame]:
+        """Get the first table of the report, or a one-row summary when there is none"""
+        # Find table sections
+        table_sections = [s for s in content.get("sections", []) if s.get("type") == "table"]
+        
+        if not table_sections:
+            # Create a simple table with basic information
+            return pd.DataFrame([{
+                "Report Title": content.get("title", ""),
+                "Generated At": content.get("generated_at", ""),
+                "Type": content.get("type", "")
+            }])
+        
+        # Use the first table section
+        table = await self._extract_table_data(table_sections[0], content)
+        return table.to_frame() if table is not None else None
+    
+    async def _export_to_json(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> bytes:
+        """Export report to JSON format"""
+        try:
+            # orjson emits bytes directly and handles numpy natively; values it
+            # can't (complex, float16, object arrays) go through .item()/.tolist()
+            # and datetimes through ``str`` to keep the previous formatting
+            return orjson.dumps(
+                content,
+                default=_json_default,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_NON_STR_KEYS
+                )
+            )
             
         except Exception as e:
-            logger.error(f"HTML generation failed: {str(e)}")
+            logger.error(f"JSON export failed: {str(e)}")
+            raise
+    
+    async def _generate_html_content(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> str:
+        """Generate HTML content for the report"""
+        html_content = await self._render_report_html(content, options)
+        if html_content is None:
             # Fallback to simple HTML
             return self._generate_simple_html(content)
+        
+        # The cached render carries no styles (PDF exports pass them
+        # pre-parsed), so embed the stylesheet for standalone HTML
+        return html_content.replace("</head>", f"<style>\n{_load_report_styles()}</style>\n</head>", 1)
+    
+    async def _render_report_html(self, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Render the report template, reusing a recent render of the same report"""
+        cache_key = _export_cache_key("html", (content, options or {}))
+        cached_html = await self._cache_get(cache_key)
+        if cached_html is not None:
+            return cached_html
+        
+        chart_images = await self._get_chart_images(content)
+        
+        try:
+            # Render the precompiled template
+            html_content = _report_template().render(
+                content=content,
+                options=options or {},
+                generated_at=datetime.now().isoformat(),
+                chart_images=chart_images
+            )
+        except Exception as e:
+            logger.error(f"HTML generation failed: {str(e)}")
+            return None
+        
+        await self._cache_set(cache_key, html_content, _HTML_CACHE_TTL)
+        return html_content
+    
+    async def _get_chart_images(self, content: Dict[str, Any]) -> Dict[int, str]:
+        """Base64 PNGs for the report's chart sections, keyed by section index"""
+        chart_images: Dict[int, str] = {}
+        missing = []
+        
+        for idx, section in enumerate(content.get("sections", [])):
+            if section.get("type") != "chart":
+                continue
+            cache_key = _export_cache_key("chart", section)
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                chart_images[idx] = cached
+            else:
+                missing.append((idx, section, cache_key))
+        
+        if missing:
+            try:
+                rendered = await self._run_in_pool("_render_chart_images", [section for _, section, _ in missing])
+            except Exception as e:
+                logger.error(f"Error rendering chart images: {str(e)}")
+                return chart_images
+            
+            for (idx, _, cache_key), image in zip(missing, rendered):
+                chart_images[idx] = image
+                await self._cache_set(cache_key, image, _CHART_CACHE_TTL)
+        
+        return chart_images
+    
+    async def _cache_get(self, cache_key: str) -> Optional[str]:
+        """Get a cached export render"""
+        try:
+            return await redis_manager.get(cache_key)
+        except Exception as e:
+            logger.error(f"Error getting cached export render: {e}")
+        return None
+    
+    async def _cache_set(self, cache_key: str, value: str, ttl: int):
+        """Cache an export render"""
+        try:
+            await redis_manager.set(cache_key, value, expire=ttl)
+        except Exception as e:
+            logger.error(f"Error caching export render: {e}")
     
     def _generate_simple_html(self, content: Dict[str, Any]) -> str:
         """Generate simple HTML as fallback"""
@@ -297,132 +905,114 @@ class ExportService:
         # This would be implemented based on the metrics data structure
         return "<p>Metrics content would be rendered here</p>"
     
-    async def _populate_summary_sheet(self, sheet, content: Dict[str, Any]):
+    def _styled_cell(self, sheet, value: Any, font: Font = _HEADER_FONT, fill: Optional[PatternFill] = None) -> WriteOnlyCell:
+        """Create a write-only cell carrying one of the shared styles"""
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        return cell
+    
+    def _populate_summary_sheet(self, sheet, content: Dict[str, Any]):
         """Populate Excel summary sheet"""
         try:
             # Add title
-            sheet['A1'] = content.get('title', 'Report')
-            sheet['A1'].font = Font(size=16, bold=True)
+            sheet.append([self._styled_cell(sheet, content.get('title', 'Report'), _TITLE_FONT)])
+            sheet.append([])
             
             # Add metadata
-            row = 3
-            sheet[f'A{row}'] = 'Generated At:'
-            sheet[f'B{row}'] = content.get('generated_at', '')
-            row += 1
-            
-            sheet[f'A{row}'] = 'Type:'
-            sheet[f'B{row}'] = content.get('type', '')
-            row += 1
+            sheet.append(['Generated At:', content.get('generated_at', '')])
+            sheet.append(['Type:', content.get('type', '')])
             
             # Add section summary
-            row += 1
-            sheet[f'A{row}'] = 'Sections:'
-            sheet[f'A{row}'].font = Font(bold=True)
-            row += 1
+            sheet.append([])
+            sheet.append([self._styled_cell(sheet, 'Sections:')])
             
             for section in content.get("sections", []):
-                sheet[f'A{row}'] = section.get('title', '')
-                sheet[f'B{row}'] = section.get('type', '')
-                row += 1
+                sheet.append([section.get('title', ''), section.get('type', '')])
                 
         except Exception as e:
             logger.error(f"Error populating summary sheet: {str(e)}")
     
-    async def _create_table_sheet(self, wb, section: Dict[str, Any], content: Dict[str, Any]):
+    def _create_table_sheet(self, wb, section: Dict[str, Any], table: Optional[TableData], sheet_name: str):
         """Create Excel sheet for table section"""
         try:
             # Create sheet
-            sheet_name = section.get('title', 'Table')[:31]  # Excel sheet name limit
             sheet = wb.create_sheet(sheet_name)
             
-            # Extract table data
-            df = await self._extract_table_data(section, content)
-            
-            if df is not None and not df.empty:
-                # Add data to sheet
-                for r in dataframe_to_rows(df, index=False, header=True):
-                    sheet.append(r)
+            if table is not None and table.n_rows:
+                # Column widths must be set before the first row is written,
+                # since write-only sheets cannot be read back
+                for idx, width in enumerate(self._column_widths(table), start=1):
+                    sheet.column_dimensions[get_column_letter(idx)].width = width
                 
-                # Style the header
-                for cell in sheet[1]:
-                    cell.font = Font(bold=True)
-                    cell.fill = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
-                
-                # Auto-adjust column widths
-                for column in sheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    sheet.column_dimensions[column_letter].width = adjusted_width
+                # Styled header row followed by the data rows
+                sheet.append([self._styled_cell(sheet, column, fill=_HEADER_FILL) for column in table.columns])
+                for row in table.rows():
+                    sheet.append(row)
                     
         except Exception as e:
             logger.error(f"Error creating table sheet: {str(e)}")
     
-    async def _create_chart_sheet(self, wb, section: Dict[str, Any], content: Dict[str, Any]):
+    def _column_widths(self, table: TableData) -> List[int]:
+        """Column widths sized to the longest header or value, capped"""
+        header_widths = np.array([len(str(column)) for column in table.columns], dtype=np.int64)
+        data_widths = np.array([_max_text_width(arr) for arr in table.arrays], dtype=np.int64)
+        return (np.maximum(header_widths, data_widths).clip(0, _MAX_COLUMN_WIDTH - 2) + 2).tolist()
+    
+    def _create_chart_sheet(self, wb, section: Dict[str, Any], sheet_name: str):
         """Create Excel sheet for chart section"""
         try:
             # Create sheet
-            sheet_name = section.get('title', 'Chart')[:31]
             sheet = wb.create_sheet(sheet_name)
             
             # This would generate chart data and create Excel charts
             # For now, add placeholder
-            sheet['A1'] = f"Chart: {section.get('title', '')}"
-            sheet['A1'].font = Font(bold=True)
+            sheet.append([self._styled_cell(sheet, f"Chart: {section.get('title', '')}")])
             
         except Exception as e:
             logger.error(f"Error creating chart sheet: {str(e)}")
     
-    async def _create_metrics_sheet(self, wb, section: Dict[str, Any], content: Dict[str, Any]):
+    def _create_metrics_sheet(self, wb, section: Dict[str, Any], sheet_name: str):
         """Create Excel sheet for metrics section"""
         try:
             # Create sheet
-            sheet_name = section.get('title', 'Metrics')[:31]
             sheet = wb.create_sheet(sheet_name)
             
             # Add metrics data
             metrics = section.get('metrics', [])
             
-            sheet['A1'] = 'Metric'
-            sheet['B1'] = 'Value'
-            sheet['A1'].font = Font(bold=True)
-            sheet['B1'].font = Font(bold=True)
+            sheet.append([self._styled_cell(sheet, 'Metric'), self._styled_cell(sheet, 'Value')])
             
-            row = 2
             for metric in metrics:
-                sheet[f'A{row}'] = metric.get('name', '')
-                sheet[f'B{row}'] = metric.get('value', '')
-                row += 1
+                sheet.append([metric.get('name', ''), metric.get('value', '')])
                 
         except Exception as e:
             logger.error(f"Error creating metrics sheet: {str(e)}")
     
-    async def _extract_table_data(self, section: Dict[str, Any], content: Dict[str, Any]) -> Optional[pd.DataFrame]:
-        """Extract table data from section"""
+    async def _extract_table_data(self, section: Dict[str, Any], content: Dict[str, Any]) -> Optional[TableData]:
+        """Extract table data from section as one array per column"""
         try:
             data_source = section.get('data_source')
             if not data_source:
                 return None
             
             # This would extract data based on the data source
-            # For now, return a sample DataFrame
-            return pd.DataFrame({
-                'Column 1': [1, 2, 3],
-                'Column 2': ['A', 'B', 'C'],
-                'Column 3': [10.5, 20.3, 30.1]
-            })
+            # For now, return a sample table
+            return TableData(
+                columns=['Column 1', 'Column 2', 'Column 3'],
+                arrays=[
+                    np.array([1, 2, 3]),
+                    np.array(['A', 'B', 'C'], dtype=object),
+                    np.array([10.5, 20.3, 30.1])
+                ]
+            )
             
         except Exception as e:
             logger.error(f"Error extracting table data: {str(e)}")
             return None
     
-    async def _generate_chart_image(self, fig, ax, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None):
+    def _generate_chart_image(self, fig, ax, content: Dict[str, Any], options: Optional[Dict[str, Any]] = None):
         """Generate chart image"""
         try:
             # Find chart sections
@@ -430,7 +1020,7 @@ class ExportService:
             
             if chart_sections:
                 chart_section = chart_sections[0]
-                await self._create_chart_from_section(fig, ax, chart_section, content)
+                self._create_chart_from_section(fig, ax, chart_section, content)
             else:
                 # Create a simple summary chart
                 ax.text(0.5, 0.5, f"Report: {content.get('title', '')}", 
@@ -440,7 +1030,7 @@ class ExportService:
         except Exception as e:
             logger.error(f"Error generating chart image: {str(e)}")
     
-    async def _create_chart_from_section(self, fig, ax, section: Dict[str, Any], content: Dict[str, Any]):
+    def _create_chart_from_section(self, fig, ax, section: Dict[str, Any], content: Dict[str, Any]):
         """Create chart from section data"""
         try:
             chart_type = section.get('chart_type', 'line')
@@ -468,100 +1058,7 @@ class ExportService:
     
     def _get_report_styles(self) -> str:
         """Get CSS styles for HTML reports"""
-        return """
-        <style>
-            body {
-                font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 1200px;
-                margin: 0 auto;
-                padding: 20px;
-            }
-            .header {
-                border-bottom: 2px solid #007acc;
-                padding-bottom: 20px;
-                margin-bottom: 30px;
-            }
-            .header h1 {
-                color: #007acc;
-                margin: 0;
-                font-size: 2.5em;
-            }
-            .header .meta {
-                color: #666;
-                font-size: 0.9em;
-                margin-top: 10px;
-            }
-            .section {
-                margin-bottom: 40px;
-                page-break-inside: avoid;
-            }
-            .section h2 {
-                color: #007acc;
-                border-bottom: 1px solid #ddd;
-                padding-bottom: 10px;
-                margin-bottom: 20px;
-            }
-            .metrics-grid {
-                display: grid;
-                grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                gap: 20px;
-                margin-bottom: 30px;
-            }
-            .metric-card {
-                background: #f8f9fa;
-                border: 1px solid #e9ecef;
-                border-radius: 8px;
-                padding: 20px;
-                text-align: center;
-            }
-            .metric-value {
-                font-size: 2em;
-                font-weight: bold;
-                color: #007acc;
-                margin-bottom: 5px;
-            }
-            .metric-label {
-                color: #666;
-                font-size: 0.9em;
-            }
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin-bottom: 20px;
-            }
-            th, td {
-                border: 1px solid #ddd;
-                padding: 12px;
-                text-align: left;
-            }
-            th {
-                background-color: #f8f9fa;
-                font-weight: bold;
-                color: #333;
-            }
-            tr:nth-child(even) {
-                background-color: #f8f9fa;
-            }
-            .chart-container {
-                margin: 20px 0;
-                text-align: center;
-            }
-            .footer {
-                margin-top: 50px;
-                padding-top: 20px;
-                border-top: 1px solid #ddd;
-                color: #666;
-                font-size: 0.9em;
-                text-align: center;
-            }
-            @media print {
-                body { margin: 0; }
-                .section { page-break-inside: avoid; }
-            }
-        </style>
-        """
+        return _load_report_styles()
     
     async def batch_export(
         self, 
@@ -571,66 +1068,37 @@ class ExportService:
     ) -> Dict[str, bytes]:
         """Export multiple reports in batch"""
         try:
-            results = {}
+            # Reports render concurrently, bounded by the number of pool workers
+            semaphore = asyncio.Semaphore(_EXPORT_WORKERS)
             
-            for i, report in enumerate(reports):
-                try:
-                    export_data = await self.export_report(report, export_format, options)
-                    results[f"report_{i+1}"] = export_data
-                except Exception as e:
-                    logger.error(f"Failed to export report {i+1}: {str(e)}")
-                    results[f"report_{i+1}"] = None
+            async def export_one(i: int, report: Dict[str, Any]) -> Optional[bytes]:
+                async with semaphore:
+                    try:
+                        return await self.export_report(report, export_format, options)
+                    except Exception as e:
+                        logger.error(f"Failed to export report {i+1}: {str(e)}")
+                        return None
             
-            return results
+            exports = await asyncio.gather(*(export_one(i, report) for i, report in enumerate(reports)))
+            
+            return {f"report_{i+1}": export_data for i, export_data in enumerate(exports)}
             
         except Exception as e:
             logger.error(f"Batch export failed: {str(e)}")
             raise
     
-    async def get_export_info(self, export_format: str) -> Dict[str, Any]:
+    def get_export_info(self, export_format: str) -> Dict[str, Any]:
         """Get information about export format capabilities"""
-        info = {
-            "format": export_format,
-            "supported": True,
-            "mime_type": self._get_mime_type(export_format),
-            "file_extension": self._get_file_extension(export_format),
-            "capabilities": self._get_format_capabilities(export_format)
-        }
-        
-        return info
+        return _EXPORT_INFO.get(export_format) or _format_info(export_format)
     
     def _get_mime_type(self, export_format: str) -> str:
         """Get MIME type for export format"""
-        mime_types = {
-            ExportFormat.PDF: "application/pdf",
-            ExportFormat.EXCEL: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            ExportFormat.HTML: "text/html",
-            ExportFormat.IMAGE: "image/png",
-            ExportFormat.CSV: "text/csv",
-            ExportFormat.JSON: "application/json"
-        }
-        return mime_types.get(export_format, "application/octet-stream")
+        return _MIME_TYPES.get(export_format, "application/octet-stream")
     
     def _get_file_extension(self, export_format: str) -> str:
         """Get file extension for export format"""
-        extensions = {
-            ExportFormat.PDF: ".pdf",
-            ExportFormat.EXCEL: ".xlsx",
-            ExportFormat.HTML: ".html",
-            ExportFormat.IMAGE: ".png",
-            ExportFormat.CSV: ".csv",
-            ExportFormat.JSON: ".json"
-        }
-        return extensions.get(export_format, ".bin")
+        return _FILE_EXTENSIONS.get(export_format, ".bin")
     
     def _get_format_capabilities(self, export_format: str) -> List[str]:
         """Get capabilities for export format"""
-        capabilities = {
-            ExportFormat.PDF: ["text", "tables", "charts", "images", "styling"],
-            ExportFormat.EXCEL: ["tables", "charts", "formulas", "multiple_sheets"],
-            ExportFormat.HTML: ["text", "tables", "charts", "interactive", "responsive"],
-            ExportFormat.IMAGE: ["charts", "visualizations"],
-            ExportFormat.CSV: ["tables", "data"],
-            ExportFormat.JSON: ["structured_data", "metadata"]
-        }
-        return capabilities.get(export_format, [])
+        return _FORMAT_CAPABILITIES.get(export_format, [])
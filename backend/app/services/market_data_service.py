@@ -5,13 +5,21 @@ Handles integration with multiple financial data providers with fallback strateg
 """
 
 import asyncio
+import copy
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from decimal import Decimal
+from enum import Enum
 
 import httpx
+import orjson
+import pandas as pd
 import yfinance as yf
+from prometheus_client import Counter, Histogram
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, insert
 
@@ -26,77 +34,506 @@ from app.schemas.market_data import (
     StockNewsCreate, MarketSentimentCreate
 )
 from app.utils.logging import get_logger
+from app.utils.ratelimit import AsyncTokenBucket
 from app.utils.redis_client import redis_manager
 
 logger = get_logger(__name__)
 
+# Prometheus metrics
+CACHE_HITS = Counter(
+    "market_data_cache_hits_total",
+    "Market data response cache hits",
+    ["endpoint"]
+)
+CACHE_MISSES = Counter(
+    "market_data_cache_misses_total",
+    "Market data response cache misses",
+    ["endpoint"]
+)
+PROVIDER_REQUESTS = Counter(
+    "market_data_provider_requests_total",
+    "Market data provider requests by outcome (HTTP status or error type)",
+    ["provider", "endpoint", "status"]
+)
+PROVIDER_LATENCY = Histogram(
+    "market_data_provider_latency_seconds",
+    "Market data provider request latency in seconds, including retries",
+    ["provider", "endpoint"]
+)
+
+# Connection pool shared by every request a provider client makes; idle
+# connections are kept long enough to span dashboard refresh intervals
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30)
+
+# Response cache lifetimes (seconds), matched to how often each dataset changes
+_CACHE_TTLS = {
+    "quote": 10,
+    "quote_batch": 10,
+    "indices": 60,
+    "sentiment": 60,
+    "technical": 300,
+    "historical": 86400,
+    "profile": 7 * 86400,
+    "statements": 90 * 86400,
+}
+_MEMORY_CACHE_SIZE = 2048
+# NumPy scalars from pandas-built results serialize directly; naive datetimes are UTC
+_CACHE_DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+# Quotes are cheap, so a slow provider is abandoned sooner than for bulk history
+_QUOTE_TIMEOUT = 5.0
+
+# Upper bound on any single provider lookup, so one stalled provider cannot
+# hold up the fallback chain
+_PROVIDER_TIMEOUTS = {"quote": 8.0, "historical": 20.0, "profile": 10.0}
+
+# Yahoo Ticker objects kept per client, and how long a ticker's info is reused
+_YAHOO_TICKER_CACHE_SIZE = 1024
+_YAHOO_INFO_TTL = 30.0
+# yfinance calls are network-bound, so the pool is sized for I/O rather than CPUs
+_YAHOO_WORKERS = 32
+
+# Transient responses retried with jittered exponential backoff
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+_RETRY_INITIAL_WAIT = 0.2
+_RETRY_MAX_WAIT = 2.0
+# A longer Retry-After than this falls through to the next provider instead
+_RETRY_AFTER_LIMIT = 5.0
+
+# Consecutive provider failures that open its circuit, and how long it stays open
+_BREAKER_FAILURE_THRESHOLD = 5
+_BREAKER_RESET_TIMEOUT = 60.0
+
+# yfinance history columns mapped to price record fields, with their output types
+_HISTORY_COLUMNS = {"Open": "open", "High": "high", "Low": "low", "Close": "close", "Volume": "volume"}
+_HISTORY_DTYPES = {"open": "float64", "high": "float64", "low": "float64", "close": "float64", "volume": "int64"}
+
+# Most symbols FMP accepts in one comma-separated quote request
+_FMP_BATCH_SIZE = 50
+
+
+def _parse_percent(value: Any) -> float:
+    """Parse an Alpha Vantage percentage such as "1.25%"."""
+    return float(str(value).rstrip("%"))
+
+
+# Alpha Vantage GLOBAL_QUOTE fields: (standard key, source key, converter)
+_AV_QUOTE_FIELDS = (
+    ("price", "05. price", float),
+    ("change", "09. change", float),
+    ("changePercent", "10. change percent", _parse_percent),
+    ("volume", "06. volume", int),
+    ("high", "03. high", float),
+    ("low", "04. low", float),
+    ("open", "02. open", float),
+    ("previousClose", "08. previous close", float),
+)
+
+
+# FMP quote fields: (standard key, source key)
+_FMP_QUOTE_FIELDS = (
+    ("price", "price"),
+    ("change", "change"),
+    ("changePercent", "changesPercentage"),
+    ("volume", "volume"),
+    ("high", "dayHigh"),
+    ("low", "dayLow"),
+    ("open", "open"),
+    ("previousClose", "previousClose"),
+    ("marketCap", "marketCap"),
+    ("peRatio", "pe"),
+    ("eps", "eps"),
+)
+
+
+def _fmp_quote(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map an FMP quote onto the standard quote fields."""
+    quote = {"symbol": data.get("symbol")}
+    quote.update((key, data.get(source)) for key, source in _FMP_QUOTE_FIELDS)
+    quote["dividendYield"] = None  # Not part of FMP's quote endpoint
+    timestamp = data.get("timestamp")
+    quote["timestamp"] = (
+        datetime.utcfromtimestamp(timestamp) if timestamp else datetime.utcnow()
+    ).isoformat()
+    return quote
+
+
+def _history_records(history: pd.DataFrame) -> Optional[List[Dict[str, Any]]]:
+    """Convert a yfinance OHLCV frame to price records, a column at a time."""
+    if history.empty:
+        return None
+    frame = history[list(_HISTORY_COLUMNS)].rename(columns=_HISTORY_COLUMNS).astype(_HISTORY_DTYPES)
+    frame["adjusted_close"] = frame["close"]  # Simplified
+    frame.insert(0, "date", [timestamp.isoformat() for timestamp in history.index])
+    return frame.to_dict("records")
+
+
+def _intraday_quote(
+    symbol: str,
+    history: pd.DataFrame,
+    info: Dict[str, Any],
+    timestamp: str
+) -> Dict[str, Any]:
+    """Build a quote from the last intraday bar, read as scalars rather than a row."""
+    close = float(history["Close"].iat[-1])
+    open_ = float(history["Open"].iat[-1])
+    change = close - open_
+    return {
+        "symbol": symbol,
+        "price": close,
+        "change": change,
+        "changePercent": change / open_ * 100 if open_ else 0.0,
+        "volume": int(history["Volume"].iat[-1]),
+        "high": float(history["High"].iat[-1]),
+        "low": float(history["Low"].iat[-1]),
+        "open": open_,
+        "previousClose": float(info.get("previousClose", open_)),
+        "marketCap": info.get("marketCap"),
+        "peRatio": info.get("trailingPE"),
+        "eps": info.get("trailingEps"),
+        "dividendYield": info.get("dividendYield"),
+        "timestamp": timestamp
+    }
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Return the Retry-After delay in seconds, if the response gives one."""
+    value = response.headers.get("Retry-After", "")
+    return float(value) if value.isdigit() else None
+
+
+def _parse(response: httpx.Response) -> Any:
+    """Decode a JSON response body straight from bytes."""
+    return orjson.loads(response.content)
+
+
+# yfinance blocks on network I/O, so it gets its own threads rather than
+# competing for the loop's default executor; one pool serves every client
+_yahoo_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_yahoo_executor() -> ThreadPoolExecutor:
+    """Get the shared yfinance thread pool, creating it on first use."""
+    global _yahoo_executor
+    if _yahoo_executor is None:
+        _yahoo_executor = ThreadPoolExecutor(max_workers=_YAHOO_WORKERS, thread_name_prefix="yf")
+    return _yahoo_executor
+
+
+def shutdown_yahoo_executor() -> None:
+    """Shut down the shared yfinance thread pool."""
+    global _yahoo_executor
+    if _yahoo_executor is not None:
+        _yahoo_executor.shutdown(wait=False)
+        _yahoo_executor = None
+
 
 class RateLimiter:
-    """Rate limiter for API requests."""
+    """Per-minute and per-day request quotas tracked as refilling token buckets."""
     
     def __init__(self, requests_per_minute: int, requests_per_day: int):
         self.requests_per_minute = requests_per_minute
         self.requests_per_day = requests_per_day
-        self.minute_requests = 0
-        self.day_requests = 0
-        self.last_minute_reset = datetime.utcnow()
-        self.last_day_reset = datetime.utcnow()
+        self._tokens_min = float(requests_per_minute)
+        self._tokens_day = float(requests_per_day)
+        self._last = time.monotonic()
     
     async def can_make_request(self) -> bool:
-        """Check if we can make a request without exceeding rate limits."""
-        now = datetime.utcnow()
+        """Consume one request from both quotas, returning False if either is spent."""
+        # No await between the check and the consume, so concurrent callers
+        # cannot both pass on the last token
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        self._tokens_min = min(
+            self.requests_per_minute,
+            self._tokens_min + elapsed * self.requests_per_minute / 60
+        )
+        self._tokens_day = min(
+            self.requests_per_day,
+            self._tokens_day + elapsed * self.requests_per_day / 86400
+        )
         
-        # Reset minute counter if needed
-        if (now - self.last_minute_reset).seconds >= 60:
-            self.minute_requests = 0
-            self.last_minute_reset = now
+        if self._tokens_min < 1 or self._tokens_day < 1:
+            return False
+        self._tokens_min -= 1
+        self._tokens_day -= 1
+        return True
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops calling a failing provider until a cool-off period has passed."""
+    
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = _BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = _BREAKER_RESET_TIMEOUT
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.open_until = 0.0
+    
+    def before_call(self):
+        """Raise CircuitOpenError while the circuit is open."""
+        if self.state is CircuitState.OPEN:
+            if time.monotonic() < self.open_until:
+                raise CircuitOpenError(f"{self.name} circuit is open")
+            # Cool-off elapsed: let trial requests through
+            self.state = CircuitState.HALF_OPEN
+    
+    def record_success(self):
+        """Close the circuit after a successful call."""
+        self.failures = 0
+        self.state = CircuitState.CLOSED
+    
+    def record_failure(self):
+        """Count a failed call, opening the circuit at the threshold."""
+        self.failures += 1
+        if self.state is CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self.open_until = time.monotonic() + self.reset_timeout
+            logger.warning("Provider circuit opened", provider=self.name, reset_timeout=self.reset_timeout)
+
+
+class ResponseCache:
+    """TTL cache for provider responses: Redis when available, in-process otherwise."""
+    
+    def __init__(self, max_entries: int = _MEMORY_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._memory: Dict[str, Tuple[float, bytes]] = {}
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        try:
+            payload = await redis_manager.get(key)
+        except Exception:
+            # Redis not initialized (e.g. Celery workers) or unreachable
+            entry = self._memory.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._memory.pop(key, None)
+                return None
+            payload = entry[1]
+        # Values are stored serialized so callers never share a mutable result
+        return orjson.loads(payload) if payload else None
+    
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Return the cached values for keys (None for misses) in one lookup."""
+        if not keys:
+            return []
+        try:
+            payloads = await redis_manager.mget(keys)
+        except Exception:
+            return [await self.get(key) for key in keys]
+        return [orjson.loads(payload) if payload else None for payload in payloads]
+    
+    async def set(self, key: str, value: Any, ttl: int):
+        """Store a value under key for ttl seconds."""
+        payload = orjson.dumps(value, default=str, option=_CACHE_DUMPS_OPTIONS)
+        try:
+            await redis_manager.set(key, payload, expire=ttl)
+        except Exception:
+            if len(self._memory) >= self.max_entries:
+                # Dicts keep insertion order, so this evicts the oldest entry
+                self._memory.pop(next(iter(self._memory)))
+            self._memory[key] = (time.monotonic() + ttl, payload)
+
+
+class BaseProviderClient:
+    """Base class for HTTP providers sharing one pooled connection per host."""
+    
+    name = "provider"
+    
+    def __init__(
+        self,
+        base_url: str,
+        rate_per_sec: float,
+        burst: int,
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None
+    ):
+        self.base_url = base_url
+        self.timeout = timeout
+        self._headers = headers or {}
+        # Paces requests so bursts wait for capacity instead of drawing 429s
+        self._limiter = AsyncTokenBucket(rate=rate_per_sec, capacity=burst)
+        self._breaker = CircuitBreaker(self.name)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        # Pooled connections belong to the loop that opened them (Celery tasks run a fresh loop each)
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._discard_client()
+            # HTTP/2 multiplexes concurrent requests over one connection per host
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=_HTTP_LIMITS,
+                headers=self._headers,
+                http2=True,
+            )
+            self._client_loop = loop
+        return self._client
+    
+    def _discard_client(self):
+        """Close a client opened on another event loop before it is replaced."""
+        stale, stale_loop = self._client, self._client_loop
+        if stale is None or stale.is_closed or stale_loop is None or stale_loop.is_closed():
+            # A closed loop's connections cannot be shut down from here, so jobs
+            # that run their own loop close the connections before the loop
+            return
+        # Its connections belong to that loop, so they are closed there
+        asyncio.run_coroutine_threadsafe(stale.aclose(), stale_loop)
+    
+    async def _get(self, path: str, **kwargs) -> httpx.Response:
+        """GET a provider path, retrying transient failures with jittered backoff."""
+        for attempt in range(1, _RETRY_ATTEMPTS + 1):
+            await self._limiter.acquire()
+            delay = None
+            try:
+                response = await self._get_client().get(path, **kwargs)
+            except httpx.TimeoutException:
+                # A slow provider is better served by the fallback chain than a retry
+                raise
+            except httpx.TransportError:
+                if attempt == _RETRY_ATTEMPTS:
+                    raise
+            else:
+                if response.status_code not in _RETRY_STATUSES or attempt == _RETRY_ATTEMPTS:
+                    return response
+                delay = _retry_after(response)
+                if delay is not None and delay > _RETRY_AFTER_LIMIT:
+                    return response
+            
+            if delay is None:
+                delay = min(
+                    _RETRY_MAX_WAIT,
+                    _RETRY_INITIAL_WAIT * 2 ** (attempt - 1) + random.uniform(0, _RETRY_INITIAL_WAIT)
+                )
+            await asyncio.sleep(delay)
+    
+    async def _request(
+        self,
+        endpoint: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Fetch and decode a provider endpoint.
         
-        # Reset day counter if needed
-        if (now - self.last_day_reset).days >= 1:
-            self.day_requests = 0
-            self.last_day_reset = now
+        Returns None when the request fails; raises CircuitOpenError without
+        sending anything while the provider's circuit is open. ``endpoint``
+        labels the call in the provider metrics.
+        """
+        try:
+            self._breaker.before_call()
+        except CircuitOpenError:
+            PROVIDER_REQUESTS.labels(self.name, endpoint, "circuit_open").inc()
+            raise
         
-        return (self.minute_requests < self.requests_per_minute and 
-                self.day_requests < self.requests_per_day)
+        response = None
+        try:
+            with PROVIDER_LATENCY.labels(self.name, endpoint).time():
+                response = await self._get(path, params=params, timeout=timeout or self.timeout)
+            PROVIDER_REQUESTS.labels(self.name, endpoint, str(response.status_code)).inc()
+            response.raise_for_status()
+            self._breaker.record_success()
+            return _parse(response)
+        except Exception as e:
+            if response is None:
+                # No HTTP status to report, so label by the error instead
+                PROVIDER_REQUESTS.labels(self.name, endpoint, type(e).__name__).inc()
+            self._record_failure(e)
+            logger.error("Provider request failed", provider=self.name, path=path, error=str(e))
+            return None
     
-    async def record_request(self):
-        """Record a request."""
-        self.minute_requests += 1
-        self.day_requests += 1
+    def _record_failure(self, error: Exception):
+        """Count outages and throttling against the breaker, but not bad symbols."""
+        if isinstance(error, httpx.TransportError) or (
+            isinstance(error, httpx.HTTPStatusError)
+            and (error.response.status_code == 429 or error.response.status_code >= 500)
+        ):
+            self._breaker.record_failure()
+    
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
 
 
-class FinancialModelingPrepClient:
+class FinancialModelingPrepClient(BaseProviderClient):
     """Financial Modeling Prep API client."""
     
+    name = "FMP"
+    
     def __init__(self):
+        super().__init__(
+            "https://financialmodelingprep.com/api/v3",
+            rate_per_sec=settings.fmp_rate_per_sec,
+            burst=settings.fmp_burst
+        )
         self.api_key = settings.financial_modeling_prep_api_key
-        self.base_url = "https://financialmodelingprep.com/api/v3"
-        self.timeout = 30.0
+        # Shared by every request that only needs the key
+        self._auth_params = {"apikey": self.api_key}
         self.rate_limiter = RateLimiter(250, 10000)  # FMP limits
     
     async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get real-time stock quote."""
-        if not self.api_key:
-            logger.warning("Financial Modeling Prep API key not configured")
+        if not await self.rate_limiter.can_make_request():
+            logger.warning("Provider rate limit exceeded", provider=self.name, symbol=symbol)
             return None
         
+        data = await self._request("quote", f"/quote/{symbol}", self._auth_params, _QUOTE_TIMEOUT)
+        return _fmp_quote(data[0]) if data else None
+    
+    async def get_quotes_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get quotes for many symbols with one request per chunk of symbols."""
+        if not symbols:
+            return {}
+        
+        chunks = [
+            symbols[i:i + _FMP_BATCH_SIZE]
+            for i in range(0, len(symbols), _FMP_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(self._get_quote_chunk(chunk) for chunk in chunks))
+        return {
+            quote["symbol"]: _fmp_quote(quote)
+            for data in results
+            for quote in data
+            if quote.get("symbol")
+        }
+    
+    async def _get_quote_chunk(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        """Get quotes for one comma-separated chunk of symbols."""
         if not await self.rate_limiter.can_make_request():
-            logger.warning(f"FMP rate limit exceeded for {symbol}")
-            return None
+            logger.warning("Provider rate limit exceeded", provider=self.name, batch_size=len(symbols))
+            return []
         
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/quote/{symbol}",
-                    params={"apikey": self.api_key}
-                )
-                response.raise_for_status()
-                data = response.json()
-                await self.rate_limiter.record_request()
-                return data[0] if data else None
-        except Exception as e:
-            logger.error(f"FMP quote request failed for {symbol}: {e}")
-            return None
+        data = await self._request(
+            "quote_batch", f"/quote/{','.join(symbols)}", self._auth_params, _QUOTE_TIMEOUT
+        )
+        return data or []
     
     async def get_historical_data(
         self, 
@@ -104,24 +541,12 @@ class FinancialModelingPrepClient:
         period: str = "1y"
     ) -> Optional[List[Dict[str, Any]]]:
         """Get historical price data."""
-        if not self.api_key:
-            return None
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/historical-price-full/{symbol}",
-                    params={
-                        "apikey": self.api_key,
-                        "timeseries": period
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data.get("historical", [])
-        except Exception as e:
-            logger.error(f"FMP historical data request failed for {symbol}: {e}")
-            return None
+        data = await self._request(
+            "historical",
+            f"/historical-price-full/{symbol}",
+            {**self._auth_params, "timeseries": period}
+        )
+        return data.get("historical", []) if data is not None else None
     
     async def get_financial_statements(
         self, 
@@ -129,38 +554,12 @@ class FinancialModelingPrepClient:
         statement_type: str = "income-statement"
     ) -> Optional[List[Dict[str, Any]]]:
         """Get financial statements."""
-        if not self.api_key:
-            return None
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/{statement_type}/{symbol}",
-                    params={"apikey": self.api_key}
-                )
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            logger.error(f"FMP financial statements request failed for {symbol}: {e}")
-            return None
+        return await self._request("statements", f"/{statement_type}/{symbol}", self._auth_params)
     
     async def get_company_profile(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get company profile information."""
-        if not self.api_key:
-            return None
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/profile/{symbol}",
-                    params={"apikey": self.api_key}
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data[0] if data else None
-        except Exception as e:
-            logger.error(f"FMP company profile request failed for {symbol}: {e}")
-            return None
+        data = await self._request("profile", f"/profile/{symbol}", self._auth_params)
+        return data[0] if data else None
 
 
 class YahooFinanceClient:
@@ -169,48 +568,133 @@ class YahooFinanceClient:
     def __init__(self):
         self.timeout = 30.0
         self.rate_limiter = RateLimiter(2000, 100000)  # Yahoo Finance limits
+        # Ticker objects are reused per symbol, and their .info (one HTTP
+        # request per access) is kept briefly so quote and profile share it
+        self._tickers: Dict[str, yf.Ticker] = {}
+        self._info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+    
+    def _ticker(self, symbol: str, refresh: bool = False) -> yf.Ticker:
+        """
+        Return the symbol's Ticker object.
+        
+        A Ticker fetches .info once and keeps it, so ``refresh`` swaps in a new
+        one whenever the cached info has expired.
+        """
+        ticker = None if refresh else self._tickers.get(symbol)
+        if ticker is None:
+            ticker = yf.Ticker(symbol)
+            self._tickers.pop(symbol, None)
+            if len(self._tickers) >= _YAHOO_TICKER_CACHE_SIZE:
+                self._tickers.pop(next(iter(self._tickers)))
+            self._tickers[symbol] = ticker
+        return ticker
+    
+    def _cached_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the ticker's info if it was fetched within the last few seconds."""
+        entry = self._info_cache.get(symbol)
+        if entry is not None and time.monotonic() - entry[0] < _YAHOO_INFO_TTL:
+            return entry[1]
+        return None
+    
+    def _store_info(self, symbol: str, info: Dict[str, Any]):
+        """Keep a freshly fetched info dict for reuse."""
+        if len(self._info_cache) >= _YAHOO_TICKER_CACHE_SIZE:
+            self._info_cache.pop(next(iter(self._info_cache)))
+        self._info_cache[symbol] = (time.monotonic(), info)
+    
+    async def _get_info(self, symbol: str) -> Dict[str, Any]:
+        """Return the ticker's info dict, reusing a fetch from the last few seconds."""
+        info = self._cached_info(symbol)
+        if info is None:
+            ticker = self._ticker(symbol, refresh=True)
+            loop = asyncio.get_event_loop()
+            info = await loop.run_in_executor(_get_yahoo_executor(), lambda: ticker.info)
+            self._store_info(symbol, info)
+        return info
+    
+    async def aclose(self):
+        """Release the yfinance worker threads."""
+        shutdown_yahoo_executor()
     
     async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get real-time stock quote."""
         if not await self.rate_limiter.can_make_request():
-            logger.warning(f"Yahoo Finance rate limit exceeded for {symbol}")
+            logger.warning("Provider rate limit exceeded", provider="Yahoo Finance", symbol=symbol)
             return None
         
         try:
+            cached_info = self._cached_info(symbol)
+            ticker = self._ticker(symbol, refresh=cached_info is None)
+            
+            def fetch():
+                # Info (when not cached) and history in a single thread hop
+                info = ticker.info if cached_info is None else cached_info
+                return info, ticker.history(period="1d", interval="1m")
+            
             # Run yfinance in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
-            info = await loop.run_in_executor(None, ticker.info)
-            history = await loop.run_in_executor(
-                None, 
-                lambda: ticker.history(period="1d", interval="1m")
-            )
+            info, history = await loop.run_in_executor(_get_yahoo_executor(), fetch)
+            if cached_info is None:
+                self._store_info(symbol, info)
             
             if info and not history.empty:
-                latest = history.iloc[-1]
-                await self.rate_limiter.record_request()
-                
-                return {
-                    "symbol": symbol,
-                    "price": float(latest["Close"]),
-                    "change": float(latest["Close"] - latest["Open"]),
-                    "changePercent": float((latest["Close"] - latest["Open"]) / latest["Open"] * 100),
-                    "volume": int(latest["Volume"]),
-                    "high": float(latest["High"]),
-                    "low": float(latest["Low"]),
-                    "open": float(latest["Open"]),
-                    "previousClose": float(info.get("previousClose", latest["Open"])),
-                    "marketCap": info.get("marketCap"),
-                    "peRatio": info.get("trailingPE"),
-                    "eps": info.get("trailingEps"),
-                    "dividendYield": info.get("dividendYield"),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+                return _intraday_quote(symbol, history, info, datetime.utcnow().isoformat())
             return None
         except Exception as e:
-            logger.error(f"Yahoo Finance quote request failed for {symbol}: {e}")
+            logger.error("Yahoo Finance quote request failed", symbol=symbol, error=str(e))
             return None
     
+    async def get_quotes_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get intraday quotes for many symbols with a single multi-ticker download."""
+        if not symbols:
+            return {}
+        if not await self.rate_limiter.can_make_request():
+            logger.warning("Provider rate limit exceeded", provider="Yahoo Finance", batch_size=len(symbols))
+            return {}
+        
+        try:
+            loop = asyncio.get_event_loop()
+            history = await loop.run_in_executor(
+                _get_yahoo_executor(),
+                lambda: yf.download(
+                    tickers=" ".join(symbols),
+                    # Two sessions, so the earlier one supplies the previous close
+                    period="2d",
+                    interval="1m",
+                    group_by="ticker",
+                    threads=True,
+                    progress=False
+                )
+            )
+        except Exception as e:
+            logger.error("Yahoo Finance batch quote request failed", batch_size=len(symbols), error=str(e))
+            return {}
+        
+        if history.empty:
+            return {}
+        quotes = {}
+        timestamp = datetime.utcnow().isoformat()
+        for symbol in symbols:
+            # A single ticker comes back with flat columns rather than one group per ticker
+            if history.columns.nlevels > 1:
+                if symbol not in history.columns.get_level_values(0):
+                    continue
+                frame = history[symbol]
+            else:
+                frame = history
+            frame = frame.dropna(subset=["Close"])
+            if frame.empty:
+                continue
+            
+            # Valuation fields come from a recently fetched info, when there is one
+            info = dict(self._cached_info(symbol) or {})
+            sessions = frame.index.normalize()
+            earlier = frame[sessions < sessions[-1]]
+            if not earlier.empty:
+                info.setdefault("previousClose", float(earlier["Close"].iat[-1]))
+            quotes[symbol] = _intraday_quote(symbol, frame, info, timestamp)
+        return quotes
+    
     async def get_historical_data(
         self, 
         symbol: str, 
@@ -219,51 +703,31 @@ class YahooFinanceClient:
     ) -> Optional[List[Dict[str, Any]]]:
         """Get historical price data."""
         if not await self.rate_limiter.can_make_request():
-            logger.warning(f"Yahoo Finance rate limit exceeded for {symbol}")
+            logger.warning("Provider rate limit exceeded", provider="Yahoo Finance", symbol=symbol)
             return None
         
         try:
+            ticker = self._ticker(symbol)
             loop = asyncio.get_event_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
-            history = await loop.run_in_executor(
-                None, 
-                lambda: ticker.history(period=period, interval=interval)
+            # The frame is converted in the worker thread as well
+            return await loop.run_in_executor(
+                _get_yahoo_executor(), 
+                lambda: _history_records(ticker.history(period=period, interval=interval))
             )
-            
-            if not history.empty:
-                await self.rate_limiter.record_request()
-                
-                data = []
-                for date, row in history.iterrows():
-                    data.append({
-                        "date": date.isoformat(),
-                        "open": float(row["Open"]),
-                        "high": float(row["High"]),
-                        "low": float(row["Low"]),
-                        "close": float(row["Close"]),
-                        "volume": int(row["Volume"]),
-                        "adjusted_close": float(row["Close"])  # Simplified
-                    })
-                return data
-            return None
         except Exception as e:
-            logger.error(f"Yahoo Finance historical data request failed for {symbol}: {e}")
+            logger.error("Yahoo Finance historical data request failed", symbol=symbol, error=str(e))
             return None
     
     async def get_company_profile(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get company profile information."""
         if not await self.rate_limiter.can_make_request():
-            logger.warning(f"Yahoo Finance rate limit exceeded for {symbol}")
+            logger.warning("Provider rate limit exceeded", provider="Yahoo Finance", symbol=symbol)
             return None
         
         try:
-            loop = asyncio.get_event_loop()
-            ticker = await loop.run_in_executor(None, yf.Ticker, symbol)
-            info = await loop.run_in_executor(None, ticker.info)
+            info = await self._get_info(symbol)
             
             if info:
-                await self.rate_limiter.record_request()
-                
                 return {
                     "symbol": symbol,
                     "name": info.get("longName", info.get("shortName", symbol)),
@@ -278,74 +742,70 @@ class YahooFinanceClient:
                 }
             return None
         except Exception as e:
-            logger.error(f"Yahoo Finance company profile request failed for {symbol}: {e}")
+            logger.error("Yahoo Finance company profile request failed", symbol=symbol, error=str(e))
             return None
 
 
-class AlphaVantageClient:
+class AlphaVantageClient(BaseProviderClient):
     """Alpha Vantage API client."""
     
+    name = "Alpha Vantage"
+    
     def __init__(self):
+        super().__init__(
+            "https://www.alphavantage.co",
+            rate_per_sec=settings.alpha_vantage_rate_per_sec,
+            burst=settings.alpha_vantage_burst
+        )
         self.api_key = settings.alpha_vantage_api_key
-        self.base_url = "https://www.alphavantage.co/query"
-        self.timeout = 30.0
+        self._auth_params = {"apikey": self.api_key}
+        # Static query parameters, so each call only adds the symbol
+        self._quote_params = {"function": "GLOBAL_QUOTE", **self._auth_params}
+        self._indicator_params = {
+            "interval": "daily",
+            "time_period": 14,
+            "series_type": "close",
+            **self._auth_params
+        }
         self.rate_limiter = RateLimiter(5, 500)  # Alpha Vantage limits
     
     async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get real-time stock quote."""
-        if not self.api_key:
-            logger.warning("Alpha Vantage API key not configured")
+        if not await self.rate_limiter.can_make_request():
+            logger.warning("Provider rate limit exceeded", provider=self.name, symbol=symbol)
             return None
         
-        if not await self.rate_limiter.can_make_request():
-            logger.warning(f"Alpha Vantage rate limit exceeded for {symbol}")
+        data = await self._request(
+            "quote",
+            "/query",
+            {**self._quote_params, "symbol": symbol},
+            _QUOTE_TIMEOUT
+        )
+        if data is None:
             return None
         
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.base_url,
-                    params={
-                        "function": "GLOBAL_QUOTE",
-                        "symbol": symbol,
-                        "apikey": self.api_key
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Check for API error messages
-                if "Error Message" in data:
-                    logger.error(f"Alpha Vantage API error: {data['Error Message']}")
-                    return None
-                
-                if "Note" in data:
-                    logger.warning(f"Alpha Vantage API note: {data['Note']}")
-                    return None
-                
-                # Alpha Vantage returns data in a different format
-                quote_data = data.get("Global Quote", {})
-                if not quote_data:
-                    return None
-                
-                await self.rate_limiter.record_request()
-                
-                # Transform to standard format
-                return {
-                    "symbol": quote_data.get("01. symbol"),
-                    "price": float(quote_data.get("05. price", 0)),
-                    "change": float(quote_data.get("09. change", 0)),
-                    "changePercent": float(quote_data.get("10. change percent", "0%").replace("%", "")),
-                    "volume": int(quote_data.get("06. volume", 0)),
-                    "high": float(quote_data.get("03. high", 0)),
-                    "low": float(quote_data.get("04. low", 0)),
-                    "open": float(quote_data.get("02. open", 0)),
-                    "previousClose": float(quote_data.get("08. previous close", 0)),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-        except Exception as e:
-            logger.error(f"Alpha Vantage quote request failed for {symbol}: {e}")
+        # Check for API error messages
+        if "Error Message" in data:
+            logger.error("Alpha Vantage API error", symbol=symbol, error=data["Error Message"])
+            return None
+        
+        if "Note" in data:
+            logger.warning("Alpha Vantage API note", symbol=symbol, note=data["Note"])
             return None
+        
+        # Alpha Vantage returns data in a different format
+        quote_data = data.get("Global Quote", {})
+        if not quote_data:
+            return None
+        
+        # Transform to standard format
+        quote = {"symbol": quote_data.get("01. symbol")}
+        quote.update(
+            (key, convert(quote_data.get(source, 0)))
+            for key, source, convert in _AV_QUOTE_FIELDS
+        )
+        quote["timestamp"] = datetime.utcnow().isoformat()
+        return quote
     
     async def get_technical_indicator(
         self, 
@@ -353,62 +813,37 @@ class AlphaVantageClient:
         indicator: str = "RSI"
     ) -> Optional[Dict[str, Any]]:
         """Get technical indicators."""
-        if not self.api_key:
-            return None
-        
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    self.base_url,
-                    params={
-                        "function": indicator,
-                        "symbol": symbol,
-                        "interval": "daily",
-                        "time_period": 14,
-                        "series_type": "close",
-                        "apikey": self.api_key
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            logger.error(f"Alpha Vantage technical indicator request failed for {symbol}: {e}")
-            return None
+        return await self._request(
+            "technical",
+            "/query",
+            {**self._indicator_params, "function": indicator, "symbol": symbol}
+        )
 
 
-class TiingoClient:
+class TiingoClient(BaseProviderClient):
     """Tiingo API client."""
     
+    name = "Tiingo"
+    
     def __init__(self):
         self.api_key = settings.tiingo_api_key
-        self.base_url = "https://api.tiingo.com"
-        self.timeout = 30.0
+        # The token is sent as a default header on every pooled request
+        super().__init__(
+            "https://api.tiingo.com",
+            rate_per_sec=settings.tiingo_rate_per_sec,
+            burst=settings.tiingo_burst,
+            headers={"Authorization": f"Token {self.api_key}"}
+        )
         self.rate_limiter = RateLimiter(1000, 50000)  # Tiingo limits
     
     async def get_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """Get real-time stock quote."""
-        if not self.api_key:
-            logger.warning("Tiingo API key not configured")
-            return None
-        
         if not await self.rate_limiter.can_make_request():
-            logger.warning(f"Tiingo rate limit exceeded for {symbol}")
+            logger.warning("Provider rate limit exceeded", provider=self.name, symbol=symbol)
             return None
         
-        try:
-            headers = {"Authorization": f"Token {self.api_key}"}
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/iex/{symbol}",
-                    headers=headers
-                )
-                response.raise_for_status()
-                data = response.json()
-                await self.rate_limiter.record_request()
-                return data[0] if data else None
-        except Exception as e:
-            logger.error(f"Tiingo quote request failed for {symbol}: {e}")
-            return None
+        data = await self._request("quote", f"/iex/{symbol}", timeout=_QUOTE_TIMEOUT)
+        return data[0] if data else None
     
     async def get_historical_data(
         self, 
@@ -417,43 +852,117 @@ class TiingoClient:
         end_date: str
     ) -> Optional[List[Dict[str, Any]]]:
         """Get historical price data."""
-        if not self.api_key:
-            return None
-        
-        try:
-            headers = {"Authorization": f"Token {self.api_key}"}
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/tiingo/daily/{symbol}/prices",
-                    headers=headers,
-                    params={
-                        "startDate": start_date,
-                        "endDate": end_date
-                    }
-                )
-                response.raise_for_status()
-                return response.json()
-        except Exception as e:
-            logger.error(f"Tiingo historical data request failed for {symbol}: {e}")
-            return None
+        return await self._request(
+            "historical",
+            f"/tiingo/daily/{symbol}/prices",
+            {"startDate": start_date, "endDate": end_date}
+        )
+
+
+# HTTP providers in fallback priority order: (name, client class, API key setting)
+_API_PROVIDERS = (
+    ("fmp", FinancialModelingPrepClient, "financial_modeling_prep_api_key"),
+    ("alpha_vantage", AlphaVantageClient, "alpha_vantage_api_key"),
+    ("tiingo", TiingoClient, "tiingo_api_key"),
+)
+
+_PROVIDER_DISPLAY_NAMES = {
+    "yahoo": "Yahoo Finance",
+    "fmp": "Financial Modeling Prep",
+    "alpha_vantage": "Alpha Vantage",
+    "tiingo": "Tiingo",
+}
 
 
 class MarketDataService:
     """Main market data service with fallback strategy."""
     
     def __init__(self):
-        self.fmp_client = FinancialModelingPrepClient()
         self.yahoo_client = YahooFinanceClient()
-        self.alpha_vantage_client = AlphaVantageClient()
-        self.tiingo_client = TiingoClient()
+        # API-key providers are only built (and hold connection pools) when configured
+        clients = {
+            name: client_class()
+            for name, client_class, key_setting in _API_PROVIDERS
+            if getattr(settings, key_setting)
+        }
+        self.fmp_client: Optional[FinancialModelingPrepClient] = clients.get("fmp")
+        self.alpha_vantage_client: Optional[AlphaVantageClient] = clients.get("alpha_vantage")
+        self.tiingo_client: Optional[TiingoClient] = clients.get("tiingo")
+        self._clients: List[BaseProviderClient] = list(clients.values())
         
         # Provider priority order (first is primary)
-        self.providers = [
-            ("yahoo", self.yahoo_client),
-            ("fmp", self.fmp_client),
-            ("alpha_vantage", self.alpha_vantage_client),
-            ("tiingo", self.tiingo_client)
-        ]
+        self.providers = [("yahoo", self.yahoo_client), *clients.items()]
+        self.cache = ResponseCache()
+        # Lookups currently being fetched, shared by concurrent callers of the same key
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Bounds the per-symbol fallback fan-out of multi-quote requests
+        self._quote_sem: Optional[asyncio.Semaphore] = None
+        self._quote_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def __aenter__(self) -> "MarketDataService":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the pooled HTTP clients and the Yahoo worker threads."""
+        await asyncio.gather(self.yahoo_client.aclose(), self.close_connections())
+    
+    async def close_connections(self):
+        """Close the pooled HTTP clients; they reopen on the next request."""
+        await asyncio.gather(*(client.aclose() for client in self._clients))
+    
+    def _get_quote_sem(self) -> asyncio.Semaphore:
+        """Return the quote fan-out semaphore, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        # A semaphore binds to the loop that first waits on it (Celery tasks run a fresh loop each)
+        if self._quote_sem is None or self._quote_sem_loop is not loop:
+            self._quote_sem = asyncio.Semaphore(settings.max_concurrent_quotes)
+            self._quote_sem_loop = loop
+        return self._quote_sem
+    
+    @staticmethod
+    def _cache_key(endpoint: str, symbol: str, params: Tuple = ()) -> str:
+        """Build the response cache key for a provider lookup."""
+        return ":".join(("md", endpoint, symbol, *map(str, params)))
+    
+    async def _cached(
+        self,
+        endpoint: str,
+        symbol: str,
+        params: Tuple,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Serve a provider lookup from the response cache, fetching it on a miss."""
+        key = self._cache_key(endpoint, symbol, params)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            CACHE_HITS.labels(endpoint).inc()
+            return cached
+        CACHE_MISSES.labels(endpoint).inc()
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(key, endpoint, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one caller being cancelled does not cancel the shared fetch;
+        # each caller gets its own copy, as with cache hits
+        return copy.deepcopy(await asyncio.shield(task))
+    
+    async def _fetch_and_store(
+        self,
+        key: str,
+        endpoint: str,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run a provider lookup and cache a successful result."""
+        result = await fetch()
+        # Failed lookups are not cached so the next call retries the providers
+        if result:
+            await self.cache.set(key, result, _CACHE_TTLS[endpoint])
+        return result
     
     async def get_stock_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -465,22 +974,87 @@ class MarketDataService:
         Returns:
             Stock quote data or None if all sources fail
         """
-        # Try providers in priority order
-        for provider_name, client in self.providers:
+        return await self._cached("quote", symbol, (), lambda: self._fetch_stock_quote(symbol))
+    
+    async def _fetch_stock_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch a quote from the providers in priority order."""
+        calls = [
+            (provider_name, lambda client=client: client.get_quote(symbol))
+            for provider_name, client in self.providers
+        ]
+        return await self._first_result("quote", symbol, calls)
+    
+    async def _first_result(
+        self,
+        endpoint: str,
+        symbol: str,
+        calls: List[Tuple[str, Callable[[], Awaitable[Any]]]]
+    ) -> Any:
+        """
+        Return the first non-empty provider result, tagged with its source.
+        
+        With aggressive fallback the top two providers are raced and the rest
+        are tried in order; every call is bounded by the endpoint's timeout.
+        """
+        timeout = _PROVIDER_TIMEOUTS[endpoint]
+        if settings.aggressive_fallback:
+            result = await self._race(endpoint, symbol, calls[:2], timeout)
+            if result:
+                return result
+            calls = calls[2:]
+        
+        for provider_name, call in calls:
             try:
-                quote = await client.get_quote(symbol)
-                if quote:
-                    logger.info(f"Got quote for {symbol} from {provider_name}")
-                    # Add provider info to quote
-                    quote["data_source"] = provider_name
-                    return quote
+                result = await asyncio.wait_for(call(), timeout)
             except Exception as e:
-                logger.warning(f"{provider_name} failed for {symbol}: {e}")
+                logger.warning("Provider lookup failed", endpoint=endpoint, symbol=symbol, provider=provider_name, error=str(e) or type(e).__name__)
                 continue
+            if result:
+                return self._tag_result(endpoint, symbol, provider_name, result)
         
-        logger.error(f"All data sources failed for {symbol}")
+        logger.error("All provider lookups failed", endpoint=endpoint, symbol=symbol)
         return None
     
+    async def _race(
+        self,
+        endpoint: str,
+        symbol: str,
+        calls: List[Tuple[str, Callable[[], Awaitable[Any]]]],
+        timeout: float
+    ) -> Any:
+        """Query providers concurrently and return the first result that comes back."""
+        tasks = {
+            asyncio.ensure_future(asyncio.wait_for(call(), timeout)): provider_name
+            for provider_name, call in calls
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Iterate in priority order so simultaneous answers favour the primary
+                for task in (task for task in tasks if task in done):
+                    provider_name = tasks[task]
+                    error = task.exception()
+                    if error is not None:
+                        logger.warning("Provider lookup failed", endpoint=endpoint, symbol=symbol, provider=provider_name, error=str(error) or type(error).__name__)
+                        continue
+                    result = task.result()
+                    if result:
+                        return self._tag_result(endpoint, symbol, provider_name, result)
+        finally:
+            # The slower provider's answer is no longer needed
+            for task in pending:
+                task.cancel()
+        return None
+    
+    @staticmethod
+    def _tag_result(endpoint: str, symbol: str, provider_name: str, result: Any) -> Any:
+        """Record which provider answered a lookup."""
+        logger.debug("Got provider data", endpoint=endpoint, symbol=symbol, provider=provider_name)
+        if isinstance(result, dict):
+            result["data_source"] = provider_name
+        return result
+    
     async def get_historical_data(
         self, 
         symbol: str, 
@@ -498,29 +1072,29 @@ class MarketDataService:
         Returns:
             Historical data or None if all sources fail
         """
-        # Try providers in priority order
+        return await self._cached(
+            "historical", symbol, (period, interval),
+            lambda: self._fetch_historical_data(symbol, period, interval)
+        )
+    
+    async def _fetch_historical_data(
+        self, 
+        symbol: str, 
+        period: str, 
+        interval: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch historical data from the providers in priority order."""
+        calls = []
         for provider_name, client in self.providers:
-            try:
-                if provider_name == "yahoo":
-                    data = await client.get_historical_data(symbol, period, interval)
-                elif provider_name == "fmp":
-                    data = await client.get_historical_data(symbol, period)
-                elif provider_name == "tiingo":
-                    end_date = datetime.now().strftime("%Y-%m-%d")
-                    start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
-                    data = await client.get_historical_data(symbol, start_date, end_date)
-                else:
-                    continue
-                
-                if data:
-                    logger.info(f"Got historical data for {symbol} from {provider_name}")
-                    return data
-            except Exception as e:
-                logger.warning(f"{provider_name} historical data failed for {symbol}: {e}")
-                continue
-        
-        logger.error(f"All historical data sources failed for {symbol}")
-        return None
+            if provider_name == "yahoo":
+                calls.append((provider_name, lambda client=client: client.get_historical_data(symbol, period, interval)))
+            elif provider_name == "fmp":
+                calls.append((provider_name, lambda client=client: client.get_historical_data(symbol, period)))
+            elif provider_name == "tiingo":
+                end_date = datetime.now().strftime("%Y-%m-%d")
+                start_date = (datetime.now() - timedelta(days=365)).strftime("%Y-%m-%d")
+                calls.append((provider_name, lambda client=client: client.get_historical_data(symbol, start_date, end_date)))
+        return await self._first_result("historical", symbol, calls)
     
     async def get_company_profile(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -532,21 +1106,16 @@ class MarketDataService:
         Returns:
             Company profile data or None if all sources fail
         """
-        # Try providers in priority order
-        for provider_name, client in self.providers:
-            try:
-                if provider_name in ["yahoo", "fmp"]:
-                    profile = await client.get_company_profile(symbol)
-                    if profile:
-                        logger.info(f"Got company profile for {symbol} from {provider_name}")
-                        profile["data_source"] = provider_name
-                        return profile
-            except Exception as e:
-                logger.warning(f"{provider_name} company profile failed for {symbol}: {e}")
-                continue
-        
-        logger.error(f"All company profile sources failed for {symbol}")
-        return None
+        return await self._cached("profile", symbol, (), lambda: self._fetch_company_profile(symbol))
+    
+    async def _fetch_company_profile(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Fetch a company profile from the providers in priority order."""
+        calls = [
+            (provider_name, lambda client=client: client.get_company_profile(symbol))
+            for provider_name, client in self.providers
+            if hasattr(client, "get_company_profile")
+        ]
+        return await self._first_result("profile", symbol, calls)
     
     async def get_financial_statements(
         self, 
@@ -563,16 +1132,29 @@ class MarketDataService:
         Returns:
             Financial statements data or None if all sources fail
         """
-        # Try FMP first
-        try:
-            statements = await self.fmp_client.get_financial_statements(symbol, statement_type)
-            if statements:
-                logger.info(f"Got financial statements for {symbol} from FMP")
-                return statements
-        except Exception as e:
-            logger.warning(f"FMP financial statements failed for {symbol}: {e}")
+        return await self._cached(
+            "statements", symbol, (statement_type,),
+            lambda: self._fetch_financial_statements(symbol, statement_type)
+        )
+    
+    async def _fetch_financial_statements(
+        self, 
+        symbol: str, 
+        statement_type: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch financial statements from the providers that publish them."""
+        for provider_name, client in self.providers:
+            if not hasattr(client, "get_financial_statements"):
+                continue
+            try:
+                statements = await client.get_financial_statements(symbol, statement_type)
+                if statements:
+                    logger.debug("Got financial statements", symbol=symbol, provider=provider_name)
+                    return statements
+            except Exception as e:
+                logger.warning("Financial statements provider failed", symbol=symbol, provider=provider_name, error=str(e))
         
-        logger.error(f"All financial statements sources failed for {symbol}")
+        logger.error("All financial statements sources failed", symbol=symbol)
         return None
     
     async def get_technical_indicators(
@@ -590,16 +1172,29 @@ class MarketDataService:
         Returns:
             Technical indicator data or None if all sources fail
         """
-        # Try Alpha Vantage first (best for technical indicators)
-        try:
-            indicators = await self.alpha_vantage_client.get_technical_indicator(symbol, indicator)
-            if indicators:
-                logger.info(f"Got technical indicators for {symbol} from Alpha Vantage")
-                return indicators
-        except Exception as e:
-            logger.warning(f"Alpha Vantage technical indicators failed for {symbol}: {e}")
+        return await self._cached(
+            "technical", symbol, (indicator,),
+            lambda: self._fetch_technical_indicators(symbol, indicator)
+        )
+    
+    async def _fetch_technical_indicators(
+        self, 
+        symbol: str, 
+        indicator: str
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch technical indicators from the providers that compute them."""
+        for provider_name, client in self.providers:
+            if not hasattr(client, "get_technical_indicator"):
+                continue
+            try:
+                indicators = await client.get_technical_indicator(symbol, indicator)
+                if indicators:
+                    logger.debug("Got technical indicators", symbol=symbol, provider=provider_name)
+                    return indicators
+            except Exception as e:
+                logger.warning("Technical indicators provider failed", symbol=symbol, provider=provider_name, error=str(e))
         
-        logger.error(f"All technical indicators sources failed for {symbol}")
+        logger.error("All technical indicators sources failed", symbol=symbol)
         return None
     
     async def get_multiple_quotes(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
@@ -612,35 +1207,96 @@ class MarketDataService:
         Returns:
             Dictionary mapping symbols to quote data
         """
-        tasks = [self.get_stock_quote(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        return {
-            symbol: result if not isinstance(result, Exception) else None
-            for symbol, result in zip(symbols, results)
+        # Repeated symbols are looked up once (dict keys keep the first-seen order)
+        unique = list(dict.fromkeys(symbols))
+        # Bulk quotes can lack fields a single-symbol quote has, so they are cached
+        # under their own keys; both are read in one lookup, full quotes first
+        cached = await self.cache.get_many(
+            [self._cache_key("quote", symbol) for symbol in unique]
+            + [self._cache_key("quote_batch", symbol) for symbol in unique]
+        )
+        quotes = {
+            symbol: full if full is not None else bulk
+            for symbol, full, bulk in zip(unique, cached, cached[len(unique):])
+            if full is not None or bulk is not None
         }
+        CACHE_HITS.labels("quote").inc(len(quotes))
+        CACHE_MISSES.labels("quote").inc(len(unique) - len(quotes))
+        
+        # Bulk endpoints cover the cache misses, in the same priority order as
+        # single-symbol lookups
+        batch_providers = [
+            (provider_name, client)
+            for provider_name, client in self.providers
+            if hasattr(client, "get_quotes_batch")
+        ]
+        for provider_name, client in batch_providers:
+            missing = [symbol for symbol in unique if symbol not in quotes]
+            if not missing:
+                break
+            try:
+                batch = await client.get_quotes_batch(missing)
+            except CircuitOpenError:
+                continue
+            fetched = {symbol: batch[symbol] for symbol in missing if symbol in batch}
+            for quote in fetched.values():
+                quote["data_source"] = provider_name
+            await asyncio.gather(*(
+                self.cache.set(self._cache_key("quote_batch", symbol), quote, _CACHE_TTLS["quote_batch"])
+                for symbol, quote in fetched.items()
+            ))
+            quotes.update(fetched)
+        
+        # Symbols no batch returned go through the per-symbol fallback chain
+        remaining = [symbol for symbol in unique if symbol not in quotes]
+        quote_sem = self._get_quote_sem()
+        
+        async def _one(symbol: str) -> Optional[Dict[str, Any]]:
+            async with quote_sem:
+                return await self.get_stock_quote(symbol)
+        
+        results = await asyncio.gather(
+            *(_one(symbol) for symbol in remaining),
+            return_exceptions=True
+        )
+        for symbol, result in zip(remaining, results):
+            quotes[symbol] = result if not isinstance(result, Exception) else None
+        
+        return {symbol: quotes[symbol] for symbol in symbols}
     
     async def get_market_indices(self) -> List[Dict[str, Any]]:
         """Get major market indices."""
-        indices = []
+        return await self._cached("indices", "major", (), self._fetch_market_indices)
+    
+    async def _fetch_market_indices(self) -> List[Dict[str, Any]]:
+        """Fetch major market indices from the provider."""
         index_symbols = ["^GSPC", "^IXIC", "^DJI", "^VIX"]  # S&P 500, NASDAQ, DOW, VIX
         
-        for symbol in index_symbols:
-            try:
-                quote = await self.yahoo_client.get_quote(symbol)
-                if quote:
-                    indices.append({
-                        "symbol": symbol,
-                        "name": self._get_index_name(symbol),
-                        "value": quote["price"],
-                        "change": quote["change"],
-                        "change_percent": quote["changePercent"],
-                        "data_source": "yahoo"
-                    })
-            except Exception as e:
-                logger.warning(f"Failed to get index {symbol}: {e}")
+        # One multi-ticker download, then concurrent single lookups for any it missed
+        quotes = await self.yahoo_client.get_quotes_batch(index_symbols)
+        missing = [symbol for symbol in index_symbols if symbol not in quotes]
+        results = await asyncio.gather(
+            *(self.yahoo_client.get_quote(symbol) for symbol in missing),
+            return_exceptions=True
+        )
+        for symbol, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to get index", symbol=symbol, error=str(result))
+            elif result:
+                quotes[symbol] = result
         
-        return indices
+        return [
+            {
+                "symbol": symbol,
+                "name": self._get_index_name(symbol),
+                "value": quotes[symbol]["price"],
+                "change": quotes[symbol]["change"],
+                "change_percent": quotes[symbol]["changePercent"],
+                "data_source": "yahoo"
+            }
+            for symbol in index_symbols
+            if symbol in quotes
+        ]
     
     def _get_index_name(self, symbol: str) -> str:
         """Get index name from symbol."""
@@ -666,6 +1322,10 @@ class MarketDataService:
     
     async def get_market_sentiment(self) -> Optional[Dict[str, Any]]:
         """Get market sentiment indicators."""
+        return await self._cached("sentiment", "vix", (), self._fetch_market_sentiment)
+    
+    async def _fetch_market_sentiment(self) -> Optional[Dict[str, Any]]:
+        """Derive market sentiment from the provider's VIX quote."""
         try:
             # Get VIX as a sentiment indicator
             vix_quote = await self.yahoo_client.get_quote("^VIX")
@@ -690,7 +1350,7 @@ class MarketDataService:
                     "data_source": "yahoo"
                 }
         except Exception as e:
-            logger.error(f"Failed to get market sentiment: {e}")
+            logger.error("Failed to get market sentiment", error=str(e))
         
         return None
     
@@ -702,21 +1362,7 @@ class MarketDataService:
     
     def get_available_providers(self) -> List[str]:
         """Get list of available data providers."""
-        providers = []
-        
-        # Yahoo Finance is always available
-        providers.append("Yahoo Finance")
-        
-        if self.fmp_client.api_key:
-            providers.append("Financial Modeling Prep")
-        
-        if self.alpha_vantage_client.api_key:
-            providers.append("Alpha Vantage")
-        
-        if self.tiingo_client.api_key:
-            providers.append("Tiingo")
-        
-        return providers
+        return [_PROVIDER_DISPLAY_NAMES[name] for name, _ in self.providers]
 
 
 # Global market data service instance
@@ -27,7 +27,7 @@ from app.schemas.portfolio import (
     OptimizationConstraints, RebalancingRequest
 )
 from app.services.portfolio_calculations import PortfolioCalculator
-from app.services.market_data_service import MarketDataService
+from app.services.market_data_service import market_data_service
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +39,7 @@ class PortfolioService:
         """Initialize service with database session."""
         self.db = db
         self.calculator = PortfolioCalculator()
-        self.market_data_service = MarketDataService()
+        self.market_data_service = market_data_service
     
     # Portfolio CRUD operations
     async def create_portfolio(self, user_id: uuid.UUID, portfolio_data: PortfolioCreate) -> Portfolio:
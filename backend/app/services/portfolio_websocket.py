@@ -17,7 +17,7 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.portfolio import Portfolio, PortfolioHolding, PortfolioAlert
 from app.services.portfolio_service import PortfolioService
-from app.services.market_data_service import MarketDataService
+from app.services.market_data_service import market_data_service
 
 logger = logging.getLogger(__name__)
 
@@ -133,8 +133,7 @@ class PortfolioWebSocketManager:
                 
                 if symbols:
                     # Get current prices
-                    market_service = MarketDataService()
-                    quotes = await market_service.get_quotes(symbols)
+                    quotes = await market_data_service.get_quotes(symbols)
                     
                     # Update portfolios and send notifications
                     await self._update_portfolio_prices(quotes)
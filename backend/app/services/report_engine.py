@@ -22,7 +22,7 @@ import numpy as np
 from ..models.portfolio import Portfolio, PortfolioHolding
 from ..models.market_data import Stock, StockQuote, HistoricalData
 from ..models.user import User
-from ..services.market_data_service import MarketDataService
+from ..services.market_data_service import market_data_service
 from ..services.portfolio_calculations import PortfolioCalculations
 from ..services.analytics_engine import AnalyticsEngine
 from ..utils.cache_service import CacheService
@@ -59,6 +59,8 @@ class ExportFormat(Enum):
     IMAGE = "image"
     CSV = "csv"
     JSON = "json"
+    PARQUET = "parquet"
+    FEATHER = "feather"
 
 
 @dataclass
@@ -142,7 +144,7 @@ class ReportEngine:
     
     def __init__(self, db: Session):
         self.db = db
-        self.market_data_service = MarketDataService(db)
+        self.market_data_service = market_data_service
         self.portfolio_calculations = PortfolioCalculations(db)
         self.analytics_engine = AnalyticsEngine(db)
         self.cache_service = CacheService()
@@ -0,0 +1,188 @@
+"""
+XLSX Writer
+
+This module writes value-only .xlsx workbooks by emitting the OOXML parts
+directly into a zip archive, without creating a spreadsheet object per cell.
+Strings are stored inline (``inlineStr``) so no shared-strings table has to
+be collected before the worksheets are written, and cells are placed by
+position rather than by an explicit ``r`` reference.
+"""
+
+import math
+import numbers
+import re
+import zipfile
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, BinaryIO, Iterable, List, Sequence, Tuple, Union
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ColumnArrays:
+    """Sheet data given as one array per column, formatted a block at a time"""
+    arrays: Sequence[np.ndarray]
+
+
+# (sheet name, header row, data rows or column arrays)
+SheetSpec = Tuple[str, Sequence[Any], Union[Iterable[Sequence[Any]], ColumnArrays]]
+
+_ROWS_PER_WRITE = 1000
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+_INVALID_SHEET_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+_CONTENT_TYPES_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+)
+_SHEET_CONTENT_TYPE = (
+    '<Override PartName="/xl/worksheets/sheet{0}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_WORKBOOK_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+)
+_WORKBOOK_RELS_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+)
+_SHEET_REL = (
+    '<Relationship Id="rId{0}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{0}.xml"/>'
+)
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+_BLANK_CELL = '<c/>'
+
+
+def _cell_xml(value: Any) -> str:
+    """Serialize a single cell; blank values keep their position with an empty cell"""
+    if value is None:
+        return _BLANK_CELL
+    if isinstance(value, bool):
+        return f'<c t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, numbers.Integral):
+        return f'<c><v>{int(value)}</v></c>'
+    if isinstance(value, (numbers.Real, Decimal)):
+        value = float(value)
+        if not math.isfinite(value):
+            return _BLANK_CELL
+        return f'<c><v>{value!r}</v></c>'
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    text = escape(_INVALID_XML_CHARS.sub("", str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def format_column(arr: np.ndarray) -> List[str]:
+    """Serialize every cell of a column with one dtype-specific pass"""
+    kind = arr.dtype.kind
+    if kind == 'b':
+        return np.where(arr, '<c t="b"><v>1</v></c>', '<c t="b"><v>0</v></c>').tolist()
+    if kind in 'iu':
+        return list(map('<c><v>{}</v></c>'.format, arr.tolist()))
+    if kind == 'f':
+        cells = list(map('<c><v>{!r}</v></c>'.format, arr.tolist()))
+        for idx in np.flatnonzero(~np.isfinite(arr)):
+            cells[idx] = _BLANK_CELL
+        return cells
+    if kind == 'M':
+        # datetime64[ns].tolist() yields integers; microsecond resolution yields datetimes
+        arr = arr.astype('datetime64[us]')
+    return [_cell_xml(value) for value in arr.tolist()]
+
+
+def _row_blocks(header: Sequence[Any], rows: Union[Iterable[Sequence[Any]], ColumnArrays]) -> Iterable[str]:
+    """Yield the sheet's rows as XML, one block of rows at a time"""
+    if header:
+        yield "<row>" + "".join(_cell_xml(value) for value in header) + "</row>"
+
+    if isinstance(rows, ColumnArrays):
+        n_rows = len(rows.arrays[0]) if rows.arrays else 0
+        for start in range(0, n_rows, _ROWS_PER_WRITE):
+            columns = [format_column(arr[start:start + _ROWS_PER_WRITE]) for arr in rows.arrays]
+            yield "".join("<row>" + "".join(cells) + "</row>" for cells in zip(*columns))
+        return
+
+    chunk: List[str] = []
+    for row in rows:
+        chunk.append("<row>" + "".join(_cell_xml(value) for value in row) + "</row>")
+        if len(chunk) >= _ROWS_PER_WRITE:
+            yield "".join(chunk)
+            chunk.clear()
+    if chunk:
+        yield "".join(chunk)
+
+
+def _write_sheet(stream: BinaryIO, header: Sequence[Any], rows: Union[Iterable[Sequence[Any]], ColumnArrays]) -> None:
+    """Stream one worksheet part, writing a block of rows at a time"""
+    stream.write(_SHEET_HEAD.encode("utf-8"))
+    for block in _row_blocks(header, rows):
+        stream.write(block.encode("utf-8"))
+    stream.write(_SHEET_TAIL.encode("utf-8"))
+
+
+def _unique_sheet_names(names: Iterable[str]) -> List[str]:
+    """Sanitize sheet names and de-duplicate them within Excel's 31-char limit"""
+    seen = set()
+    unique = []
+    for name in names:
+        base = _INVALID_SHEET_CHARS.sub("", name)[:31] or "Sheet"
+        candidate, suffix = base, 1
+        while candidate.lower() in seen:
+            candidate = f"{base[:31 - len(str(suffix))]}{suffix}"
+            suffix += 1
+        seen.add(candidate.lower())
+        unique.append(candidate)
+    return unique
+
+
+def write_workbook(target: Union[str, BinaryIO], sheets: List[SheetSpec]) -> None:
+    """Write a value-only workbook to a path or binary file object"""
+    names = _unique_sheet_names(name for name, _, _ in sheets)
+
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for idx, (_, header, rows) in enumerate(sheets, start=1):
+            with zf.open(f"xl/worksheets/sheet{idx}.xml", "w", force_zip64=True) as stream:
+                _write_sheet(stream, header, rows)
+
+        sheet_ids = range(1, len(sheets) + 1)
+        zf.writestr(
+            "[Content_Types].xml",
+            _CONTENT_TYPES_HEAD + "".join(_SHEET_CONTENT_TYPE.format(i) for i in sheet_ids) + "</Types>"
+        )
+        zf.writestr("_rels/.rels", _ROOT_RELS)
+        zf.writestr(
+            "xl/workbook.xml",
+            _WORKBOOK_HEAD
+            + "".join(
+                f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+                for i, name in zip(sheet_ids, names)
+            )
+            + "</sheets></workbook>"
+        )
+        zf.writestr(
+            "xl/_rels/workbook.xml.rels",
+            _WORKBOOK_RELS_HEAD + "".join(_SHEET_REL.format(i) for i in sheet_ids) + "</Relationships>"
+        )
@@ -0,0 +1,161 @@
+"""
+Tests for Export Service
+
+Test suite for the report export formats and the direct XLSX writer.
+"""
+
+import io
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from app.services.xlsx_writer import ColumnArrays, write_workbook
+
+
+@pytest.fixture
+def export_service():
+    """Export service instance (skipped where its rendering stack is unavailable)"""
+    module = pytest.importorskip("app.services.export_service")
+    return module.ExportService()
+
+
+@pytest.fixture
+def table_report():
+    """Report content with a single table section"""
+    return {
+        "title": "Holdings",
+        "type": "portfolio",
+        "generated_at": "2024-01-02T00:00:00",
+        "sections": [
+            {"type": "table", "title": "Positions", "data_source": "positions"}
+        ]
+    }
+
+
+class TestColumnarExports:
+    """Test Parquet and Feather exports"""
+    
+    @pytest.mark.asyncio
+    async def test_export_parquet(self, export_service, table_report):
+        """Test that the Parquet export round-trips the report table"""
+        pytest.importorskip("pyarrow")
+        
+        data = await export_service.export_report(table_report, "parquet")
+        df = pd.read_parquet(io.BytesIO(data))
+        
+        assert list(df.columns) == ["Column 1", "Column 2", "Column 3"]
+        assert df["Column 1"].tolist() == [1, 2, 3]
+        assert df["Column 2"].tolist() == ["A", "B", "C"]
+        assert df["Column 3"].tolist() == pytest.approx([10.5, 20.3, 30.1])
+    
+    @pytest.mark.asyncio
+    async def test_export_feather(self, export_service, table_report):
+        """Test that the Feather export round-trips the report table"""
+        pytest.importorskip("pyarrow")
+        
+        data = await export_service.export_report(table_report, "feather")
+        df = pd.read_feather(io.BytesIO(data))
+        
+        assert list(df.columns) == ["Column 1", "Column 2", "Column 3"]
+        assert df["Column 1"].tolist() == [1, 2, 3]
+        assert df["Column 2"].tolist() == ["A", "B", "C"]
+    
+    @pytest.mark.asyncio
+    async def test_export_parquet_without_tables(self, export_service):
+        """Test that a report without tables exports its summary row"""
+        pytest.importorskip("pyarrow")
+        
+        content = {"title": "Empty", "type": "summary", "generated_at": "2024-01-02", "sections": []}
+        data = await export_service.export_report(content, "parquet")
+        df = pd.read_parquet(io.BytesIO(data))
+        
+        assert df.to_dict("records") == [
+            {"Report Title": "Empty", "Generated At": "2024-01-02", "Type": "summary"}
+        ]
+    
+    def test_columnar_formats_listed(self, export_service):
+        """Test that the columnar formats report their MIME types and extensions"""
+        assert export_service.get_export_info("parquet")["file_extension"] == ".parquet"
+        assert export_service.get_export_info("feather")["mime_type"] == "application/vnd.apache.arrow.file"
+
+
+class TestExcelSheetNames:
+    """Test that every Excel engine names sheets the same way"""
+    
+    @pytest.mark.parametrize("engine", ["openpyxl", "xlsxwriter", "xml"])
+    def test_untitled_and_invalid_titles(self, export_service, engine):
+        """Test that untitled, invalid and clashing titles give valid, unique sheet names"""
+        if engine == "xlsxwriter":
+            pytest.importorskip("xlsxwriter")
+        sections = [
+            {"type": "table"},
+            {"type": "table"},
+            {"type": "chart", "title": "Q1/Q2 [draft]"},
+            {"type": "metric", "title": "summary"},
+        ]
+        content = {"title": "Report", "type": "summary", "generated_at": "2024-01-02", "sections": sections}
+        
+        data = export_service._render_excel(content, sections, [None] * len(sections), engine)
+        
+        assert load_workbook(io.BytesIO(data)).sheetnames == ["Summary", "Table", "Table1", "Q1Q2 draft", "summary1"]
+
+
+class TestXlsxWriter:
+    """Test the direct OOXML workbook writer"""
+    
+    @staticmethod
+    def _round_trip(sheets):
+        """Write sheets and read them back with openpyxl"""
+        output = io.BytesIO()
+        write_workbook(output, sheets)
+        output.seek(0)
+        return load_workbook(output)
+    
+    def test_row_sheet_round_trip(self):
+        """Test that row data keeps its values, types and positions"""
+        wb = self._round_trip([
+            ("Summary", ["Name", "Value", "Flag", "Blank", "When"], [
+                ["alpha", 1, True, None, datetime(2024, 1, 2, 3, 4, 5)],
+                ["beta & <gamma>", 2.5, False, None, "text"],
+            ])
+        ])
+        
+        ws = wb["Summary"]
+        assert [list(row) for row in ws.iter_rows(values_only=True)] == [
+            ["Name", "Value", "Flag", "Blank", "When"],
+            ["alpha", 1, True, None, "2024-01-02T03:04:05"],
+            ["beta & <gamma>", 2.5, False, None, "text"],
+        ]
+    
+    def test_column_arrays_round_trip(self):
+        """Test that columnar sheets write each dtype correctly"""
+        wb = self._round_trip([
+            ("Prices", ["Day", "Close", "Volume", "Up"], ColumnArrays([
+                np.array(["d1", "d2", "d3"], dtype=object),
+                np.array([10.5, np.nan, 12.25]),
+                np.array([100, 200, 300], dtype=np.int64),
+                np.array([True, False, True]),
+            ]))
+        ])
+        
+        rows = [list(row) for row in wb["Prices"].iter_rows(values_only=True)]
+        assert rows == [
+            ["Day", "Close", "Volume", "Up"],
+            ["d1", 10.5, 100, True],
+            ["d2", None, 200, False],
+            ["d3", 12.25, 300, True],
+        ]
+    
+    def test_sheet_names_sanitized_and_unique(self):
+        """Test that invalid characters are removed and duplicate names numbered"""
+        wb = self._round_trip([
+            ("Q1/Q2 [draft]", [], []),
+            ("Data", ["a"], [[1]]),
+            ("data", ["b"], [[2]]),
+        ])
+        
+        assert wb.sheetnames == ["Q1Q2 draft", "Data", "data1"]
+        assert wb["data1"]["A2"].value == 2
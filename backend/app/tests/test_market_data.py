@@ -0,0 +1,416 @@
+"""
+Tests for Market Data Service
+
+Test suite for the market data provider plumbing: client-side rate limiting,
+response caching, circuit breaking, retries and provider racing.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services import market_data_service as mds
+from app.services.market_data_service import (
+    CircuitBreaker, CircuitOpenError, CircuitState, FinancialModelingPrepClient, MarketDataService,
+    YahooFinanceClient
+)
+from app.utils.ratelimit import AsyncTokenBucket
+
+
+def mock_transport(client, handler):
+    """Point a provider client's pooled connection at a mock transport"""
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    client._client_loop = asyncio.get_running_loop()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of waiting them out"""
+    recorded = []
+    
+    async def fake_sleep(delay, *args, **kwargs):
+        recorded.append(delay)
+    
+    monkeypatch.setattr(mds.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+class TestAsyncTokenBucket:
+    """Test the client-side token bucket"""
+    
+    @pytest.mark.asyncio
+    async def test_acquire_within_capacity_does_not_wait(self):
+        """Test that a burst up to capacity is released immediately"""
+        bucket = AsyncTokenBucket(rate=1, capacity=5)
+        
+        start = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        
+        assert time.monotonic() - start < 0.1
+    
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_refill(self):
+        """Test that a caller beyond capacity waits for the refill"""
+        bucket = AsyncTokenBucket(rate=10, capacity=1)
+        await bucket.acquire()
+        
+        start = time.monotonic()
+        await bucket.acquire()
+        
+        assert time.monotonic() - start >= 0.08
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_acquire_returns_tokens(self):
+        """Test that callers cancelled while waiting do not keep their reservation"""
+        bucket = AsyncTokenBucket(rate=1, capacity=1)
+        await bucket.acquire()
+        
+        for _ in range(10):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(bucket.acquire(), 0.05)
+        
+        # Only the ~0.5s of refill accrued during the timeouts is owed,
+        # not ten abandoned reservations
+        assert bucket.tokens > -1
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start < 1.5
+    
+    def test_invalid_parameters(self):
+        """Test that non-positive rates and capacities are rejected"""
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=0, capacity=1)
+        with pytest.raises(ValueError):
+            AsyncTokenBucket(rate=1, capacity=0)
+
+
+class TestResponseCache:
+    """Test the cached, single-flight provider lookups"""
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_fetch(self):
+        """Test that concurrent lookups of one symbol trigger a single fetch"""
+        service = MarketDataService()
+        calls = []
+        
+        async def fetch(symbol):
+            calls.append(symbol)
+            await asyncio.sleep(0.05)
+            return {"symbol": symbol, "price": 150.0}
+        
+        service._fetch_stock_quote = fetch
+        quotes = await asyncio.gather(*(service.get_stock_quote("AAPL") for _ in range(10)))
+        
+        assert calls == ["AAPL"]
+        assert all(quote == {"symbol": "AAPL", "price": 150.0} for quote in quotes)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_get_isolated_copies(self):
+        """Test that a caller joining an in-flight fetch does not share the result object"""
+        service = MarketDataService()
+        
+        async def fetch(symbol):
+            await asyncio.sleep(0.05)
+            return {"symbol": symbol, "price": 150.0}
+        
+        service._fetch_stock_quote = fetch
+        first, second = await asyncio.gather(service.get_stock_quote("AAPL"), service.get_stock_quote("AAPL"))
+        first["price"] = 0.0
+        
+        assert first is not second
+        assert second["price"] == 150.0
+    
+    @pytest.mark.asyncio
+    async def test_cached_result_skips_fetch(self):
+        """Test that a cached quote is served without fetching again"""
+        service = MarketDataService()
+        calls = []
+        
+        async def fetch(symbol):
+            calls.append(symbol)
+            return {"symbol": symbol, "price": 150.0}
+        
+        service._fetch_stock_quote = fetch
+        first = await service.get_stock_quote("AAPL")
+        first["price"] = 0.0
+        second = await service.get_stock_quote("AAPL")
+        
+        assert calls == ["AAPL"]
+        # Cached values are stored serialized, so callers never share a result
+        assert second["price"] == 150.0
+    
+    def test_quote_fan_out_on_successive_event_loops(self, monkeypatch):
+        """Test that multi-quote fan-out works when each job runs on a fresh loop"""
+        monkeypatch.setattr(mds.settings, "max_concurrent_quotes", 1)
+        service = MarketDataService()
+        service.providers = []
+        
+        async def fetch(symbol):
+            await asyncio.sleep(0.01)
+            return {"symbol": symbol, "price": 150.0}
+        
+        service._fetch_stock_quote = fetch
+        # Distinct symbols per run, so every run contends for the semaphore
+        for symbols in (["AAPL", "MSFT", "GOOGL"], ["AMZN", "META", "NVDA"]):
+            quotes = asyncio.run(service.get_multiple_quotes(symbols))
+            assert [quote["symbol"] for quote in quotes.values()] == symbols
+    
+    @pytest.mark.asyncio
+    async def test_failed_lookup_is_not_cached(self):
+        """Test that an empty result is retried on the next call"""
+        service = MarketDataService()
+        calls = []
+        
+        async def fetch(symbol):
+            calls.append(symbol)
+            return None
+        
+        service._fetch_stock_quote = fetch
+        await service.get_stock_quote("AAPL")
+        await service.get_stock_quote("AAPL")
+        
+        assert calls == ["AAPL", "AAPL"]
+
+
+class TestYahooTickerCache:
+    """Test the reuse of yfinance Ticker objects and their info"""
+    
+    @pytest.fixture
+    def info_fetches(self, monkeypatch):
+        """Replace yf.Ticker with a fake that, like yfinance, fetches .info once per object"""
+        fetches = []
+        
+        class FakeTicker:
+            def __init__(self, symbol):
+                self.symbol = symbol
+                self._info = None
+            
+            @property
+            def info(self):
+                if self._info is None:
+                    fetches.append(self.symbol)
+                    self._info = {"longName": self.symbol, "marketCap": 1000 * len(fetches)}
+                return self._info
+        
+        monkeypatch.setattr(mds.yf, "Ticker", FakeTicker)
+        return fetches
+    
+    @pytest.mark.asyncio
+    async def test_info_reused_within_ttl(self, info_fetches):
+        """Test that a second lookup inside the TTL does not fetch info again"""
+        client = YahooFinanceClient()
+        
+        first = await client.get_company_profile("AAPL")
+        second = await client.get_company_profile("AAPL")
+        
+        assert info_fetches == ["AAPL"]
+        assert second["marketCap"] == first["marketCap"]
+    
+    @pytest.mark.asyncio
+    async def test_info_refetched_after_ttl(self, info_fetches, monkeypatch):
+        """Test that a lookup after the TTL fetches fresh info rather than the Ticker's copy"""
+        client = YahooFinanceClient()
+        first = await client.get_company_profile("AAPL")
+        
+        monkeypatch.setattr(mds, "_YAHOO_INFO_TTL", 0.0)
+        second = await client.get_company_profile("AAPL")
+        
+        assert info_fetches == ["AAPL", "AAPL"]
+        assert second["marketCap"] != first["marketCap"]
+
+
+class TestConnectionPool:
+    """Test the pooled HTTP client of a provider"""
+    
+    def test_client_from_previous_loop_is_closed(self):
+        """Test that a client replaced on a new event loop is closed on its own loop"""
+        client = FinancialModelingPrepClient()
+        
+        async def get_client():
+            return client._get_client()
+        
+        old_loop = asyncio.new_event_loop()
+        try:
+            old = old_loop.run_until_complete(get_client())
+            new = asyncio.run(get_client())
+            # The close is scheduled on the loop that owns the old connections
+            old_loop.run_until_complete(asyncio.sleep(0.01))
+        finally:
+            old_loop.close()
+        
+        assert new is not old
+        assert old.is_closed
+
+
+class TestCircuitBreaker:
+    """Test the per-provider circuit breaker"""
+    
+    def test_opens_at_threshold(self):
+        """Test that the circuit opens after the configured number of failures"""
+        breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=60)
+        
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.before_call()
+        assert breaker.state is CircuitState.CLOSED
+        
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+    
+    def test_half_open_after_reset_timeout(self):
+        """Test that a trial call is let through once the cool-off has passed"""
+        breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=0.05)
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        
+        time.sleep(0.06)
+        breaker.before_call()
+        assert breaker.state is CircuitState.HALF_OPEN
+        
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.failures == 0
+    
+    def test_failed_trial_reopens(self):
+        """Test that a failure while half-open reopens the circuit immediately"""
+        breaker = CircuitBreaker("test", failure_threshold=3, reset_timeout=0.05)
+        for _ in range(3):
+            breaker.record_failure()
+        
+        time.sleep(0.06)
+        breaker.before_call()
+        breaker.record_failure()
+        
+        assert breaker.state is CircuitState.OPEN
+    
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip_breaker(self, sleeps):
+        """Test that 404s (bad symbols) are not counted as provider outages"""
+        client = FinancialModelingPrepClient()
+        mock_transport(client, lambda request: httpx.Response(404))
+        
+        for _ in range(10):
+            assert await client._request("quote", "/quote/NOPE") is None
+        
+        assert client._breaker.state is CircuitState.CLOSED
+
+
+class TestProviderRetries:
+    """Test retries of transient provider failures"""
+    
+    @pytest.mark.asyncio
+    async def test_retry_honours_retry_after(self, sleeps):
+        """Test that a throttled request waits the Retry-After delay and retries"""
+        client = FinancialModelingPrepClient()
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "1"}),
+            httpx.Response(503, headers={"Retry-After": "2"}),
+            httpx.Response(200, json=[{"symbol": "AAPL"}])
+        ])
+        mock_transport(client, lambda request: next(responses))
+        
+        data = await client._request("quote", "/quote/AAPL")
+        
+        assert data == [{"symbol": "AAPL"}]
+        assert sleeps == [1.0, 2.0]
+    
+    @pytest.mark.asyncio
+    async def test_retry_stops_after_three_attempts(self, sleeps):
+        """Test that persistent transient failures give up after three attempts"""
+        client = FinancialModelingPrepClient()
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(503)
+        
+        mock_transport(client, handler)
+        
+        assert await client._request("quote", "/quote/AAPL") is None
+        assert len(requests) == 3
+        assert len(sleeps) == 2
+    
+    @pytest.mark.asyncio
+    async def test_long_retry_after_is_not_waited(self, sleeps):
+        """Test that a Retry-After beyond the limit falls through without retrying"""
+        client = FinancialModelingPrepClient()
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(429, headers={"Retry-After": "120"})
+        
+        mock_transport(client, handler)
+        
+        assert await client._request("quote", "/quote/AAPL") is None
+        assert len(requests) == 1
+        assert sleeps == []
+
+
+class TestProviderRace:
+    """Test racing the top providers"""
+    
+    @pytest.mark.asyncio
+    async def test_race_returns_first_result(self):
+        """Test that the faster provider wins and the slower one is cancelled"""
+        service = MarketDataService()
+        cancelled = []
+        
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append("slow")
+                raise
+        
+        async def fast():
+            await asyncio.sleep(0.01)
+            return {"price": 1.0}
+        
+        result = await service._race("quote", "AAPL", [("slow", slow), ("fast", fast)], timeout=5)
+        # Let the cancellation reach the provider call inside its timeout wrapper
+        await asyncio.sleep(0.01)
+        
+        assert result == {"price": 1.0, "data_source": "fast"}
+        assert cancelled == ["slow"]
+    
+    @pytest.mark.asyncio
+    async def test_race_skips_empty_and_failed_results(self):
+        """Test that empty answers and errors do not win the race"""
+        service = MarketDataService()
+        
+        async def empty():
+            return None
+        
+        async def broken():
+            raise RuntimeError("provider down")
+        
+        async def slower():
+            await asyncio.sleep(0.05)
+            return {"price": 2.0}
+        
+        result = await service._race(
+            "quote", "AAPL", [("empty", empty), ("broken", broken), ("slower", slower)], timeout=5
+        )
+        
+        assert result == {"price": 2.0, "data_source": "slower"}
+    
+    @pytest.mark.asyncio
+    async def test_race_times_out_stalled_providers(self):
+        """Test that a race of stalled providers ends at the timeout"""
+        service = MarketDataService()
+        
+        async def stalled():
+            await asyncio.sleep(10)
+        
+        start = time.monotonic()
+        result = await service._race("quote", "AAPL", [("a", stalled), ("b", stalled)], timeout=0.05)
+        
+        assert result is None
+        assert time.monotonic() - start < 1
@@ -0,0 +1,47 @@
+"""
+Client-side rate limiting.
+
+Provides an asyncio token bucket that paces outgoing requests to an upstream
+API so bursts are smoothed out instead of being rejected with HTTP 429.
+"""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket that makes callers wait for capacity instead of failing.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    A caller that finds too few tokens reserves them anyway (the balance goes
+    negative) and sleeps until the refill has paid the reservation back, so
+    concurrent callers are released in arrival order without holding a lock.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, n: float = 1) -> None:
+        """Take n tokens, sleeping until they are available."""
+        self._refill()
+        self.tokens -= n
+        if self.tokens < 0:
+            try:
+                await asyncio.sleep(-self.tokens / self.rate)
+            except asyncio.CancelledError:
+                # The caller gave up before sending its request, so the
+                # reservation is returned rather than charged to later callers
+                self.tokens = min(self.capacity, self.tokens + n)
+                raise
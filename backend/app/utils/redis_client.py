@@ -6,7 +6,7 @@ Handles Redis connections, caching, and session management.
 
 import json
 import logging
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import redis.asyncio as redis
 from redis.asyncio import ConnectionPool, Redis
@@ -107,18 +107,24 @@ class RedisManager:
             raise RuntimeError("Redis not initialized")
         return await self.redis.get(key)
     
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get values for several keys in one round trip."""
+        if not self._initialized:
+            raise RuntimeError("Redis not initialized")
+        return await self.redis.mget(keys)
+    
     async def set(
         self, 
         key: str, 
-        value: Union[str, Dict, list], 
+        value: Union[str, bytes, Dict, list], 
         expire: Optional[int] = None
     ) -> bool:
         """Set value in Redis."""
         if not self._initialized:
             raise RuntimeError("Redis not initialized")
         
-        # Serialize non-string values
-        if not isinstance(value, str):
+        # Serialize values that are not already encoded
+        if not isinstance(value, (str, bytes)):
             value = json.dumps(value)
         
         return await self.redis.set(key, value, ex=expire)